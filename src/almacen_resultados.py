@@ -0,0 +1,347 @@
+"""
+Módulo de Almacén de Resultados
+Descripción: Historial de ejecuciones en una base SQLite de sólo agregado,
+indexada por algoritmo, escenario, tamaño, fecha, equipo y commit, con un
+importador de los resultados_*.json/.csv existentes y consultas que devuelven
+sólo la porción de resultados que se necesita
+"""
+
+import os
+import re
+import csv
+import json
+import glob
+import socket
+import sqlite3
+import subprocess
+from datetime import datetime
+
+
+# Base de datos por defecto (junto a los demás resultados)
+RUTA_ALMACEN = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            '..', 'results', 'resultados.db')
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS ejecuciones (
+    id INTEGER PRIMARY KEY,
+    marca_tiempo TEXT NOT NULL,
+    host TEXT,
+    commit_git TEXT,
+    semilla INTEGER,
+    origen TEXT UNIQUE
+);
+CREATE TABLE IF NOT EXISTS resultados (
+    id INTEGER PRIMARY KEY,
+    ejecucion_id INTEGER NOT NULL REFERENCES ejecuciones(id),
+    algoritmo TEXT NOT NULL,
+    escenario TEXT NOT NULL,
+    tamano INTEGER NOT NULL,
+    repeticiones INTEGER,
+    promedio_segundos REAL,
+    desviacion_estandar REAL,
+    promedio_ms REAL,
+    error TEXT,
+    datos TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ejecuciones_marca ON ejecuciones(marca_tiempo);
+CREATE INDEX IF NOT EXISTS idx_ejecuciones_host ON ejecuciones(host);
+CREATE INDEX IF NOT EXISTS idx_ejecuciones_commit ON ejecuciones(commit_git);
+CREATE INDEX IF NOT EXISTS idx_resultados_caso ON resultados(algoritmo, escenario, tamano);
+CREATE INDEX IF NOT EXISTS idx_resultados_ejecucion ON resultados(ejecucion_id);
+"""
+
+# Columnas numéricas de los CSV (el módulo csv las lee como texto)
+_ENTEROS_CSV = ('tamano', 'repeticiones', 'semilla', 'memoria_pico_bytes',
+                'asignaciones_netas', 'bytes_netos', 'rss_delta_bytes', 'comparaciones',
+                'movimientos', 'copias', 'particiones', 'llamadas_recursivas',
+                'profundidad_max')
+_REALES_CSV = ('promedio_segundos', 'promedio_ms', 'desviacion_estandar')
+
+
+def conectar(ruta=None):
+    """
+    Abre (y crea si hace falta) el almacén de resultados
+
+    Args:
+        ruta: Archivo SQLite (por defecto RUTA_ALMACEN)
+
+    Returns:
+        Conexión sqlite3 con el esquema creado
+    """
+    ruta = ruta or RUTA_ALMACEN
+    if ruta != ':memory:':
+        os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    conexion = sqlite3.connect(ruta)
+    conexion.row_factory = sqlite3.Row
+    conexion.executescript(ESQUEMA)
+    return conexion
+
+
+def host_actual():
+    """Nombre del equipo donde se ejecuta el experimento"""
+    return socket.gethostname()
+
+
+def commit_actual():
+    """Commit de git del código medido (None fuera de un repositorio)"""
+    try:
+        salida = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                                text=True, timeout=5,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if salida.returncode != 0:
+        return None
+    return salida.stdout.strip() or None
+
+
+def registrar_ejecucion(conexion, resultados, marca_tiempo=None, host=None,
+                        commit=None, origen=None):
+    """
+    Agrega una ejecución completa al almacén (nunca modifica las anteriores)
+
+    Args:
+        conexion: Conexión devuelta por conectar()
+        resultados: Iterable de diccionarios de resultado
+        marca_tiempo: datetime o texto 'AAAA-MM-DD HH:MM:SS' (por defecto, ahora)
+        host: Equipo (por defecto, el actual)
+        commit: Commit de git (por defecto, el actual)
+        origen: Identificador único de la ejecución (ej: ruta de su JSON);
+                si ya está registrado, no se agrega de nuevo
+
+    Returns:
+        id de la ejecución, o None si el origen ya estaba registrado
+    """
+    if origen is not None and _registrado(conexion, origen):
+        return None
+
+    marca_tiempo = marca_tiempo or datetime.now()
+    if isinstance(marca_tiempo, datetime):
+        marca_tiempo = marca_tiempo.strftime("%Y-%m-%d %H:%M:%S")
+
+    with conexion:
+        cursor = conexion.execute(
+            "INSERT INTO ejecuciones (marca_tiempo, host, commit_git, origen) "
+            "VALUES (?, ?, ?, ?)",
+            (marca_tiempo, host_actual() if host is None else host,
+             commit_actual() if commit is None else commit, origen)
+        )
+        ejecucion_id = cursor.lastrowid
+
+        semilla = None
+        filas = []
+        for r in resultados:
+            semilla = r.get('semilla', semilla)
+            filas.append((ejecucion_id, r['algoritmo'], r['escenario'], r['tamano'],
+                          r.get('repeticiones'), r.get('promedio_segundos'),
+                          r.get('desviacion_estandar'), r.get('promedio_ms'),
+                          r.get('error'), json.dumps(r, ensure_ascii=False)))
+        conexion.executemany(
+            "INSERT INTO resultados (ejecucion_id, algoritmo, escenario, tamano, "
+            "repeticiones, promedio_segundos, desviacion_estandar, promedio_ms, "
+            "error, datos) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", filas
+        )
+        conexion.execute("UPDATE ejecuciones SET semilla = ? WHERE id = ?",
+                         (semilla, ejecucion_id))
+
+    return ejecucion_id
+
+
+def _registrado(conexion, origen):
+    """Indica si una ejecución con ese origen ya está en el almacén"""
+    return conexion.execute("SELECT 1 FROM ejecuciones WHERE origen = ?",
+                            (origen,)).fetchone() is not None
+
+
+def importar_archivo(conexion, ruta):
+    """
+    Importa un resultados_*.json o resultados_*.csv de una ejecución anterior
+
+    La fecha se toma del nombre del archivo (resultados_AAAAMMDD_HHMMSS) o,
+    si no la tiene, de su fecha de modificación. El equipo y el commit de
+    esas ejecuciones no se conocen y quedan vacíos.
+
+    Returns:
+        id de la ejecución, o None si el archivo ya estaba importado
+    """
+    origen = os.path.abspath(ruta)
+    if _registrado(conexion, origen):
+        return None
+
+    if ruta.endswith('.json'):
+        with open(ruta, 'r', encoding='utf-8') as f:
+            resultados = json.load(f)
+    else:
+        with open(ruta, 'r', newline='', encoding='utf-8') as f:
+            resultados = [_convertir_fila_csv(fila) for fila in csv.DictReader(f)]
+
+    coincidencia = re.search(r'(\d{8}_\d{6})', os.path.basename(ruta))
+    if coincidencia:
+        marca_tiempo = datetime.strptime(coincidencia.group(1), "%Y%m%d_%H%M%S")
+    else:
+        marca_tiempo = datetime.fromtimestamp(os.path.getmtime(ruta))
+
+    return registrar_ejecucion(conexion, resultados, marca_tiempo, host='',
+                               commit='', origen=origen)
+
+
+def _convertir_fila_csv(fila):
+    """Convierte una fila de CSV (texto) en un resultado con tipos numéricos"""
+    resultado = {}
+    for campo, valor in fila.items():
+        if valor in ('', None):
+            continue
+        if campo in _ENTEROS_CSV:
+            valor = int(float(valor))
+        elif campo in _REALES_CSV:
+            valor = float(valor)
+        resultado[campo] = valor
+    return resultado
+
+
+def importar_directorio(conexion, directorio=None):
+    """
+    Importa todos los resultados_*.json (y los .csv sin su JSON) de una carpeta
+
+    Los archivos ya importados se omiten, así que puede llamarse siempre
+    antes de consultar.
+
+    Returns:
+        Número de ejecuciones nuevas importadas
+    """
+    directorio = directorio or os.path.dirname(RUTA_ALMACEN)
+    importadas = 0
+    for ruta in sorted(glob.glob(os.path.join(directorio, 'resultados_*.*'))):
+        base, extension = os.path.splitext(ruta)
+        if extension == '.csv' and os.path.exists(base + '.json'):
+            continue
+        if extension in ('.json', '.csv') and importar_archivo(conexion, ruta) is not None:
+            importadas += 1
+    return importadas
+
+
+def consultar(conexion, algoritmo=None, escenario=None, tamano=None, ejecucion=None,
+              host=None, commit=None, desde=None, hasta=None, incluir_errores=False):
+    """
+    Devuelve los resultados que cumplen los filtros, usando los índices
+
+    Cada filtro de algoritmo, escenario, tamaño, ejecución, equipo o commit
+    acepta un valor o una lista de valores.
+
+    Args:
+        desde, hasta: Límites de fecha (datetime o texto 'AAAA-MM-DD ...')
+        incluir_errores: Si es True, incluye los casos con error u omitidos
+
+    Returns:
+        Lista de diccionarios de resultado, con 'ejecucion_id', 'marca_tiempo',
+        'host' y 'commit_git' agregados, ordenados por fecha y caso
+    """
+    condiciones = []
+    parametros = []
+
+    for columna, valor in (('r.algoritmo', algoritmo), ('r.escenario', escenario),
+                           ('r.tamano', tamano), ('r.ejecucion_id', ejecucion),
+                           ('e.host', host), ('e.commit_git', commit)):
+        if valor is None:
+            continue
+        valores = list(valor) if isinstance(valor, (list, tuple, set)) else [valor]
+        condiciones.append(f"{columna} IN ({', '.join('?' * len(valores))})")
+        parametros.extend(valores)
+
+    for operador, limite in (('>=', desde), ('<=', hasta)):
+        if limite is not None:
+            if isinstance(limite, datetime):
+                limite = limite.strftime("%Y-%m-%d %H:%M:%S")
+            condiciones.append(f"e.marca_tiempo {operador} ?")
+            parametros.append(limite)
+
+    if not incluir_errores:
+        condiciones.append("r.error IS NULL")
+
+    consulta = ("SELECT r.datos, r.ejecucion_id, e.marca_tiempo, e.host, e.commit_git "
+                "FROM resultados r JOIN ejecuciones e ON e.id = r.ejecucion_id")
+    if condiciones:
+        consulta += " WHERE " + " AND ".join(condiciones)
+    consulta += " ORDER BY e.marca_tiempo, r.id"
+
+    resultados = []
+    for fila in conexion.execute(consulta, parametros):
+        resultado = json.loads(fila['datos'])
+        resultado.update(ejecucion_id=fila['ejecucion_id'], marca_tiempo=fila['marca_tiempo'],
+                         host=fila['host'], commit_git=fila['commit_git'])
+        resultados.append(resultado)
+    return resultados
+
+
+def tendencia(conexion, algoritmo, escenario, tamano, desde=None, host=None):
+    """
+    Evolución de un caso entre ejecuciones
+
+    Returns:
+        Lista de tuplas (marca_tiempo, promedio_ms) ordenadas por fecha
+    """
+    return [(r['marca_tiempo'], r['promedio_ms'])
+            for r in consultar(conexion, algoritmo, escenario, tamano, desde=desde, host=host)]
+
+
+def ultima_ejecucion(conexion, host=None):
+    """id de la ejecución más reciente (opcionalmente de un equipo), o None"""
+    consulta = "SELECT id FROM ejecuciones"
+    parametros = ()
+    if host is not None:
+        consulta += " WHERE host = ?"
+        parametros = (host,)
+    fila = conexion.execute(consulta + " ORDER BY marca_tiempo DESC, id DESC LIMIT 1",
+                            parametros).fetchone()
+    return fila['id'] if fila else None
+
+
+def generar_reporte_historico(conexion, resultados, ejecucion_id, limite=5):
+    """
+    Genera el texto que compara cada caso medido con sus ejecuciones anteriores
+
+    Sólo se consultan los casos del mayor tamaño medido en esta ejecución.
+
+    Args:
+        conexion: Conexión al almacén
+        resultados: Resultados de la ejecución actual
+        ejecucion_id: id de la ejecución actual en el almacén (se excluye)
+        limite: Número de ejecuciones anteriores a mostrar por caso
+
+    Returns:
+        String con el reporte (vacío si no hay historial)
+    """
+    actuales = {}
+    for r in resultados:
+        if 'error' not in r:
+            actuales[(r['algoritmo'], r['escenario'], r['tamano'])] = r['promedio_ms']
+    if not actuales:
+        return ""
+    mayor = max(tamano for _, _, tamano in actuales)
+
+    # Una sola consulta (índice por caso) para todo el tamaño mayor
+    historial = {}
+    for r in consultar(conexion, tamano=mayor):
+        if r['ejecucion_id'] != ejecucion_id and r.get('promedio_ms') is not None:
+            historial.setdefault((r['algoritmo'], r['escenario']), []).append(r['promedio_ms'])
+
+    reporte = ""
+    for (algoritmo, escenario, tamano), actual in actuales.items():
+        anteriores = historial.get((algoritmo, escenario), [])[-limite:]
+        if tamano != mayor or not anteriores:
+            continue
+        reporte += (f"   • {algoritmo} ({escenario}): {actual:.4f} ms ahora; "
+                    f"anteriores: {', '.join(f'{ms:.4f}' for ms in anteriores)} ms\n")
+
+    if not reporte:
+        return ""
+    return f"--- HISTÓRICO ({mayor:,} elementos, ejecuciones anteriores) ---\n\n" + reporte + "\n"
+
+
+# Prueba del módulo
+if __name__ == "__main__":
+    conexion = conectar()
+    nuevas = importar_directorio(conexion)
+    print(f"Ejecuciones importadas: {nuevas}")
+    for marca, ms in tendencia(conexion, 'QuickSort', 'invertida', 10000):
+        print(f"  {marca}: {ms:.4f} ms")
@@ -0,0 +1,189 @@
+"""
+Módulo de Caché de Conjuntos de Datos
+Descripción: Guarda en disco los conjuntos de prueba generados con semilla,
+direccionados por contenido, y los vuelve a cargar mediante mmap. La caché se
+limita por tamaño total desalojando los conjuntos menos usados (LRU).
+"""
+
+import os
+import json
+import mmap
+import time
+import hashlib
+from array import array
+from contextlib import contextmanager
+from data_generator import (
+    VERSION_GENERADOR, generar_conjunto, generar_arreglo_numpy, convertir_a_buffer
+)
+
+
+# Carpeta por defecto de la caché (fuera de src/ y de results/)
+DIRECTORIO_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '.cache', 'conjuntos')
+
+# Presupuesto por defecto de la caché en MB
+PRESUPUESTO_MB = 1024
+
+# Archivo índice: clave -> {archivo, sha256, tipo, bytes, ultimo_uso}
+ARCHIVO_INDICE = 'indice.json'
+
+
+def clave_cache(escenario, tamano, semilla, version=VERSION_GENERADOR):
+    """Clave estable de un conjunto: hash de (escenario, tamaño, semilla, versión)"""
+    texto = f"{escenario}|{tamano}|{semilla}|{version}"
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+def cargar_o_generar(escenario, tamano, semilla, directorio=None, presupuesto_mb=None,
+                     vectorizado=False, como_buffer=False):
+    """
+    Devuelve el conjunto desde la caché, o lo genera y lo guarda si no existe
+
+    Args:
+        escenario: Nombre del escenario
+        tamano: Cantidad de elementos
+        semilla: Semilla base del generador
+        directorio: Carpeta de la caché (por defecto DIRECTORIO_CACHE)
+        presupuesto_mb: Tamaño máximo de la caché (por defecto PRESUPUESTO_MB)
+        vectorizado: Si es True, los conjuntos faltantes se generan con NumPy
+        como_buffer: Si es True, devuelve un array.array copiado del archivo
+                     mapeado, sin crear un objeto Python por elemento (para
+                     el modo in-place)
+
+    Returns:
+        Lista (o array.array si como_buffer) con el conjunto de datos
+    """
+    directorio = directorio or DIRECTORIO_CACHE
+    presupuesto_mb = PRESUPUESTO_MB if presupuesto_mb is None else presupuesto_mb
+    os.makedirs(directorio, exist_ok=True)
+
+    indice = _leer_indice(directorio)
+    # Los generadores de NumPy producen otra secuencia: otra versión de clave
+    version = f"{VERSION_GENERADOR}-numpy" if vectorizado else VERSION_GENERADOR
+    clave = clave_cache(escenario, tamano, semilla, version)
+    entrada = indice.get(clave)
+
+    if entrada and os.path.exists(os.path.join(directorio, entrada['archivo'])):
+        # El mapa se cierra en cuanto los datos se copian fuera de él
+        with abrir_conjunto(os.path.join(directorio, entrada['archivo']),
+                            entrada['tipo']) as vista:
+            datos = array(entrada['tipo'], vista) if como_buffer else vista.tolist()
+    else:
+        if vectorizado:
+            datos = generar_arreglo_numpy(escenario, tamano, semilla).tolist()
+        else:
+            datos = generar_conjunto(escenario, tamano, semilla)
+        buffer = convertir_a_buffer(datos)
+        entrada = _guardar_conjunto(directorio, buffer)
+        if como_buffer:
+            datos = buffer
+
+    entrada['ultimo_uso'] = time.time()
+    indice[clave] = entrada
+
+    _desalojar(indice, directorio, presupuesto_mb * 2**20, conservar=clave)
+    _escribir_indice(directorio, indice)
+
+    return datos
+
+
+@contextmanager
+def abrir_conjunto(ruta, tipo='q'):
+    """
+    Abre un conjunto de la caché sin copiarlo a memoria
+
+    La vista sólo es válida dentro del bloque with: al salir se libera y se
+    cierra el mapa del archivo.
+
+    Args:
+        ruta: Archivo binario del conjunto
+        tipo: Código de tipo de array.array con que se guardó
+
+    Yields:
+        memoryview de sólo lectura sobre el archivo mapeado
+    """
+    if os.path.getsize(ruta) == 0:
+        yield memoryview(array(tipo))
+        return
+
+    with open(ruta, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        with memoryview(mapa) as bytes_mapa, bytes_mapa.cast(tipo) as vista:
+            yield vista
+
+
+def _guardar_conjunto(directorio, buffer):
+    """Escribe el conjunto (array.array) con nombre igual al hash de su contenido"""
+    contenido = bytes(buffer)
+    huella = hashlib.sha256(contenido).hexdigest()
+    archivo = f"{huella}.bin"
+
+    ruta = os.path.join(directorio, archivo)
+    temporal = ruta + '.tmp'
+    with open(temporal, 'wb') as f:
+        f.write(contenido)
+    os.replace(temporal, ruta)
+
+    return {
+        'archivo': archivo,
+        'sha256': huella,
+        'tipo': buffer.typecode,
+        'bytes': len(contenido),
+    }
+
+
+def _desalojar(indice, directorio, presupuesto_bytes, conservar=None):
+    """Elimina los conjuntos menos usados hasta quedar dentro del presupuesto"""
+    total = sum(e['bytes'] for e in indice.values())
+    por_antiguedad = sorted(indice.items(), key=lambda par: par[1].get('ultimo_uso', 0))
+
+    for clave, entrada in por_antiguedad:
+        if total <= presupuesto_bytes:
+            break
+        if clave == conservar:
+            continue
+
+        del indice[clave]
+        total -= entrada['bytes']
+
+        # Varias claves pueden compartir archivo si su contenido coincide
+        if not any(e['archivo'] == entrada['archivo'] for e in indice.values()):
+            try:
+                os.remove(os.path.join(directorio, entrada['archivo']))
+            except FileNotFoundError:
+                pass
+
+
+def _leer_indice(directorio):
+    """Lee el índice de la caché (vacío si no existe o está dañado)"""
+    try:
+        with open(os.path.join(directorio, ARCHIVO_INDICE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _escribir_indice(directorio, indice):
+    """Escribe el índice de forma atómica"""
+    ruta = os.path.join(directorio, ARCHIVO_INDICE)
+    temporal = ruta + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(indice, f, indent=2)
+    os.replace(temporal, ruta)
+
+
+# Prueba del módulo
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        inicio = time.perf_counter()
+        primera = cargar_o_generar('aleatoria', 200_000, semilla=42, directorio=carpeta)
+        generar_ms = (time.perf_counter() - inicio) * 1000
+
+        inicio = time.perf_counter()
+        segunda = cargar_o_generar('aleatoria', 200_000, semilla=42, directorio=carpeta)
+        cargar_ms = (time.perf_counter() - inicio) * 1000
+
+        print(f"Generar y guardar: {generar_ms:.1f} ms")
+        print(f"Cargar desde caché: {cargar_ms:.1f} ms")
+        print("Contenido idéntico:", primera == segunda)
@@ -0,0 +1,203 @@
+"""
+Módulo de Análisis de Complejidad Empírica
+Descripción: Ajusta modelos de crecimiento (n, n log n, n², n^k) a los tiempos
+medidos, reporta el exponente empírico con su bondad de ajuste y predice el
+tiempo en tamaños mayores para omitir casos inviables
+"""
+
+import math
+
+
+# Modelos candidatos: nombre -> f(n). El modelo n^k se ajusta aparte
+MODELOS = {
+    'O(n)': lambda n: n,
+    'O(n log n)': lambda n: n * math.log2(n),
+    'O(n²)': lambda n: n * n,
+}
+
+
+def ajustar_loglog(tamanos, tiempos):
+    """
+    Regresión lineal de log(t) contra log(n): t ≈ c · n^k
+
+    Args:
+        tamanos: Lista de tamaños (n > 1)
+        tiempos: Lista de tiempos en segundos (> 0), en el mismo orden
+
+    Returns:
+        Diccionario con 'exponente' (k), 'constante' (c) y 'r2' del ajuste
+    """
+    xs = [math.log(n) for n in tamanos]
+    ys = [math.log(t) for t in tiempos]
+    media_x = sum(xs) / len(xs)
+    media_y = sum(ys) / len(ys)
+
+    sxx = sum((x - media_x) ** 2 for x in xs)
+    sxy = sum((x - media_x) * (y - media_y) for x, y in zip(xs, ys))
+
+    exponente = sxy / sxx if sxx else 0.0
+    intercepto = media_y - exponente * media_x
+    predichos = [intercepto + exponente * x for x in xs]
+
+    return {
+        'exponente': exponente,
+        'constante': math.exp(intercepto),
+        'r2': _r2(ys, predichos),
+    }
+
+
+def ajustar_modelos(tamanos, tiempos):
+    """
+    Ajusta cada modelo candidato t ≈ c · f(n) y los ordena por bondad de ajuste
+
+    La constante c se estima en escala logarítmica (media geométrica de
+    t / f(n)), de modo que todos los tamaños pesan por igual aunque sus
+    tiempos difieran en órdenes de magnitud.
+
+    Returns:
+        Lista de diccionarios {'modelo', 'constante', 'r2', 'exponente'}
+        ordenada del mejor al peor R² (en escala log)
+    """
+    ys = [math.log(t) for t in tiempos]
+    ajustes = []
+
+    for nombre, f in MODELOS.items():
+        log_c = sum(y - math.log(f(n)) for n, y in zip(tamanos, ys)) / len(ys)
+        predichos = [log_c + math.log(f(n)) for n in tamanos]
+        ajustes.append({
+            'modelo': nombre,
+            'constante': math.exp(log_c),
+            'r2': _r2(ys, predichos),
+            'exponente': None,
+        })
+
+    libre = ajustar_loglog(tamanos, tiempos)
+    ajustes.append({
+        'modelo': f"O(n^{libre['exponente']:.2f})",
+        'constante': libre['constante'],
+        'r2': libre['r2'],
+        'exponente': libre['exponente'],
+    })
+
+    return sorted(ajustes, key=lambda a: a['r2'], reverse=True)
+
+
+def _r2(observados, predichos):
+    """Coeficiente de determinación R²"""
+    media = sum(observados) / len(observados)
+    total = sum((y - media) ** 2 for y in observados)
+    residual = sum((y - p) ** 2 for y, p in zip(observados, predichos))
+    return 1 - residual / total if total else 1.0
+
+
+def predecir_tiempo(ajuste, tamano):
+    """
+    Predice el tiempo en segundos para un tamaño con un ajuste
+
+    Args:
+        ajuste: Diccionario de ajustar_loglog o de ajustar_modelos
+        tamano: Tamaño a predecir
+
+    Returns:
+        Tiempo estimado en segundos
+    """
+    if ajuste.get('exponente') is not None:
+        return ajuste['constante'] * tamano ** ajuste['exponente']
+    return ajuste['constante'] * MODELOS[ajuste['modelo']](tamano)
+
+
+def agrupar_series(resultados):
+    """
+    Agrupa los resultados válidos en series (algoritmo, escenario) -> [(n, t)]
+
+    Returns:
+        Diccionario con listas de (tamano, promedio_segundos) ordenadas por tamaño
+    """
+    series = {}
+    for r in resultados:
+        if 'error' in r or r['tamano'] <= 1 or r['promedio_segundos'] <= 0:
+            continue
+        series.setdefault((r['algoritmo'], r['escenario']), []).append(
+            (r['tamano'], r['promedio_segundos'])
+        )
+    return {clave: sorted(puntos) for clave, puntos in series.items()}
+
+
+def analizar_complejidad(resultados):
+    """
+    Ajusta los modelos a cada serie (algoritmo, escenario) con 2+ tamaños
+
+    Returns:
+        Diccionario (algoritmo, escenario) -> {'loglog', 'modelos', 'mejor'}
+    """
+    analisis = {}
+    for clave, puntos in agrupar_series(resultados).items():
+        tamanos = [n for n, _ in puntos]
+        if len(set(tamanos)) < 2:
+            continue
+        tiempos = [t for _, t in puntos]
+        modelos = ajustar_modelos(tamanos, tiempos)
+        # n^k siempre ajusta al menos igual (tiene un parámetro libre más):
+        # el mejor modelo se elige entre las clases teóricas
+        teoricos = [m for m in modelos if m['exponente'] is None]
+        analisis[clave] = {
+            'loglog': ajustar_loglog(tamanos, tiempos),
+            'modelos': modelos,
+            'mejor': teoricos[0],
+        }
+    return analisis
+
+
+def predecir_desde_resultados(resultados, algoritmo, escenario, tamano):
+    """
+    Predice el tiempo de un caso a partir de los tamaños ya medidos
+
+    Returns:
+        Tiempo estimado en segundos, o None si hay menos de dos tamaños medidos
+    """
+    puntos = agrupar_series(resultados).get((algoritmo, escenario), [])
+    if len({n for n, _ in puntos}) < 2:
+        return None
+    return predecir_tiempo(ajustar_loglog([n for n, _ in puntos],
+                                          [t for _, t in puntos]), tamano)
+
+
+def generar_reporte_complejidad(resultados, tamanos_prediccion=(100_000, 1_000_000)):
+    """
+    Genera el texto con los exponentes ajustados y las predicciones
+
+    Args:
+        resultados: Lista de resultados de las pruebas
+        tamanos_prediccion: Tamaños para los que se extrapola el tiempo
+
+    Returns:
+        String con el reporte
+    """
+    analisis = analizar_complejidad(resultados)
+
+    reporte = "--- COMPLEJIDAD EMPÍRICA (ajuste log-log) ---\n\n"
+    if not analisis:
+        return reporte + "   • Se necesitan al menos dos tamaños por serie para ajustar\n\n"
+
+    for (algoritmo, escenario), datos in sorted(analisis.items()):
+        loglog = datos['loglog']
+        mejor = datos['mejor']
+        reporte += f"{algoritmo} ({escenario}):\n"
+        reporte += (f"  • Exponente empírico: n^{loglog['exponente']:.2f} "
+                    f"(R² = {loglog['r2']:.4f})\n")
+        reporte += f"  • Clase teórica más cercana: {mejor['modelo']} (R² = {mejor['r2']:.4f})\n"
+        for n in tamanos_prediccion:
+            reporte += (f"  • Predicción para {n:,} elementos: "
+                        f"{_formatear_segundos(predecir_tiempo(loglog, n))}\n")
+        reporte += "\n"
+
+    return reporte
+
+
+def _formatear_segundos(segundos):
+    """Formatea un tiempo en la unidad más legible"""
+    if segundos < 1:
+        return f"{segundos * 1000:.2f} ms"
+    if segundos < 3600:
+        return f"{segundos:.2f} s"
+    return f"{segundos / 3600:.2f} h"
@@ -0,0 +1,287 @@
+"""
+Módulo de Contadores de Operaciones
+Descripción: Cuenta comparaciones, movimientos, copias, particiones y
+profundidad máxima de recursión de los algoritmos de sorting_algorithms.
+
+La instrumentación no modifica el código de los algoritmos: los elementos se
+envuelven en objetos que cuentan sus comparaciones, el arreglo de trabajo en
+una lista que cuenta sus escrituras, y las funciones recursivas y de
+partición del módulo se sustituyen temporalmente por envoltorios que llevan
+la cuenta. Las funciones que particionan en línea (quicksort,
+_quicksort_inplace) se sustituyen por copias que cuentan cada partición y
+cada movimiento. Fuera de contar_operaciones se ejecuta el código original
+sin ningún costo adicional.
+"""
+
+import functools
+from contextlib import contextmanager
+import sorting_algorithms
+
+
+# Funciones recursivas de sorting_algorithms cuya profundidad se mide
+FUNCIONES_RECURSIVAS = ('quicksort', '_introsort', '_quicksort_inplace')
+
+# Funciones de partición de sorting_algorithms que se cuentan
+FUNCIONES_PARTICION = ('_particionar',)
+
+# Funciones de mezcla de sorting_algorithms cuyas escrituras se cuentan
+FUNCIONES_MEZCLA = ('_mezclar',)
+
+# Contador activo (sólo existe dentro de contar_operaciones)
+_contador = None
+
+
+class _Elemento:
+    """Envoltorio de un valor que cuenta cada comparación que participa"""
+
+    __slots__ = ('valor',)
+
+    def __init__(self, valor):
+        self.valor = valor
+
+    def __lt__(self, otro):
+        _contador['comparaciones'] += 1
+        return self.valor < _valor(otro)
+
+    def __gt__(self, otro):
+        _contador['comparaciones'] += 1
+        return self.valor > _valor(otro)
+
+    def __le__(self, otro):
+        _contador['comparaciones'] += 1
+        return self.valor <= _valor(otro)
+
+    def __ge__(self, otro):
+        _contador['comparaciones'] += 1
+        return self.valor >= _valor(otro)
+
+    def __eq__(self, otro):
+        _contador['comparaciones'] += 1
+        return self.valor == _valor(otro)
+
+    def __hash__(self):
+        return hash(self.valor)
+
+    # Aritmética usada por Counting Sort y Radix Sort (no son comparaciones)
+    def __sub__(self, otro):
+        return self.valor - _valor(otro)
+
+    def __rsub__(self, otro):
+        return _valor(otro) - self.valor
+
+    def __add__(self, otro):
+        return self.valor + _valor(otro)
+
+    __radd__ = __add__
+
+    def __repr__(self):
+        return repr(self.valor)
+
+
+def _valor(x):
+    """Desenvuelve un _Elemento (o devuelve x tal cual)"""
+    return x.valor if isinstance(x, _Elemento) else x
+
+
+class _ListaContada(list):
+    """Lista que cuenta las escrituras de elementos y las copias completas"""
+
+    def __setitem__(self, indice, valor):
+        if isinstance(indice, slice):
+            valor = list(valor)
+            _contador['movimientos'] += len(valor)
+        else:
+            _contador['movimientos'] += 1
+        super().__setitem__(indice, valor)
+
+    def copy(self):
+        _contador['copias'] += len(self)
+        return _ListaContada(self)
+
+
+def _envolver_recursiva(funcion, nombre):
+    """Envoltorio que mide la profundidad de recursión"""
+    @functools.wraps(funcion)
+    def envoltorio(*args):
+        _contador['llamadas_recursivas'] += 1
+        _contador['_profundidad'] += 1
+        _contador['profundidad_max'] = max(_contador['profundidad_max'],
+                                           _contador['_profundidad'])
+        try:
+            return funcion(*args)
+        finally:
+            _contador['_profundidad'] -= 1
+    return envoltorio
+
+
+def _envolver_particion(funcion):
+    """Envoltorio que cuenta las llamadas a una función de partición"""
+    @functools.wraps(funcion)
+    def envoltorio(*args):
+        _contador['particiones'] += 1
+        return funcion(*args)
+    return envoltorio
+
+
+def _envolver_mezcla(funcion):
+    """Envoltorio que cuenta las escrituras de una mezcla en un arreglo auxiliar"""
+    @functools.wraps(funcion)
+    def envoltorio(origen, destino, inicio, medio, fin):
+        # Las escrituras en una _ListaContada ya se cuentan en __setitem__
+        if not isinstance(destino, _ListaContada):
+            _contador['movimientos'] += fin - inicio
+        return funcion(origen, destino, inicio, medio, fin)
+    return envoltorio
+
+
+def _quicksort_contado(lista, key=None, reverse=False):
+    """
+    Copia de sorting_algorithms.quicksort que cuenta particiones y movimientos
+
+    Cada elemento se escribe una vez al repartirlo en su sublista, y las
+    concatenaciones copian menores + iguales y luego la lista completa.
+    """
+    if key is not None or reverse:
+        return sorting_algorithms.ordenar_con_clave(lista, sorting_algorithms.quicksort,
+                                                    key, reverse)
+
+    if len(lista) <= 1:
+        _contador['movimientos'] += len(lista)
+        return list(lista)
+
+    pivote = lista[len(lista) // 2]
+
+    _contador['particiones'] += 1
+    menores = [x for x in lista if x < pivote]
+    iguales = [x for x in lista if x == pivote]
+    mayores = [x for x in lista if x > pivote]
+    _contador['movimientos'] += len(lista)
+
+    # Las llamadas pasan por el módulo para que su envoltorio mida la profundidad
+    izquierda = sorting_algorithms.quicksort(menores)
+    derecha = sorting_algorithms.quicksort(mayores)
+    _contador['movimientos'] += len(izquierda) + len(iguales) + len(lista)
+    return izquierda + iguales + derecha
+
+
+def _quicksort_inplace_contado(arr, inicio, fin):
+    """Copia de sorting_algorithms._quicksort_inplace que cuenta cada partición"""
+    while fin - inicio > 1:
+        _contador['particiones'] += 1
+        pivote = arr[inicio + (fin - inicio) // 2]
+
+        lt = inicio
+        i = inicio
+        gt = fin - 1
+        while i <= gt:
+            valor = arr[i]
+            if valor < pivote:
+                arr[lt], arr[i] = valor, arr[lt]
+                lt += 1
+                i += 1
+            elif valor > pivote:
+                arr[i], arr[gt] = arr[gt], valor
+                gt -= 1
+            else:
+                i += 1
+
+        if lt - inicio < fin - gt - 1:
+            sorting_algorithms._quicksort_inplace(arr, inicio, lt)
+            inicio = gt + 1
+        else:
+            sorting_algorithms._quicksort_inplace(arr, gt + 1, fin)
+            fin = lt
+
+
+# Funciones que particionan en línea: nombre -> copia que cuenta
+SUSTITUTOS = {
+    'quicksort': _quicksort_contado,
+    '_quicksort_inplace': _quicksort_inplace_contado,
+}
+
+
+@contextmanager
+def _instrumentado():
+    """Sustituye temporalmente las funciones del módulo por sus envoltorios"""
+    originales = {}
+    try:
+        for nombre in FUNCIONES_RECURSIVAS:
+            originales[nombre] = getattr(sorting_algorithms, nombre)
+            envoltorio = _envolver_recursiva(SUSTITUTOS.get(nombre, originales[nombre]),
+                                             nombre)
+            # contar_operaciones reconoce el envoltorio por la función original
+            envoltorio.__wrapped__ = originales[nombre]
+            setattr(sorting_algorithms, nombre, envoltorio)
+        for nombre in FUNCIONES_PARTICION:
+            originales[nombre] = getattr(sorting_algorithms, nombre)
+            setattr(sorting_algorithms, nombre, _envolver_particion(originales[nombre]))
+        for nombre in FUNCIONES_MEZCLA:
+            originales[nombre] = getattr(sorting_algorithms, nombre)
+            setattr(sorting_algorithms, nombre, _envolver_mezcla(originales[nombre]))
+        yield
+    finally:
+        for nombre, funcion in originales.items():
+            setattr(sorting_algorithms, nombre, funcion)
+
+
+def contar_operaciones(algoritmo, datos):
+    """
+    Ejecuta el algoritmo una vez contando sus operaciones
+
+    La ejecución es mucho más lenta que la normal y no debe cronometrarse.
+
+    Args:
+        algoritmo: Función de sorting_algorithms (normal o in-place)
+        datos: Lista o buffer con los datos a ordenar
+
+    Returns:
+        Diccionario con 'comparaciones' (entre elementos), 'movimientos'
+        (escrituras en el arreglo de trabajo; en quicksort, escrituras en
+        las sublistas y en sus concatenaciones), 'copias' (elementos
+        copiados por .copy()), 'particiones', 'llamadas_recursivas' y
+        'profundidad_max'
+    """
+    global _contador
+
+    if _contador is not None:
+        raise RuntimeError("contar_operaciones no es reentrante")
+
+    _contador = {
+        'comparaciones': 0,
+        'movimientos': 0,
+        'copias': 0,
+        'particiones': 0,
+        'llamadas_recursivas': 0,
+        'profundidad_max': 0,
+        '_profundidad': 0,
+    }
+    try:
+        entrada = _ListaContada(_Elemento(x) for x in datos)
+        with _instrumentado():
+            # Si el propio algoritmo es recursivo, la llamada inicial también
+            # debe pasar por su envoltorio
+            envuelto = getattr(sorting_algorithms, algoritmo.__name__, None)
+            if getattr(envuelto, '__wrapped__', None) is algoritmo:
+                algoritmo = envuelto
+            algoritmo(entrada)
+        return {clave: valor for clave, valor in _contador.items()
+                if not clave.startswith('_')}
+    finally:
+        _contador = None
+
+
+# Prueba del módulo
+if __name__ == "__main__":
+    import math
+    from sorting_algorithms import bubble_sort, quicksort, introsort
+    from data_generator import generar_lista_aleatoria, generar_lista_invertida
+
+    n = 2000
+    for nombre_datos, datos in [('aleatoria', generar_lista_aleatoria(n)),
+                                ('invertida', generar_lista_invertida(n))]:
+        print(f"\n{nombre_datos} (n={n}, n·log2(n) = {n * math.log2(n):,.0f}):")
+        for algoritmo in (bubble_sort, quicksort, introsort):
+            c = contar_operaciones(algoritmo, datos)
+            print(f"  {algoritmo.__name__:<12} comparaciones={c['comparaciones']:>10,} "
+                  f"movimientos={c['movimientos']:>10,} particiones={c['particiones']:>6,} "
+                  f"profundidad={c['profundidad_max']}")
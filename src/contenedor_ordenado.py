@@ -0,0 +1,293 @@
+"""
+Módulo de Contenedor Ordenado
+Descripción: Lista que se mantiene ordenada al recibir datos en flujo (lecturas
+de sensores que llegan por lotes). Guarda los elementos en sublistas ordenadas
+de tamaño acotado, al estilo de un árbol B+ de listas, con un índice posicional
+(árbol de Fenwick sobre las longitudes) para rank y select en O(log n)
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+
+# Tamaño objetivo de cada sublista; se divide al superar el doble
+CARGA = 1000
+
+
+class ListaOrdenada:
+    """
+    Secuencia ordenada con inserción y borrado en O(log n) amortizado
+
+    Las sublistas se localizan por búsqueda binaria sobre sus máximos y el
+    elemento dentro de la sublista con bisect; insertar o borrar mueve a lo
+    sumo 2·CARGA referencias.
+
+    Ejemplo:
+        lecturas = ListaOrdenada()
+        lecturas.actualizar([21.5, 19.0, 23.2])
+        lecturas.agregar(20.1)
+        lecturas[len(lecturas) // 2]          # mediana (select)
+        lecturas.posicion(21.0)               # cuántas lecturas < 21.0 (rank)
+        list(lecturas.rango_valores(20, 22))  # consulta por rango
+    """
+
+    def __init__(self, iterable=None, carga=CARGA):
+        """
+        Args:
+            iterable: Elementos iniciales (en cualquier orden)
+            carga: Tamaño objetivo de las sublistas
+        """
+        self._carga = carga
+        self._listas = []
+        self._maximos = []
+        self._longitud = 0
+        # Árbol de Fenwick sobre len(self._listas[i]); None = debe reconstruirse
+        self._indice = None
+        if iterable is not None:
+            self.actualizar(iterable)
+
+    def __len__(self):
+        return self._longitud
+
+    def __iter__(self):
+        for sublista in self._listas:
+            yield from sublista
+
+    def __reversed__(self):
+        for sublista in reversed(self._listas):
+            yield from reversed(sublista)
+
+    def __contains__(self, valor):
+        i = bisect_left(self._maximos, valor)
+        if i == len(self._maximos):
+            return False
+        sublista = self._listas[i]
+        j = bisect_left(sublista, valor)
+        return sublista[j] == valor
+
+    def __getitem__(self, posicion):
+        """Select: el elemento en la posición dada del orden (admite negativos)"""
+        if posicion < 0:
+            posicion += self._longitud
+        if not 0 <= posicion < self._longitud:
+            raise IndexError("posición fuera de rango")
+        i, j = self._ubicar(posicion)
+        return self._listas[i][j]
+
+    def __repr__(self):
+        return f"ListaOrdenada({list(self)!r})"
+
+    def agregar(self, valor):
+        """Inserta un elemento en su posición"""
+        if not self._maximos:
+            self._listas.append([valor])
+            self._maximos.append(valor)
+            self._longitud = 1
+            self._indice = None
+            return
+
+        i = bisect_right(self._maximos, valor)
+        if i == len(self._maximos):
+            # Mayor que todos: va al final de la última sublista
+            i -= 1
+            self._listas[i].append(valor)
+            self._maximos[i] = valor
+        else:
+            insort(self._listas[i], valor)
+
+        self._longitud += 1
+        self._sumar_indice(i, 1)
+        self._dividir_si_excede(i)
+
+    def actualizar(self, valores):
+        """
+        Inserción masiva de elementos en cualquier orden
+
+        El lote se ordena y se fusiona con fusionar_ordenado.
+        """
+        self.fusionar_ordenado(sorted(valores))
+
+    def fusionar_ordenado(self, lote):
+        """
+        Fusiona un lote ya ordenado en O(len(lote) + sublistas afectadas)
+
+        El lote se reparte por los máximos de las sublistas y cada tramo se
+        mezcla con su sublista (list.sort sobre dos corridas ordenadas es una
+        mezcla lineal); las que crecen de más se dividen. Un lote más chico
+        que la cantidad de sublistas se inserta elemento por elemento, para
+        no recorrer sublistas que no cambian.
+
+        Args:
+            lote: Secuencia ordenada en forma ascendente
+        """
+        if not lote:
+            return
+        if not self._listas:
+            self._listas = [list(lote[i:i + self._carga])
+                            for i in range(0, len(lote), self._carga)]
+            self._maximos = [sublista[-1] for sublista in self._listas]
+            self._longitud = len(lote)
+            self._indice = None
+            return
+
+        if len(lote) < len(self._listas):
+            for valor in lote:
+                self.agregar(valor)
+            return
+
+        listas = []
+        inicio = 0
+        ultima = len(self._listas) - 1
+        for i, sublista in enumerate(self._listas):
+            # La última sublista recibe también lo que supera a todos los máximos
+            fin = len(lote) if i == ultima else bisect_right(lote, self._maximos[i], inicio)
+            if fin > inicio:
+                sublista = sublista + lote[inicio:fin]
+                sublista.sort()
+                inicio = fin
+            # Dividir las sublistas que crecieron de más
+            if len(sublista) > 2 * self._carga:
+                listas.extend(sublista[j:j + self._carga]
+                              for j in range(0, len(sublista), self._carga))
+            else:
+                listas.append(sublista)
+
+        self._listas = listas
+        self._maximos = [sublista[-1] for sublista in listas]
+        self._longitud += len(lote)
+        self._indice = None
+
+    def eliminar(self, valor):
+        """
+        Elimina una ocurrencia del elemento
+
+        Raises:
+            ValueError: Si el elemento no está
+        """
+        if not self.descartar(valor):
+            raise ValueError(f"{valor!r} no está en la lista")
+
+    def descartar(self, valor):
+        """
+        Elimina una ocurrencia del elemento si está
+
+        Returns:
+            True si se eliminó, False si no estaba
+        """
+        i = bisect_left(self._maximos, valor)
+        if i == len(self._maximos):
+            return False
+        sublista = self._listas[i]
+        j = bisect_left(sublista, valor)
+        if sublista[j] != valor:
+            return False
+
+        del sublista[j]
+        self._longitud -= 1
+        if not sublista:
+            del self._listas[i]
+            del self._maximos[i]
+            self._indice = None
+        else:
+            self._maximos[i] = sublista[-1]
+            self._sumar_indice(i, -1)
+        return True
+
+    def posicion(self, valor):
+        """Rank: cantidad de elementos estrictamente menores que valor"""
+        i = bisect_left(self._maximos, valor)
+        if i == len(self._maximos):
+            return self._longitud
+        return self._prefijo(i) + bisect_left(self._listas[i], valor)
+
+    def contar_rango(self, minimo, maximo):
+        """Cantidad de elementos en [minimo, maximo]"""
+        return max(0, self._posicion_derecha(maximo) - self.posicion(minimo))
+
+    def rango_valores(self, minimo=None, maximo=None):
+        """
+        Itera en orden los elementos de [minimo, maximo]
+
+        Args:
+            minimo: Límite inferior inclusivo (None = sin límite)
+            maximo: Límite superior inclusivo (None = sin límite)
+        """
+        inicio = 0 if minimo is None else self.posicion(minimo)
+        fin = self._longitud if maximo is None else self._posicion_derecha(maximo)
+        yield from self.rebanada(inicio, fin)
+
+    def rebanada(self, inicio, fin):
+        """Itera los elementos de las posiciones [inicio, fin) del orden"""
+        inicio, fin = max(inicio, 0), min(fin, self._longitud)
+        if inicio >= fin:
+            return
+        i, j = self._ubicar(inicio)
+        restantes = fin - inicio
+        while restantes > 0:
+            trozo = self._listas[i][j:j + restantes]
+            yield from trozo
+            restantes -= len(trozo)
+            i, j = i + 1, 0
+
+    def _posicion_derecha(self, valor):
+        """Cantidad de elementos menores o iguales que valor"""
+        i = bisect_right(self._maximos, valor)
+        if i == len(self._maximos):
+            return self._longitud
+        return self._prefijo(i) + bisect_right(self._listas[i], valor)
+
+    def _dividir_si_excede(self, i):
+        """Divide la sublista i en dos si supera el doble de la carga"""
+        sublista = self._listas[i]
+        if len(sublista) <= 2 * self._carga:
+            return
+        mitad = sublista[self._carga:]
+        del sublista[self._carga:]
+        self._listas.insert(i + 1, mitad)
+        self._maximos[i] = sublista[-1]
+        self._maximos.insert(i + 1, mitad[-1])
+        self._indice = None
+
+    # --- Índice posicional (árbol de Fenwick) ---
+
+    def _construir_indice(self):
+        """Construye el árbol de Fenwick sobre las longitudes en O(sublistas)"""
+        arbol = [0] + [len(sublista) for sublista in self._listas]
+        for i in range(1, len(arbol)):
+            padre = i + (i & -i)
+            if padre < len(arbol):
+                arbol[padre] += arbol[i]
+        self._indice = arbol
+
+    def _sumar_indice(self, i, delta):
+        """Suma delta a la longitud de la sublista i en el índice, si existe"""
+        if self._indice is None:
+            return
+        i += 1
+        while i < len(self._indice):
+            self._indice[i] += delta
+            i += i & -i
+
+    def _prefijo(self, i):
+        """Cantidad de elementos en las sublistas anteriores a la i"""
+        if self._indice is None:
+            self._construir_indice()
+        total = 0
+        while i > 0:
+            total += self._indice[i]
+            i -= i & -i
+        return total
+
+    def _ubicar(self, posicion):
+        """Convierte una posición global en (sublista, posición dentro de ella)"""
+        if self._indice is None:
+            self._construir_indice()
+        # Descenso por el árbol: mayor i con prefijo(i) <= posicion
+        i = 0
+        paso = 1 << (len(self._indice) - 1).bit_length()
+        while paso:
+            siguiente = i + paso
+            if siguiente < len(self._indice) and self._indice[siguiente] <= posicion:
+                i = siguiente
+                posicion -= self._indice[siguiente]
+            paso >>= 1
+        return i, posicion
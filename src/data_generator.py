@@ -4,27 +4,36 @@ Descripción: Genera diferentes tipos de conjuntos de datos para evaluar algorit
 """
 
 import random
+import hashlib
+import itertools
+from array import array
 
 
-def generar_lista_aleatoria(tamano):
+# Versión de los generadores; cambiarla invalida los conjuntos en caché
+VERSION_GENERADOR = 1
+
+
+def generar_lista_aleatoria(tamano, rng=random):
     """
     Genera una lista con números aleatorios
     
     Args:
         tamano: Cantidad de elementos en la lista
+        rng: Generador aleatorio (random.Random con semilla para reproducibilidad)
     
     Returns:
         Lista con números aleatorios entre 0 y tamano*10
     """
-    return [random.randint(0, tamano * 10) for _ in range(tamano)]
+    return [rng.randint(0, tamano * 10) for _ in range(tamano)]
 
 
-def generar_lista_invertida(tamano):
+def generar_lista_invertida(tamano, rng=random):
     """
     Genera una lista ordenada en orden descendente (peor caso para Bubble Sort)
     
     Args:
         tamano: Cantidad de elementos en la lista
+        rng: No se usa; se acepta por uniformidad con los demás generadores
     
     Returns:
         Lista ordenada de mayor a menor
@@ -32,13 +41,14 @@ def generar_lista_invertida(tamano):
     return list(range(tamano, 0, -1))
 
 
-def generar_lista_casi_ordenada(tamano, porcentaje_desordenado=10):
+def generar_lista_casi_ordenada(tamano, porcentaje_desordenado=10, rng=random):
     """
     Genera una lista casi ordenada con algunos elementos fuera de lugar
     
     Args:
         tamano: Cantidad de elementos en la lista
         porcentaje_desordenado: Porcentaje de elementos a desordenar
+        rng: Generador aleatorio (random.Random con semilla para reproducibilidad)
     
     Returns:
         Lista casi ordenada
@@ -50,37 +60,478 @@ def generar_lista_casi_ordenada(tamano, porcentaje_desordenado=10):
     
     # Realizar intercambios aleatorios
     for _ in range(num_intercambios):
-        i = random.randint(0, tamano - 1)
-        j = random.randint(0, tamano - 1)
+        i = rng.randint(0, tamano - 1)
+        j = rng.randint(0, tamano - 1)
         lista[i], lista[j] = lista[j], lista[i]
     
     return lista
 
 
-def obtener_conjuntos_prueba(tamanos, escenarios):
+def generar_asesino_quicksort(tamano, rng=random):
+    """
+    Genera la permutación que lleva a quicksort (pivote lista[len(lista)//2]) a O(n²)
+    
+    Se construye de modo que el elemento central sea siempre el máximo de
+    la sublista: cada partición separa un solo elemento, la recursión llega
+    a profundidad n y se hacen n²/2 comparaciones. Al quitar el central de
+    una lista de k elementos, el siguiente central queda justo a la
+    izquierda o a la derecha de los ya quitados, así que basta con llevar
+    los límites de esa ventana.
+    
+    Args:
+        tamano: Cantidad de elementos en la lista
+        rng: No se usa; se acepta por uniformidad con los demás generadores
+    
+    Returns:
+        Permutación de 1..tamano
+    """
+    lista = [0] * tamano
+    # Posiciones ya asignadas: la ventana [izquierda, derecha)
+    izquierda = derecha = tamano // 2
+    for valor in range(tamano, 0, -1):
+        # Índice del central entre las 'valor' posiciones libres
+        indice = valor // 2
+        posicion = indice if indice < izquierda else indice + (derecha - izquierda)
+        lista[posicion] = valor
+        if posicion < izquierda:
+            izquierda = posicion
+        else:
+            derecha = posicion + 1
+    return lista
+
+
+def generar_lista_pocos_unicos(tamano, unicos=10, rng=random):
+    """
+    Genera una lista con muchos duplicados (pocas claves distintas)
+    
+    Args:
+        tamano: Cantidad de elementos en la lista
+        unicos: Cantidad de valores distintos
+        rng: Generador aleatorio (random.Random con semilla para reproducibilidad)
+    
+    Returns:
+        Lista con valores entre 0 y unicos - 1
+    """
+    return [rng.randrange(unicos) for _ in range(tamano)]
+
+
+def generar_lista_diente_sierra(tamano, dientes=10, rng=random):
+    """
+    Genera una lista en diente de sierra: varias corridas ascendentes iguales
+    
+    Args:
+        tamano: Cantidad de elementos en la lista
+        dientes: Cantidad de corridas ascendentes
+        rng: No se usa; se acepta por uniformidad con los demás generadores
+    
+    Returns:
+        Lista con valores i % periodo
+    """
+    periodo = max(1, -(-tamano // dientes))
+    return [i % periodo for i in range(tamano)]
+
+
+def generar_lista_organo(tamano, rng=random):
+    """
+    Genera una lista en tubos de órgano: ascendente hasta la mitad y luego descendente
+    
+    Args:
+        tamano: Cantidad de elementos en la lista
+        rng: No se usa; se acepta por uniformidad con los demás generadores
+    
+    Returns:
+        Lista 0, 1, ..., n/2, ..., 1, 0
+    """
+    return [min(i, tamano - 1 - i) for i in range(tamano)]
+
+
+def generar_lista_zipf(tamano, exponente=1.1, rng=random):
+    """
+    Genera claves con distribución de Zipf: pocas muy frecuentes y una cola larga
+    
+    La clave de rango k aparece con probabilidad proporcional a 1 / k^exponente,
+    como los ids de los sensores más activos de un bus.
+    
+    Args:
+        tamano: Cantidad de elementos en la lista (y de claves posibles)
+        exponente: Exponente de la distribución (> 0)
+        rng: Generador aleatorio (random.Random con semilla para reproducibilidad)
+    
+    Returns:
+        Lista con claves entre 1 y tamano
+    """
+    if tamano == 0:
+        return []
+    acumulados = list(itertools.accumulate(1 / k ** exponente for k in range(1, tamano + 1)))
+    return rng.choices(range(1, tamano + 1), cum_weights=acumulados, k=tamano)
+
+
+def generar_lista_cola_aleatoria(tamano, porcentaje_cola=10, rng=random):
+    """
+    Genera una lista ordenada seguida de una cola de valores aleatorios
+    
+    Es el caso de datos ya ordenados a los que se agregan lecturas nuevas.
+    
+    Args:
+        tamano: Cantidad de elementos en la lista
+        porcentaje_cola: Porcentaje de elementos aleatorios al final
+        rng: Generador aleatorio (random.Random con semilla para reproducibilidad)
+    
+    Returns:
+        Lista con un prefijo ordenado y una cola aleatoria
+    """
+    cola = tamano * porcentaje_cola // 100
+    return list(range(tamano - cola)) + [rng.randint(0, tamano) for _ in range(cola)]
+
+
+def generar_flotantes_especiales(tamano, porcentaje_especiales=3, rng=random):
+    """
+    Genera flotantes con NaN, inf y -inf mezclados, como lecturas de sensores fallidos
+    
+    Con NaN el orden no está definido (toda comparación con NaN es falsa):
+    sirve para ver qué motores terminan, en cuánto tiempo y cuáles fallan.
+    
+    Args:
+        tamano: Cantidad de elementos en la lista
+        porcentaje_especiales: Porcentaje de valores NaN/inf/-inf
+        rng: Generador aleatorio (random.Random con semilla para reproducibilidad)
+    
+    Returns:
+        Lista de flotantes
+    """
+    especiales = (float('nan'), float('inf'), float('-inf'))
+    proporcion = porcentaje_especiales / 100
+    return [rng.choice(especiales) if rng.random() < proporcion else rng.gauss(0.0, 100.0)
+            for _ in range(tamano)]
+
+
+def generar_cadenas_prefijo(tamano, longitud_prefijo=64, rng=random):
+    """
+    Genera cadenas con un prefijo común largo (ej: rutas de tópicos de sensores)
+    
+    Cada comparación recorre el prefijo completo antes de decidir.
+    
+    Args:
+        tamano: Cantidad de elementos en la lista
+        longitud_prefijo: Longitud del prefijo común
+        rng: Generador aleatorio (random.Random con semilla para reproducibilidad)
+    
+    Returns:
+        Lista de cadenas
+    """
+    prefijo = ('robot/sensores/' * (longitud_prefijo // 15 + 1))[:longitud_prefijo]
+    return [f"{prefijo}{rng.randrange(tamano * 10 + 1):012d}" for _ in range(tamano)]
+
+
+def convertir_a_buffer(lista):
+    """
+    Convierte una lista de números en un buffer tipado array.array
+    
+    Usa 8 bytes por elemento ('q' para enteros con signo de 64 bits, 'd' para
+    flotantes) en lugar de un objeto Python por elemento.
+    
+    Args:
+        lista: Lista de enteros o flotantes
+    
+    Returns:
+        array.array con los mismos valores
+    """
+    tipo = 'd' if any(isinstance(x, float) for x in lista) else 'q'
+    return array(tipo, lista)
+
+
+def escribir_conjunto_binario(ruta, escenario, tamano, tipo='q',
+                              elementos_por_bloque=1_000_000, semilla=None):
+    """
+    Escribe un conjunto de prueba directamente a un archivo binario por bloques
+    
+    Permite crear archivos mayores que la memoria disponible. En el escenario
+    'casi_ordenada' los intercambios se hacen dentro de cada bloque. Con la
+    misma semilla (y el mismo elementos_por_bloque) el archivo es idéntico
+    byte a byte.
+    
+    Args:
+        ruta: Archivo de salida (valores en formato nativo de array.array)
+        escenario: 'aleatoria', 'invertida' o 'casi_ordenada'
+        tamano: Cantidad total de elementos
+        tipo: Código de tipo de array.array
+        elementos_por_bloque: Elementos generados en memoria a la vez
+        semilla: Semilla del generador (None = no reproducible)
+    
+    Returns:
+        Número de bytes escritos
+    """
+    if escenario not in ('aleatoria', 'invertida', 'casi_ordenada'):
+        raise ValueError(f"Escenario desconocido: {escenario}")
+    
+    rng = random
+    if semilla is not None:
+        rng = random.Random(f"{semilla}-{escenario}-{tamano}-binario-{VERSION_GENERADOR}")
+    
+    with open(ruta, 'wb') as f:
+        for inicio in range(0, tamano, elementos_por_bloque):
+            fin = min(inicio + elementos_por_bloque, tamano)
+            
+            if escenario == 'aleatoria':
+                # Mantener el rango [0, tamano*10] del conjunto completo
+                bloque = [rng.randint(0, tamano * 10) for _ in range(fin - inicio)]
+            elif escenario == 'invertida':
+                bloque = list(range(tamano - inicio, tamano - fin, -1))
+            else:
+                bloque = [inicio + x
+                          for x in generar_lista_casi_ordenada(fin - inicio, rng=rng)]
+            
+            array(tipo, bloque).tofile(f)
+    
+    return tamano * array(tipo).itemsize
+
+
+def generar_arreglo_numpy(escenario, tamano, semilla=None, dtype='int64',
+                          porcentaje_desordenado=10):
+    """
+    Genera un conjunto como arreglo de NumPy con operaciones vectorizadas
+    
+    Usa numpy.random.Generator con semilla explícita, por lo que el mismo
+    (escenario, tamano, semilla) produce siempre el mismo arreglo.
+    
+    Args:
+        escenario: 'aleatoria', 'invertida' o 'casi_ordenada'
+        tamano: Cantidad de elementos
+        semilla: Semilla del generador (None = no reproducible)
+        dtype: Tipo de los elementos del arreglo
+        porcentaje_desordenado: Porcentaje de elementos a desordenar en 'casi_ordenada'
+    
+    Returns:
+        numpy.ndarray de una dimensión (usar .tolist() para obtener una lista)
+    """
+    import numpy as np
+    
+    rng = np.random.default_rng(semilla)
+    return _bloque_numpy(np, rng, escenario, 0, tamano, tamano, dtype,
+                         porcentaje_desordenado)
+
+
+def escribir_conjunto_numpy(ruta, escenario, tamano, semilla=None, dtype='int64',
+                            elementos_por_bloque=10_000_000, porcentaje_desordenado=10):
+    """
+    Genera un conjunto por bloques vectorizados y lo escribe directo a disco
+    
+    Sólo un bloque vive en memoria a la vez, así que el archivo puede ser
+    mayor que la RAM. Si la ruta termina en '.npy' se escribe en formato
+    NumPy (mediante un memmap); si no, como binario crudo compatible con
+    ordenamiento_externo. En 'casi_ordenada' el desorden es local a cada bloque.
+    
+    Args:
+        ruta: Archivo de salida
+        escenario: 'aleatoria', 'invertida' o 'casi_ordenada'
+        tamano: Cantidad total de elementos
+        semilla: Semilla del generador
+        dtype: Tipo de los elementos
+        elementos_por_bloque: Elementos generados en memoria a la vez
+        porcentaje_desordenado: Porcentaje de elementos a desordenar en 'casi_ordenada'
+    
+    Returns:
+        Número de bytes de datos escritos
+    """
+    import numpy as np
+    
+    rng = np.random.default_rng(semilla)
+    
+    if ruta.endswith('.npy'):
+        destino = np.lib.format.open_memmap(ruta, mode='w+', dtype=dtype, shape=(tamano,))
+        for inicio in range(0, tamano, elementos_por_bloque):
+            fin = min(inicio + elementos_por_bloque, tamano)
+            destino[inicio:fin] = _bloque_numpy(np, rng, escenario, inicio, fin, tamano,
+                                                dtype, porcentaje_desordenado)
+        destino.flush()
+        del destino
+    else:
+        with open(ruta, 'wb') as f:
+            for inicio in range(0, tamano, elementos_por_bloque):
+                fin = min(inicio + elementos_por_bloque, tamano)
+                _bloque_numpy(np, rng, escenario, inicio, fin, tamano, dtype,
+                              porcentaje_desordenado).tofile(f)
+    
+    return tamano * np.dtype(dtype).itemsize
+
+
+def _bloque_numpy(np, rng, escenario, inicio, fin, tamano, dtype, porcentaje_desordenado):
+    """Genera las posiciones [inicio, fin) de un conjunto de tamaño total tamano"""
+    n = fin - inicio
+    
+    if escenario == 'aleatoria':
+        return rng.integers(0, tamano * 10, size=n, dtype=dtype, endpoint=True)
+    
+    if escenario == 'invertida':
+        return np.arange(tamano - inicio, tamano - fin, -1, dtype=dtype)
+    
+    if escenario == 'casi_ordenada':
+        bloque = np.arange(inicio, fin, dtype=dtype)
+        num_intercambios = int(n * porcentaje_desordenado / 100)
+        if num_intercambios:
+            # Cada intercambio toca dos posiciones: permutar esas posiciones
+            # entre sí equivale a los intercambios del generador en Python
+            posiciones = np.unique(rng.integers(0, n, size=2 * num_intercambios))
+            bloque[posiciones] = bloque[rng.permutation(posiciones)]
+        return bloque
+    
+    raise ValueError(f"Escenario desconocido: {escenario}")
+
+
+# Campos de los registros de sensores (timestamp en ms, id del sensor, lectura)
+CAMPOS_REGISTRO = ('timestamp', 'sensor_id', 'valor')
+
+
+def generar_registros_sensores(tamano, sensores=64, semilla=None, vectorizado=False):
+    """
+    Genera lecturas de sensores como registros (timestamp, sensor_id, valor)
+    
+    Los timestamps son crecientes con fluctuación, como llegan de un bus de
+    sensores; los ids se repiten, de modo que ordenar por (sensor_id,
+    timestamp) agrupa la serie de cada sensor.
+    
+    Args:
+        tamano: Cantidad de registros
+        sensores: Cantidad de sensores distintos
+        semilla: Semilla para reproducibilidad
+        vectorizado: Si es True, devuelve las columnas como arreglos NumPy
+    
+    Returns:
+        Lista de tuplas, o diccionario campo -> arreglo NumPy si vectorizado
+    """
+    if vectorizado:
+        import numpy as np
+        rng = np.random.default_rng(semilla)
+        return {
+            'timestamp': np.cumsum(rng.integers(0, 10, tamano, dtype=np.int64)),
+            'sensor_id': rng.integers(0, sensores, tamano, dtype=np.int64),
+            'valor': rng.normal(20.0, 5.0, tamano),
+        }
+    
+    if semilla is None:
+        rng = random
+    else:
+        rng = random.Random(f"{semilla}-registros-{tamano}-{VERSION_GENERADOR}")
+    registros = []
+    timestamp = 0
+    for _ in range(tamano):
+        timestamp += rng.randrange(10)
+        registros.append((timestamp, rng.randrange(sensores), rng.gauss(20.0, 5.0)))
+    return registros
+
+
+def huella_conjunto(datos):
+    """
+    Calcula el hash SHA-256 del contenido de un conjunto de datos
+    
+    Para listas numéricas es el hash de sus bytes como array.array, el mismo
+    que registra la caché de conjuntos, de modo que cada resultado puede
+    rastrearse hasta su entrada exacta.
+    
+    Args:
+        datos: Lista o buffer tipado
+    
+    Returns:
+        String hexadecimal con el hash
+    """
+    try:
+        contenido = bytes(datos if isinstance(datos, (array, memoryview))
+                          else convertir_a_buffer(datos))
+    except (TypeError, OverflowError):
+        # Elementos no numéricos: usar su representación textual
+        contenido = repr(list(datos)).encode('utf-8')
+    return hashlib.sha256(contenido).hexdigest()
+
+
+# Generadores registrados por nombre de escenario
+GENERADORES = {
+    'aleatoria': generar_lista_aleatoria,
+    'invertida': generar_lista_invertida,
+    'casi_ordenada': generar_lista_casi_ordenada,
+    'asesino_quicksort': generar_asesino_quicksort,
+    'pocos_unicos': generar_lista_pocos_unicos,
+    'diente_sierra': generar_lista_diente_sierra,
+    'organo': generar_lista_organo,
+    'zipf': generar_lista_zipf,
+    'cola_aleatoria': generar_lista_cola_aleatoria,
+    'flotantes_especiales': generar_flotantes_especiales,
+    'cadenas_prefijo': generar_cadenas_prefijo,
+}
+
+# Escenarios con versión vectorizada en NumPy (generar_arreglo_numpy)
+ESCENARIOS_NUMPY = ('aleatoria', 'invertida', 'casi_ordenada')
+
+# Escenarios adversariales y realistas (ver README); los de texto no van a la caché binaria
+ESCENARIOS_ADVERSARIALES = ('asesino_quicksort', 'pocos_unicos', 'diente_sierra', 'organo',
+                            'zipf', 'cola_aleatoria', 'flotantes_especiales',
+                            'cadenas_prefijo')
+ESCENARIOS_TEXTO = ('cadenas_prefijo',)
+
+# Escenarios que no son de enteros (los motores de enteros no los admiten)
+ESCENARIOS_NO_ENTEROS = ('flotantes_especiales',) + ESCENARIOS_TEXTO
+
+
+def generar_conjunto(escenario, tamano, semilla=None):
+    """
+    Genera un conjunto de un escenario, reproducible si se da una semilla
+    
+    Args:
+        escenario: Nombre del escenario registrado en GENERADORES
+        tamano: Cantidad de elementos
+        semilla: Semilla base; None usa el generador global sin semilla
+    
+    Returns:
+        Lista con el conjunto generado
+    """
+    if semilla is None:
+        rng = random
+    else:
+        # Semilla derivada por caso: cada conjunto es independiente del orden
+        rng = random.Random(f"{semilla}-{escenario}-{tamano}-{VERSION_GENERADOR}")
+    return GENERADORES[escenario](tamano, rng=rng)
+
+
+def obtener_conjuntos_prueba(tamanos, escenarios, semilla=None, usar_cache=False,
+                             directorio_cache=None, presupuesto_cache_mb=None,
+                             vectorizado=False, como_buffer=False):
     """
     Genera todos los conjuntos de prueba para los experimentos
     
     Args:
         tamanos: Lista con los tamaños a probar (ej: [100, 1000, 5000])
         escenarios: Lista con los tipos de escenarios (ej: ['aleatoria', 'invertida'])
+        semilla: Semilla base para generar conjuntos reproducibles
+        usar_cache: Si es True (y hay semilla), carga los conjuntos desde la
+                    caché en disco y sólo genera los que falten
+        directorio_cache: Carpeta de la caché (por defecto cache_datos.DIRECTORIO_CACHE)
+        presupuesto_cache_mb: Tamaño máximo de la caché antes de desalojar (LRU)
+        vectorizado: Si es True, genera con NumPy (generar_arreglo_numpy) los
+                     escenarios de ESCENARIOS_NUMPY; el resto, en Python
+        como_buffer: Si es True, los conjuntos leídos de la caché se
+                     devuelven como array.array en lugar de listas
     
     Returns:
         Diccionario con todos los conjuntos de datos generados
     """
-    generadores = {
-        'aleatoria': generar_lista_aleatoria,
-        'invertida': generar_lista_invertida,
-        'casi_ordenada': generar_lista_casi_ordenada,
-    }
-    
     conjuntos = {}
     
     for tamano in tamanos:
         for escenario in escenarios:
-            if escenario in generadores:
+            if escenario in GENERADORES:
                 clave = f"{escenario}_{tamano}"
-                conjuntos[clave] = generadores[escenario](tamano)
+                if usar_cache and semilla is not None and escenario not in ESCENARIOS_TEXTO:
+                    from cache_datos import cargar_o_generar
+                    conjuntos[clave] = cargar_o_generar(
+                        escenario, tamano, semilla,
+                        directorio=directorio_cache,
+                        presupuesto_mb=presupuesto_cache_mb,
+                        vectorizado=vectorizado and escenario in ESCENARIOS_NUMPY,
+                        como_buffer=como_buffer
+                    )
+                elif vectorizado and escenario in ESCENARIOS_NUMPY:
+                    conjuntos[clave] = generar_arreglo_numpy(escenario, tamano, semilla).tolist()
+                else:
+                    conjuntos[clave] = generar_conjunto(escenario, tamano, semilla)
     
     return conjuntos
 
@@ -92,4 +543,5 @@ if __name__ == "__main__":
     # Generar muestras pequeñas para verificación
     print("\nLista aleatoria (10 elementos):", generar_lista_aleatoria(10))
     print("Lista invertida (10 elementos):", generar_lista_invertida(10))
-    print("Lista casi ordenada (10 elementos):", generar_lista_casi_ordenada(10))
\ No newline at end of file
+    print("Lista casi ordenada (10 elementos):", generar_lista_casi_ordenada(10))
+    print("Asesino de QuickSort (10 elementos):", generar_asesino_quicksort(10))
\ No newline at end of file
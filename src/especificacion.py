@@ -0,0 +1,223 @@
+"""
+Módulo de Especificación de Experimentos
+Descripción: Lee la matriz de pruebas desde un archivo TOML o JSON, la expande
+en una lista determinista de casos, la reparte en fragmentos (--shard i/N)
+para ejecutarla en varias máquinas y fusiona los resultados de los fragmentos
+registrando los metadatos de cada máquina
+"""
+
+import os
+import json
+import socket
+import hashlib
+import platform
+
+
+# Matriz por defecto (la del experimento original)
+ESPECIFICACION_POR_DEFECTO = {
+    'tamanos': [100, 1000, 5000, 10000],
+    'escenarios': ['aleatoria', 'invertida'],
+    'repeticiones': 5,
+    'algoritmos': None,
+    'semilla': None,
+}
+
+
+def cargar_especificacion(ruta=None):
+    """
+    Lee una especificación de experimento y la completa con los valores por defecto
+
+    Ejemplo en TOML:
+
+        tamanos = [1000, 10000, 100000]
+        escenarios = ["aleatoria", "invertida"]
+        repeticiones = 10
+        algoritmos = ["QuickSort", "IntroSort"]   # opcional (default: todos)
+        semilla = 42                              # opcional
+
+    Args:
+        ruta: Archivo .toml o .json (None = especificación por defecto)
+
+    Returns:
+        Diccionario con 'tamanos', 'escenarios', 'repeticiones', 'algoritmos'
+        y 'semilla'
+
+    Raises:
+        ValueError: Si el archivo tiene claves desconocidas o valores inválidos
+    """
+    especificacion = dict(ESPECIFICACION_POR_DEFECTO)
+    if ruta is None:
+        return especificacion
+
+    if ruta.endswith('.toml'):
+        try:
+            import tomllib
+        except ImportError:
+            # Antes de Python 3.11 se usa el paquete tomli (misma interfaz)
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError(f"Leer {ruta} requiere Python 3.11 o el paquete tomli "
+                                 "(pip install tomli); también puede usarse una "
+                                 "especificación .json")
+        with open(ruta, 'rb') as f:
+            leida = tomllib.load(f)
+    else:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            leida = json.load(f)
+
+    desconocidas = set(leida) - set(ESPECIFICACION_POR_DEFECTO)
+    if desconocidas:
+        raise ValueError(f"Claves desconocidas en {ruta}: {sorted(desconocidas)}")
+    especificacion.update(leida)
+
+    if not especificacion['tamanos'] or any(not isinstance(n, int) or n < 0
+                                            for n in especificacion['tamanos']):
+        raise ValueError("'tamanos' debe ser una lista de enteros no negativos")
+    if not especificacion['escenarios']:
+        raise ValueError("'escenarios' no puede estar vacío")
+    if not isinstance(especificacion['repeticiones'], int) or especificacion['repeticiones'] < 1:
+        raise ValueError("'repeticiones' debe ser un entero positivo")
+
+    return especificacion
+
+
+def huella_especificacion(especificacion):
+    """Huella corta de la matriz, para comprobar que los fragmentos son del mismo experimento"""
+    texto = json.dumps(especificacion, sort_keys=True)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()[:16]
+
+
+def expandir(especificacion, algoritmos, soportado=None):
+    """
+    Expande la matriz en la lista de casos, siempre en el mismo orden
+
+    El orden es el de ejecución: tamaño, escenario y algoritmo.
+
+    Args:
+        especificacion: Diccionario de cargar_especificacion
+        algoritmos: Diccionario nombre -> función de los algoritmos disponibles
+        soportado: Función (algoritmo, escenario) -> bool que excluye los
+                   casos que el algoritmo no admite; None = todos
+
+    Returns:
+        Lista de tuplas (algoritmo, escenario, tamano)
+
+    Raises:
+        ValueError: Si la especificación pide un algoritmo que no existe
+    """
+    nombres = especificacion['algoritmos'] or list(algoritmos)
+    desconocidos = [a for a in nombres if a not in algoritmos]
+    if desconocidos:
+        raise ValueError(f"Algoritmos desconocidos: {desconocidos}; "
+                         f"disponibles: {list(algoritmos)}")
+
+    return [(algoritmo, escenario, tamano)
+            for tamano in especificacion['tamanos']
+            for escenario in especificacion['escenarios']
+            for algoritmo in nombres
+            if soportado is None or soportado(algoritmo, escenario)]
+
+
+def parsear_fragmento(texto):
+    """
+    Interpreta un fragmento 'i/N' (1 <= i <= N)
+
+    Returns:
+        Tupla (i, N)
+    """
+    try:
+        indice, total = (int(parte) for parte in texto.split('/'))
+    except ValueError:
+        raise ValueError(f"Fragmento inválido: '{texto}' (formato esperado: i/N)")
+    if total < 1 or not 1 <= indice <= total:
+        raise ValueError(f"Fragmento fuera de rango: '{texto}' (se requiere 1 <= i <= N)")
+    return indice, total
+
+
+def seleccionar_fragmento(casos, indice, total):
+    """
+    Devuelve los casos del fragmento indice de total (reparto circular)
+
+    El reparto circular deja en cada fragmento casos de todos los tamaños,
+    de modo que las máquinas terminan en tiempos parecidos y cada una puede
+    extrapolar los tamaños grandes a partir de los pequeños.
+    """
+    return [caso for posicion, caso in enumerate(casos) if posicion % total == indice - 1]
+
+
+def metadatos_maquina():
+    """Datos de la máquina que ejecuta un fragmento"""
+    return {
+        'host': socket.gethostname(),
+        'plataforma': platform.platform(),
+        'procesador': platform.processor() or platform.machine(),
+        'python': platform.python_version(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def fusionar_resultados(listas_resultados, especificacion=None, algoritmos=None,
+                        soportado=None):
+    """
+    Combina los resultados de varios fragmentos en un solo conjunto
+
+    Args:
+        listas_resultados: Iterable de iterables de resultados (uno por fragmento)
+        especificacion: Si se indica junto con algoritmos, los resultados se
+                        ordenan como en la matriz y se informan los faltantes;
+                        los fragmentos deben haberse medido con esta misma
+                        especificación
+        algoritmos: Diccionario de algoritmos disponibles (ver expandir)
+        soportado: Filtro de casos de la matriz (ver expandir)
+
+    Returns:
+        Tupla (resultados, maquinas, faltantes): la lista fusionada, un
+        diccionario host -> metadatos con sus fragmentos y casos, y la lista
+        de casos de la matriz sin resultado
+
+    Raises:
+        ValueError: Si los fragmentos provienen de especificaciones distintas
+                    (entre sí o respecto a especificacion) o un mismo caso
+                    aparece en dos fragmentos
+    """
+    por_caso = {}
+    maquinas = {}
+    huellas = set()
+
+    for resultados in listas_resultados:
+        for r in resultados:
+            clave = (r['algoritmo'], r['escenario'], r['tamano'])
+            if clave in por_caso:
+                raise ValueError(f"Caso repetido en dos fragmentos: {clave}")
+            por_caso[clave] = r
+
+            if r.get('especificacion') is not None:
+                huellas.add(r['especificacion'])
+            maquina = r.get('maquina') or {'host': 'desconocido'}
+            registro = maquinas.setdefault(maquina['host'], dict(maquina, fragmentos=[],
+                                                                  casos=0))
+            if r.get('fragmento') and r['fragmento'] not in registro['fragmentos']:
+                registro['fragmentos'].append(r['fragmento'])
+            registro['casos'] += 1
+
+    if len(huellas) > 1:
+        raise ValueError(f"Los fragmentos provienen de especificaciones distintas: "
+                         f"{sorted(huellas)}")
+
+    if especificacion is None or algoritmos is None:
+        return list(por_caso.values()), maquinas, []
+
+    huella = huella_especificacion(especificacion)
+    if huellas and huellas != {huella}:
+        raise ValueError(f"Los fragmentos se midieron con la especificación {huellas.pop()} "
+                         f"y la actual es {huella}: use la misma --spec (y la misma "
+                         f"--semilla y --adversariales) que al ejecutar los fragmentos")
+
+    orden = expandir(especificacion, algoritmos, soportado)
+    en_matriz = set(orden)
+    resultados = [por_caso[caso] for caso in orden if caso in por_caso]
+    # Los resultados sin huella que no están en la matriz se conservan al final
+    resultados += [r for caso, r in por_caso.items() if caso not in en_matriz]
+    faltantes = [caso for caso in orden if caso not in por_caso]
+    return resultados, maquinas, faltantes
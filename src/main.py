@@ -4,44 +4,99 @@ Autor: [Tu Nombre]
 Fecha: Febrero 2026
 
 Este script ejecuta el experimento completo de evaluación de rendimiento
-de los algoritmos Bubble Sort y QuickSort.
+de los algoritmos Bubble Sort, QuickSort, IntroSort, Counting Sort y Radix Sort.
 """
 
+import os
+import sys
+import glob
 import json
 import csv
+import argparse
+import functools
 from datetime import datetime
-from performance_tester import ejecutar_pruebas_completas, generar_tabla_resultados
+from complejidad import generar_reporte_complejidad
+from perfilado import generar_reporte_perfiles
+from data_generator import ESCENARIOS_ADVERSARIALES
+from punto_control import (
+    agregar_resultado, leer_resultados, leer_archivo_resultados, ResultadosPuntoControl
+)
+from especificacion import (
+    cargar_especificacion, huella_especificacion, expandir, parsear_fragmento,
+    seleccionar_fragmento, metadatos_maquina, fusionar_resultados
+)
+from almacen_resultados import conectar, registrar_ejecucion, generar_reporte_historico
+from regresion import (
+    cargar_linea_base, comparar_resultados, generar_reporte_regresion, hay_regresiones,
+    ALFA, UMBRAL_RELATIVO
+)
+from performance_tester import (
+    ejecutar_pruebas_completas, ejecutar_pruebas_externas, ejecutar_pruebas_adaptativas,
+    ejecutar_pruebas_paralelas, ejecutar_pruebas_registros,
+    ejecutar_pruebas_seleccion, ejecutar_pruebas_flujo, ejecutar_pruebas_burbuja,
+    generar_tabla_resultados, caso_soportado, ALGORITMOS, ALGORITMOS_IN_PLACE
+)
 
 
 def guardar_resultados_json(resultados, ruta):
-    """Guarda los resultados en formato JSON"""
+    """
+    Guarda los resultados en formato JSON
+    
+    El arreglo se escribe elemento por elemento, así que los resultados
+    pueden venir de un iterable (ej: el punto de control) sin cargarlos todos.
+    """
     with open(ruta, 'w', encoding='utf-8') as f:
-        json.dump(resultados, f, indent=2, ensure_ascii=False)
+        f.write("[")
+        for i, resultado in enumerate(resultados):
+            f.write(",\n  " if i else "\n  ")
+            texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+            f.write(texto.replace("\n", "\n  "))
+        f.write("\n]\n")
     print(f"✓ Resultados guardados en: {ruta}")
 
 
 def guardar_resultados_csv(resultados, ruta):
-    """Guarda los resultados en formato CSV"""
-    if not resultados:
-        return
+    """
+    Guarda los resultados en formato CSV
     
-    # Filtrar resultados sin errores
-    resultados_validos = [r for r in resultados if 'error' not in r]
+    Recorre los resultados dos veces (columnas y filas), por lo que deben ser
+    una lista o un iterable reutilizable como ResultadosPuntoControl.
+    """
+    # Primera pasada: columnas opcionales presentes en los resultados sin errores
+    hay_validos = con_memoria = con_contadores = False
+    for r in resultados:
+        if 'error' not in r:
+            hay_validos = True
+            con_memoria = con_memoria or 'memoria_pico_bytes' in r
+            con_contadores = con_contadores or 'comparaciones' in r
     
-    if not resultados_validos:
+    if not hay_validos:
         return
     
     # Escribir CSV
     with open(ruta, 'w', newline='', encoding='utf-8') as f:
         campos = ['algoritmo', 'escenario', 'tamano', 'repeticiones', 
-                  'promedio_segundos', 'promedio_ms', 'desviacion_estandar']
+                  'promedio_segundos', 'promedio_ms', 'desviacion_estandar',
+                  'semilla', 'huella_datos']
+        
+        # Columnas de memoria sólo si se ejecutó con perfil de memoria
+        if con_memoria:
+            campos += ['memoria_pico_bytes', 'asignaciones_netas', 'bytes_netos',
+                       'rss_delta_bytes']
+        
+        # Columnas de contadores sólo si se ejecutó con contadores de operaciones
+        if con_contadores:
+            campos += ['comparaciones', 'movimientos', 'copias', 'particiones',
+                       'llamadas_recursivas', 'profundidad_max']
         
         writer = csv.DictWriter(f, fieldnames=campos)
         writer.writeheader()
         
-        for r in resultados_validos:
-            fila = {campo: r[campo] for campo in campos}
-            writer.writerow(fila)
+        # Segunda pasada: filas
+        for r in resultados:
+            if 'error' not in r:
+                fila = {campo: r.get(campo) for campo in campos}
+                writer.writerow(fila)
     
     print(f"✓ Resultados guardados en: {ruta}")
 
@@ -56,12 +111,14 @@ def guardar_tabla_texto(resultados, ruta):
     print(f"✓ Tabla guardada en: {ruta}")
 
 
-def generar_analisis_comparativo(resultados):
+def generar_analisis_comparativo(resultados, historico=""):
     """
     Genera un análisis comparativo de los resultados
     
     Args:
-        resultados: Lista de resultados de las pruebas
+        resultados: Lista (o iterable reutilizable) de resultados de las pruebas
+        historico: Reportes de comparación con ejecuciones anteriores (almacén
+                   histórico y línea base), opcional
     
     Returns:
         String con el análisis
@@ -70,31 +127,19 @@ def generar_analisis_comparativo(resultados):
     analisis += "ANÁLISIS COMPARATIVO DE RENDIMIENTO\n"
     analisis += "=" * 80 + "\n\n"
     
-    # Agrupar por tamaño
+    # Agrupar por tamaño y escenario (sólo los promedios)
     por_tamano = {}
     for r in resultados:
         if 'error' not in r:
-            tamano = r['tamano']
-            if tamano not in por_tamano:
-                por_tamano[tamano] = []
-            por_tamano[tamano].append(r)
+            por_escenario = por_tamano.setdefault(r['tamano'], {})
+            por_escenario.setdefault(r['escenario'], {})[r['algoritmo']] = r['promedio_ms']
     
     # Análisis por tamaño
     for tamano in sorted(por_tamano.keys()):
         analisis += f"\n--- Tamaño: {tamano:,} elementos ---\n\n"
         
-        datos = por_tamano[tamano]
-        
-        # Agrupar por escenario
-        por_escenario = {}
-        for d in datos:
-            esc = d['escenario']
-            if esc not in por_escenario:
-                por_escenario[esc] = {}
-            por_escenario[esc][d['algoritmo']] = d['promedio_ms']
-        
         # Comparar algoritmos en cada escenario
-        for escenario, tiempos in por_escenario.items():
+        for escenario, tiempos in por_tamano[tamano].items():
             analisis += f"Escenario: {escenario}\n"
             
             if 'Bubble Sort' in tiempos and 'QuickSort' in tiempos:
@@ -117,16 +162,122 @@ def generar_analisis_comparativo(resultados):
     # Observaciones generales
     analisis += "\n--- OBSERVACIONES CLAVE ---\n\n"
     
-    analisis += "1. ESCALABILIDAD:\n"
-    analisis += "   • Bubble Sort muestra crecimiento cuadrático O(n²)\n"
-    analisis += "   • QuickSort muestra crecimiento logarítmico O(n log n)\n"
-    analisis += "   • La diferencia se hace más notable con tamaños grandes\n\n"
+    analisis += "1. ESCALABILIDAD (derivada de los tiempos medidos):\n\n"
+    analisis += generar_reporte_complejidad(resultados)
     
     analisis += "2. ESCENARIOS:\n"
     analisis += "   • Lista invertida: peor caso para Bubble Sort\n"
     analisis += "   • Lista aleatoria: caso promedio para ambos\n"
     analisis += "   • QuickSort mantiene buen rendimiento en todos los casos\n\n"
     
+    # Memoria medida (sólo con perfil de memoria)
+    tamanos_memoria = [r['tamano'] for r in resultados if 'memoria_pico_bytes' in r]
+    if tamanos_memoria:
+        mayor = max(tamanos_memoria)
+        analisis += f"MEMORIA MEDIDA ({mayor:,} elementos, pico de tracemalloc):\n"
+        for r in resultados:
+            if 'memoria_pico_bytes' in r and r['tamano'] == mayor:
+                bytes_por_elemento = r['memoria_pico_bytes'] / mayor
+                analisis += (f"   • {r['algoritmo']} ({r['escenario']}): "
+                             f"{r['memoria_pico_bytes'] / 1024:,.1f} KB "
+                             f"({bytes_por_elemento:.1f} bytes/elemento)\n")
+        analisis += "\n"
+    
+    # Aceleración paralela (sólo con --paralelo)
+    curvas = {}
+    for r in resultados:
+        if 'eficiencia' in r:
+            curvas.setdefault((r['escenario'], r['tamano']), []).append(
+                (r['procesos'], r['aceleracion'], r['eficiencia']))
+    if curvas:
+        analisis += "ACELERACIÓN PARALELA (Sample Sort vs QuickSort secuencial):\n"
+        for (escenario, tamano), puntos in sorted(curvas.items()):
+            analisis += f"   • {escenario}, {tamano:,} elementos: "
+            analisis += ", ".join(f"{p}p {a:.2f}x ({e:.0%})" for p, a, e in sorted(puntos))
+            analisis += "\n"
+        analisis += "\n"
+    
+    # Motor elegido por el selector adaptativo (sólo con --adaptativo)
+    adaptativos = [r for r in resultados if 'decision' in r]
+    if adaptativos:
+        analisis += "SELECTOR ADAPTATIVO (motor elegido, costo de la sonda, vs IntroSort):\n"
+        for r in sorted(adaptativos, key=lambda r: (r['escenario'], r['tamano'])):
+            analisis += (f"   • {r['escenario']}, {r['tamano']:,} elementos: "
+                         f"{r['decision']}, sonda {r['sonda_ms']:.4f} ms, "
+                         f"{r['aceleracion']:.2f}x")
+            if len(r.get('decisiones', {})) > 1:
+                analisis += f" (motores: {r['decisiones']})"
+            analisis += "\n"
+        analisis += "\n"
+    
+    # Throughput de registros (sólo con --registros)
+    por_tamano = {}
+    for r in resultados:
+        if 'registros_por_segundo' in r:
+            por_tamano.setdefault(r['tamano'], []).append(
+                (r['algoritmo'], r['registros_por_segundo'], r['aceleracion']))
+    if por_tamano:
+        analisis += "ORDENAMIENTO DE REGISTROS (por sensor_id, timestamp):\n"
+        for tamano, variantes in sorted(por_tamano.items()):
+            analisis += f"   • {tamano:,} registros: "
+            analisis += ", ".join(f"{nombre} {rps:,.0f} reg/s ({a:.2f}x)"
+                                  for nombre, rps, a in variantes)
+            analisis += "\n"
+        analisis += "\n"
+    
+    # Funciones calientes (sólo con --perfil)
+    analisis += generar_reporte_perfiles(resultados)
+    
+    # Peor caso de cada algoritmo en el mayor tamaño (con escenarios adversariales)
+    if any(r['escenario'] in ESCENARIOS_ADVERSARIALES for r in resultados):
+        mayor = max(r['tamano'] for r in resultados)
+        peores = {}
+        fallas = {}
+        for r in resultados:
+            if r['tamano'] != mayor or r.get('omitido'):
+                continue
+            if 'error' in r:
+                fallas.setdefault(r['algoritmo'], []).append(r['escenario'])
+            elif r['promedio_ms'] > peores.get(r['algoritmo'], (0, ''))[0]:
+                peores[r['algoritmo']] = (r['promedio_ms'], r['escenario'])
+        analisis += f"PEOR CASO POR ALGORITMO ({mayor:,} elementos):\n"
+        for algoritmo in dict.fromkeys(list(peores) + list(fallas)):
+            analisis += f"   • {algoritmo}: "
+            if algoritmo in peores:
+                analisis += f"{peores[algoritmo][0]:.4f} ms en '{peores[algoritmo][1]}'"
+            if algoritmo in fallas:
+                analisis += ("; " if algoritmo in peores else "")
+                analisis += f"falla en {', '.join(fallas[algoritmo])}"
+            analisis += "\n"
+        analisis += "\n"
+    
+    # Aceleración frente a una variante de referencia (--seleccion, --flujo, --burbuja)
+    por_caso = {}
+    for r in resultados:
+        if 'referencia' in r:
+            por_caso.setdefault((r['escenario'], r['tamano'], r['referencia']), []).append(
+                (r['algoritmo'], r['aceleracion']))
+    if por_caso:
+        analisis += "ACELERACIÓN FRENTE A LA REFERENCIA (selección, flujo y burbuja):\n"
+        for (escenario, tamano, referencia), operaciones in sorted(por_caso.items()):
+            analisis += f"   • {escenario}, {tamano:,} elementos (vs {referencia}): "
+            analisis += ", ".join(f"{nombre} {a:.1f}x" for nombre, a in operaciones)
+            analisis += "\n"
+        analisis += "\n"
+    
+    # Descomposición del costo de Bubble Sort (--burbuja)
+    descompuestos = [r for r in resultados if 'sobrecarga_interprete' in r]
+    if descompuestos:
+        analisis += "BUBBLE SORT: ALGORITMO VS INTÉRPRETE (Odd-Even vectorizado con NumPy):\n"
+        for r in descompuestos:
+            analisis += (f"   • {r['escenario']}, {r['tamano']:,} elementos: intérprete "
+                         f"{r['sobrecarga_interprete']:.1f}x, algoritmo O(n²) vs np.sort "
+                         f"{r['costo_algoritmico']:.1f}x, aceleración total vs Bubble Sort "
+                         f"{r['aceleracion']:.1f}x\n")
+        analisis += "\n"
+    
+    analisis += historico
+    
     analisis += "3. APLICACIÓN EN ROBÓTICA:\n"
     analisis += "   • Procesamiento de datos de sensores: QuickSort preferible\n"
     analisis += "   • Tiempo real: QuickSort es crítico para respuesta rápida\n"
@@ -138,41 +289,399 @@ def generar_analisis_comparativo(resultados):
     return analisis
 
 
+# Modos que reemplazan a la ejecución completa (son excluyentes entre sí)
+MODOS = ('fusionar', 'externo', 'adaptativo', 'paralelo', 'registros', 'seleccion',
+         'flujo', 'burbuja')
+
+
+def parsear_argumentos(argv=None):
+    """Lee las opciones de línea de comandos del experimento"""
+    parser = argparse.ArgumentParser(
+        description="Evaluación de rendimiento de algoritmos de ordenamiento"
+    )
+    parser.add_argument(
+        '--jobs', type=int, default=1,
+        help="Número de procesos en paralelo, cada uno fijado a su CPU (default: 1)"
+    )
+    parser.add_argument(
+        '--in-place', action='store_true',
+        help="Mide las variantes in-place sobre buffers tipados (sin contar la copia)"
+    )
+    parser.add_argument(
+        '--externo', action='store_true',
+        help="Compara el ordenamiento externo (archivos + mmap) contra QuickSort en memoria"
+    )
+    parser.add_argument(
+        '--adaptativo', action='store_true',
+        help="Mide sort_auto: motor elegido, costo de la sonda y aceleración vs IntroSort"
+    )
+    parser.add_argument(
+        '--paralelo', action='store_true',
+        help="Mide Sample Sort paralelo (memoria compartida) con distinto número de "
+             "procesos: aceleración y eficiencia vs QuickSort"
+    )
+    parser.add_argument(
+        '--procesos', default=None, metavar='LISTA',
+        help="Números de procesos a barrer con --paralelo, separados por comas "
+             "(default: potencias de dos hasta las CPUs disponibles)"
+    )
+    parser.add_argument(
+        '--registros', action='store_true',
+        help="Mide el ordenamiento de registros de sensores: tuplas con clave vs "
+             "argsort + gather sobre columnas"
+    )
+    parser.add_argument(
+        '--seleccion', action='store_true',
+        help="Mide mediana, percentil, top-k y partial sort (introselect / montículo) "
+             "contra ordenar la lista completa"
+    )
+    parser.add_argument(
+        '--k', type=int, default=100,
+        help="Cantidad de elementos de top-k con --seleccion (default: 100)"
+    )
+    parser.add_argument(
+        '--flujo', action='store_true',
+        help="Mide datos que llegan por lotes: ListaOrdenada vs reordenar todo en cada lote"
+    )
+    parser.add_argument(
+        '--lote', type=int, default=1000,
+        help="Cantidad de elementos de cada lote con --flujo (default: 1000)"
+    )
+    parser.add_argument(
+        '--burbuja', action='store_true',
+        help="Separa el costo de Bubble Sort entre algoritmo e intérprete con Odd-Even "
+             "Sort vectorizado (NumPy), incluido el ordenamiento por lotes de ventanas"
+    )
+    parser.add_argument(
+        '--ventana', type=int, default=32,
+        help="Elementos de cada ventana del lote 2-D con --burbuja (default: 32)"
+    )
+    parser.add_argument(
+        '--adversariales', action='store_true',
+        help="Agrega los escenarios adversariales y realistas (asesino de QuickSort, "
+             "pocos únicos, diente de sierra, órgano, Zipf, cola aleatoria, NaN/inf, "
+             "cadenas con prefijo común)"
+    )
+    parser.add_argument(
+        '--semilla', type=int, default=None,
+        help="Semilla base para generar conjuntos reproducibles entre ejecuciones"
+    )
+    parser.add_argument(
+        '--cache', action='store_true',
+        help="Reutiliza los conjuntos generados desde la caché en disco (requiere --semilla)"
+    )
+    parser.add_argument(
+        '--cache-mb', type=int, default=None,
+        help="Tamaño máximo de la caché de conjuntos en MB antes de desalojar (LRU)"
+    )
+    parser.add_argument(
+        '--vectorizado', action='store_true',
+        help="Genera los conjuntos con NumPy (numpy.random.Generator con semilla)"
+    )
+    parser.add_argument(
+        '--riguroso', action='store_true',
+        help="Usa el motor de medición riguroso (GC desactivado, calentamiento, "
+             "repeticiones hasta alcanzar el IC objetivo)"
+    )
+    parser.add_argument(
+        '--presupuesto', type=float, default=None,
+        help="Segundos máximos por caso en modo riguroso; al agotarse se registra el caso como agotado"
+    )
+    parser.add_argument(
+        '--ic', type=float, default=0.05,
+        help="Semiancho objetivo del IC 95%% como fracción de la media (default: 0.05)"
+    )
+    parser.add_argument(
+        '--presupuesto-prediccion', type=float, default=None,
+        help="Omite (o mide con menos repeticiones) los casos cuyo tiempo extrapolado "
+             "de los tamaños menores excede estos segundos"
+    )
+    parser.add_argument(
+        '--memoria', action='store_true',
+        help="Registra memoria pico (tracemalloc), asignaciones netas y variación de RSS "
+             "en una ejecución extra no cronometrada por caso"
+    )
+    parser.add_argument(
+        '--contadores', action='store_true',
+        help="Cuenta comparaciones, movimientos, particiones y profundidad de recursión "
+             "en una ejecución extra no cronometrada por caso"
+    )
+    parser.add_argument(
+        '--perfil', '--profile', action='store_true',
+        help="Perfila cada caso con cProfile en una ejecución extra no cronometrada: "
+             ".pstats, pilas colapsadas para flamegraph y funciones calientes en el análisis"
+    )
+    parser.add_argument(
+        '--muestreo', action='store_true',
+        help="Con --perfil, agrega otra ejecución bajo un muestreador de pilas "
+             "(pilas completas, incluida cada profundidad de recursión)"
+    )
+    parser.add_argument(
+        '--checkpoint', default=None,
+        help="Archivo JSONL donde se agrega cada resultado al terminar su caso "
+             "(default: ../results/checkpoint_<timestamp>_<pid>.jsonl; no debe existir)"
+    )
+    parser.add_argument(
+        '--resume', nargs='?', const='latest', default=None, metavar='RUTA',
+        help="Reanuda desde un punto de control omitiendo los casos ya completados "
+             "(sin RUTA: el checkpoint más reciente de ../results/)"
+    )
+    parser.add_argument(
+        '--spec', default=None, metavar='RUTA',
+        help="Especificación del experimento (.toml o .json) con tamanos, escenarios, "
+             "repeticiones, algoritmos y semilla (default: la matriz original)"
+    )
+    parser.add_argument(
+        '--shard', default=None, metavar='i/N',
+        help="Ejecuta sólo el fragmento i de N de la matriz (requiere una semilla)"
+    )
+    parser.add_argument(
+        '--fusionar', nargs='+', default=None, metavar='RUTA',
+        help="No mide: fusiona los resultados de los fragmentos (checkpoint .jsonl o "
+             ".json) y genera los reportes del conjunto completo"
+    )
+    parser.add_argument(
+        '--graficas', action='store_true',
+        help="Dibuja las gráficas al terminar (sólo las que cambiaron desde el último dibujo)"
+    )
+    parser.add_argument(
+        '--comparar', nargs='?', const='latest', default=None, metavar='RUTA',
+        help="Compara contra una línea base (resultados_*.json o checkpoint .jsonl; sin RUTA: "
+             "el resultados_*.json más reciente) y termina con código 1 si hay regresiones"
+    )
+    parser.add_argument(
+        '--alfa', type=float, default=ALFA,
+        help=f"Nivel de significancia de la prueba U de Mann-Whitney (default: {ALFA})"
+    )
+    parser.add_argument(
+        '--umbral-regresion', type=float, default=UMBRAL_RELATIVO,
+        help="Cambio relativo mínimo de la mediana para reportar una regresión "
+             f"(default: {UMBRAL_RELATIVO})"
+    )
+    args = parser.parse_args(argv)
+    
+    # Cada modo corre su propio experimento: combinarlos descartaría opciones en silencio
+    modos = [f"--{modo}" for modo in MODOS if getattr(args, modo)]
+    if len(modos) > 1:
+        parser.error(f"{' y '.join(modos)} son excluyentes: elija un solo modo")
+    if modos:
+        for opcion in ('shard', 'resume'):
+            if getattr(args, opcion) is not None:
+                parser.error(f"--{opcion} sólo se aplica a la ejecución completa, "
+                             f"no a {modos[0]}")
+    return args
+
+
+def resolver_punto_control(args, timestamp):
+    """
+    Determina el archivo JSONL del punto de control de esta ejecución
+    
+    El nombre por defecto incluye el pid, para que dos ejecuciones iniciadas
+    en el mismo segundo no compartan archivo; sin --resume nunca se agrega a
+    un punto de control existente.
+    
+    Returns:
+        Tupla (ruta, reanudar)
+    """
+    if args.resume == 'latest':
+        existentes = sorted(glob.glob("../results/checkpoint_*.jsonl"))
+        if not existentes:
+            raise SystemExit("No hay puntos de control en ../results/ para reanudar")
+        return existentes[-1], True
+    if args.resume:
+        if not os.path.exists(args.resume):
+            raise SystemExit(f"No existe el punto de control: {args.resume}")
+        return args.resume, True
+    ruta = args.checkpoint or f"../results/checkpoint_{timestamp}_{os.getpid()}.jsonl"
+    if os.path.exists(ruta):
+        raise SystemExit(f"El punto de control {ruta} ya existe; use --resume {ruta} "
+                         "para continuarlo u otro --checkpoint")
+    return ruta, False
+
+
 def main():
     """Función principal que ejecuta todo el experimento"""
+    args = parsear_argumentos()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    ruta_checkpoint, reanudar = resolver_punto_control(args, timestamp)
+    
+    # Al reanudar sin --semilla se conserva la semilla de la ejecución original
+    if reanudar and args.semilla is None:
+        for r in leer_resultados(ruta_checkpoint):
+            if r.get('semilla') is not None:
+                args.semilla = r['semilla']
+                break
+    
+    # Matriz del experimento; --semilla tiene prioridad sobre la especificación
+    try:
+        especificacion = cargar_especificacion(args.spec)
+    except ValueError as e:
+        raise SystemExit(f"Especificación inválida: {e}")
+    if args.semilla is None:
+        args.semilla = especificacion['semilla']
+    especificacion['semilla'] = args.semilla
+    if args.adversariales:
+        especificacion['escenarios'] = (
+            especificacion['escenarios']
+            + [e for e in ESCENARIOS_ADVERSARIALES if e not in especificacion['escenarios']])
+    
+    fragmento = parsear_fragmento(args.shard) if args.shard else None
+    if fragmento and args.semilla is None:
+        raise SystemExit("--shard requiere una semilla (en la especificación o con --semilla) "
+                         "para que todas las máquinas midan los mismos datos")
     
     print("\n" + "=" * 80)
     print("EVALUACIÓN DE MÉTODOS DE ORDENAMIENTO")
-    print("Bubble Sort vs QuickSort")
+    algoritmos = ALGORITMOS_IN_PLACE if args.in_place else ALGORITMOS
+    print(" vs ".join(especificacion['algoritmos'] or algoritmos))
     print("=" * 80 + "\n")
     
     # Configuración del experimento
     print("CONFIGURACIÓN DEL EXPERIMENTO:")
     print("-" * 40)
     
-    TAMANOS = [100, 1000, 5000, 10000]
-    ESCENARIOS = ['aleatoria', 'invertida']
-    REPETICIONES = 5
+    TAMANOS = especificacion['tamanos']
+    ESCENARIOS = especificacion['escenarios']
+    REPETICIONES = especificacion['repeticiones']
     
     print(f"Tamaños a probar: {TAMANOS}")
     print(f"Escenarios: {ESCENARIOS}")
     print(f"Repeticiones por prueba: {REPETICIONES}")
-    print(f"Total de pruebas: {len(TAMANOS) * len(ESCENARIOS) * 2}")
+    print(f"Procesos en paralelo: {args.jobs}")
+    print(f"Modo in-place: {'sí' if args.in_place else 'no'}")
+    print(f"Semilla: {args.semilla}")
+    print(f"Punto de control: {ruta_checkpoint}{' (reanudando)' if reanudar else ''}")
+    
+    # La línea base se carga antes de medir para fallar pronto si no existe
+    linea_base = None
+    if args.comparar:
+        linea_base = cargar_linea_base(args.comparar)
+        print(f"Línea base: {args.comparar} ({len(linea_base)} resultados)")
+    
+    medicion = None
+    if args.riguroso or args.presupuesto is not None:
+        medicion = {'ic_relativo': args.ic, 'presupuesto_s': args.presupuesto}
+        print(f"Medición rigurosa: IC objetivo ±{args.ic:.0%}, "
+              f"presupuesto por caso: {args.presupuesto or 'sin límite'} s")
+    
+    perfilado = None
+    if args.perfil:
+        perfilado = {'directorio': f"../results/perfiles_{timestamp}", 'muestreo': args.muestreo}
+        print(f"Perfiles por caso en: {perfilado['directorio']}"
+              f"{' (con muestreador de pilas)' if args.muestreo else ''}")
+    soportado = functools.partial(caso_soportado, in_place=args.in_place)
+    casos = expandir(especificacion, algoritmos, soportado)
+    if fragmento:
+        casos = seleccionar_fragmento(casos, *fragmento)
+        print(f"Fragmento: {args.shard}")
+    print(f"Algoritmos: {especificacion['algoritmos'] or list(algoritmos)}")
+    print(f"Total de pruebas: {len(casos)}")
     print()
     
-    # Ejecutar pruebas
-    resultados = ejecutar_pruebas_completas(TAMANOS, ESCENARIOS, REPETICIONES)
+    # Cada resultado registra la máquina y la matriz de la que forma parte
+    maquina = metadatos_maquina()
+    huella = huella_especificacion(especificacion)
+    
+    def registrar(resultado):
+        """Agrega los metadatos del fragmento y guarda el resultado"""
+        resultado['maquina'] = maquina
+        resultado['especificacion'] = huella
+        if args.shard:
+            resultado['fragmento'] = args.shard
+        agregar_resultado(ruta_checkpoint, resultado)
+    
+    # Ejecutar pruebas: cada resultado se agrega al punto de control
+    os.makedirs(os.path.dirname(ruta_checkpoint) or '.', exist_ok=True)
+    if args.fusionar:
+        try:
+            fusionados, maquinas, faltantes = fusionar_resultados(
+                (leer_archivo_resultados(ruta) for ruta in args.fusionar),
+                especificacion, algoritmos, soportado
+            )
+        except ValueError as e:
+            raise SystemExit(f"No se pueden fusionar los fragmentos: {e}")
+        for r in fusionados:
+            agregar_resultado(ruta_checkpoint, r)
+        ruta_maquinas = f"../results/maquinas_{timestamp}.json"
+        with open(ruta_maquinas, 'w', encoding='utf-8') as f:
+            json.dump(maquinas, f, indent=2, ensure_ascii=False)
+        print(f"Fusionados {len(fusionados)} resultados de {len(args.fusionar)} fragmentos "
+              f"({len(maquinas)} máquinas, ver {ruta_maquinas})")
+        if faltantes:
+            print(f"⚠ Faltan {len(faltantes)} casos de la matriz, ej: {faltantes[:3]}")
+    elif args.externo:
+        for r in ejecutar_pruebas_externas(TAMANOS, ESCENARIOS, REPETICIONES,
+                                           semilla=args.semilla):
+            registrar(r)
+    elif args.adaptativo:
+        for r in ejecutar_pruebas_adaptativas(TAMANOS, ESCENARIOS, REPETICIONES, args.semilla):
+            registrar(r)
+    elif args.paralelo:
+        procesos = ([int(p) for p in args.procesos.split(',')] if args.procesos else None)
+        for r in ejecutar_pruebas_paralelas(TAMANOS, ESCENARIOS, REPETICIONES, procesos,
+                                            args.semilla):
+            registrar(r)
+    elif args.registros:
+        for r in ejecutar_pruebas_registros(TAMANOS, REPETICIONES, args.semilla):
+            registrar(r)
+    elif args.seleccion:
+        for r in ejecutar_pruebas_seleccion(TAMANOS, ESCENARIOS, REPETICIONES, args.k,
+                                            args.semilla):
+            registrar(r)
+    elif args.flujo:
+        for r in ejecutar_pruebas_flujo(TAMANOS, REPETICIONES, args.lote, args.semilla):
+            registrar(r)
+    elif args.burbuja:
+        for r in ejecutar_pruebas_burbuja(TAMANOS, ESCENARIOS, REPETICIONES, args.ventana,
+                                          args.semilla):
+            registrar(r)
+    else:
+        completados = leer_resultados(ruta_checkpoint) if reanudar else None
+        ejecutar_pruebas_completas(TAMANOS, ESCENARIOS, REPETICIONES,
+                                   jobs=args.jobs,
+                                   in_place=args.in_place,
+                                   semilla=args.semilla,
+                                   usar_cache=args.cache,
+                                   presupuesto_cache_mb=args.cache_mb,
+                                   vectorizado=args.vectorizado,
+                                   medicion=medicion,
+                                   presupuesto_prediccion_s=args.presupuesto_prediccion,
+                                   perfil_memoria=args.memoria,
+                                   contar_ops=args.contadores,
+                                   perfilado=perfilado,
+                                   al_completar=registrar,
+                                   completados=completados,
+                                   seleccion=set(casos))
+    
+    # Los reportes se generan leyendo el punto de control, no la memoria
+    resultados = ResultadosPuntoControl(ruta_checkpoint)
+    
+    # Registrar la ejecución en el almacén histórico (resultados.db)
+    almacen = conectar()
+    ejecucion_id = registrar_ejecucion(
+        almacen, resultados, datetime.strptime(timestamp, "%Y%m%d_%H%M%S"),
+        origen=os.path.abspath(f"../results/resultados_{timestamp}.json")
+    )
     
     # Mostrar tabla de resultados
     print(generar_tabla_resultados(resultados))
     
     # Generar análisis
-    analisis = generar_analisis_comparativo(resultados)
+    historico = generar_reporte_historico(almacen, resultados, ejecucion_id)
+    almacen.close()
+    
+    comparaciones = []
+    if linea_base is not None:
+        comparaciones = comparar_resultados(linea_base, resultados, args.alfa,
+                                            args.umbral_regresion)
+        historico += generar_reporte_regresion(comparaciones, args.alfa,
+                                               args.umbral_regresion)
+    
+    analisis = generar_analisis_comparativo(resultados, historico)
     print(analisis)
     
     # Guardar resultados
     print("\nGuardando resultados...")
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     guardar_resultados_json(
         resultados, 
@@ -194,9 +703,19 @@ def main():
         f.write(analisis)
     print(f"✓ Análisis guardado en: ../results/analisis_{timestamp}.txt")
     
+    # Gráficas (matplotlib sólo se importa si hay algo que dibujar)
+    if args.graficas:
+        from visualizacion import renderizar_reporte
+        renderizar_reporte(resultados, "../results")
+    
     print("\n" + "=" * 80)
     print("EXPERIMENTO COMPLETADO EXITOSAMENTE")
     print("=" * 80 + "\n")
+    
+    # Puerta de rendimiento: código de salida distinto de cero ante regresiones
+    if hay_regresiones(comparaciones):
+        print("✗ Se detectaron regresiones de rendimiento respecto a la línea base")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
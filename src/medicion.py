@@ -0,0 +1,315 @@
+"""
+Módulo de Medición Rigurosa
+Descripción: Motor de medición con perf_counter_ns, recolector de basura
+desactivado, calentamiento, lazos internos calibrados, repeticiones hasta
+alcanzar un intervalo de confianza objetivo y presupuesto de tiempo por caso;
+incluye el perfilado de memoria por caso (tracemalloc y RSS)
+"""
+
+import gc
+import os
+import sys
+import math
+import time
+import tracemalloc
+import statistics
+import multiprocessing
+
+
+# Duración mínima de una muestra; los casos más rápidos repiten el algoritmo
+# en un lazo interno hasta alcanzarla
+DURACION_MINIMA_MUESTRA_S = 0.01
+
+# Valores críticos t de Student (dos colas, 95 %) por grados de libertad
+_VALORES_T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086,
+    25: 2.060, 30: 2.042, 40: 2.021, 60: 2.000, 120: 1.980,
+}
+
+
+def valor_t_95(grados_libertad):
+    """Valor crítico t al 95 % (conservador: usa la fila tabulada inferior)"""
+    if grados_libertad < 1:
+        return float('inf')
+    filas = [gl for gl in _VALORES_T_95 if gl <= grados_libertad]
+    return _VALORES_T_95[max(filas)] if grados_libertad <= 120 else 1.960
+
+
+def semiancho_ic95(tiempos):
+    """Semiancho del intervalo de confianza al 95 % de la media"""
+    if len(tiempos) < 2:
+        return float('inf')
+    return valor_t_95(len(tiempos) - 1) * statistics.stdev(tiempos) / math.sqrt(len(tiempos))
+
+
+def medir_tiempo_riguroso(algoritmo, datos, repeticiones_min=5, repeticiones_max=50,
+                          calentamiento=1, ic_relativo=0.05, presupuesto_s=None,
+                          in_place=False):
+    """
+    Mide un algoritmo con control estadístico y, opcionalmente, límite de tiempo
+
+    Args:
+        algoritmo: Función del algoritmo a evaluar
+        datos: Lista (o buffer tipado) de datos a ordenar
+        repeticiones_min: Repeticiones mínimas antes de evaluar el intervalo
+        repeticiones_max: Repeticiones máximas aunque no se alcance el intervalo
+        calentamiento: Ejecuciones previas no medidas
+        ic_relativo: Semiancho objetivo del IC 95 % como fracción de la media
+        presupuesto_s: Tiempo máximo de pared del caso; al agotarse se detiene
+                       el proceso de medición y se conservan las muestras ya
+                       tomadas. None = sin límite (se mide en este proceso)
+        in_place: Restaurar un único buffer en lugar de copiar (ver
+                  performance_tester.medir_tiempo_algoritmo)
+
+    Returns:
+        Tupla (promedio, desviacion_estandar, tiempos_individuales, info) en
+        segundos, donde info contiene 'lazo_interno', 'ic95_segundos',
+        'calentamiento' y 'tiempo_agotado'
+
+    Raises:
+        TimeoutError: Si el presupuesto se agota antes de la primera muestra
+    """
+    parametros = (algoritmo, datos, repeticiones_min, repeticiones_max,
+                  calentamiento, ic_relativo, in_place)
+
+    if presupuesto_s is None:
+        tiempos = []
+        lazo = 1
+        for lazo, tiempo in _muestras(*parametros):
+            tiempos.append(tiempo)
+        tiempo_agotado = False
+    else:
+        lazo, tiempos, tiempo_agotado = _medir_con_presupuesto(parametros, presupuesto_s)
+        if not tiempos:
+            raise TimeoutError(f"Tiempo agotado (presupuesto de {presupuesto_s} s)")
+
+    promedio = statistics.mean(tiempos)
+    desviacion = statistics.stdev(tiempos) if len(tiempos) > 1 else 0
+
+    info = {
+        'lazo_interno': lazo,
+        'ic95_segundos': semiancho_ic95(tiempos) if len(tiempos) > 1 else None,
+        'calentamiento': calentamiento,
+        'tiempo_agotado': tiempo_agotado,
+    }
+    return promedio, desviacion, tiempos, info
+
+
+def _muestras(algoritmo, datos, repeticiones_min, repeticiones_max, calentamiento,
+              ic_relativo, in_place):
+    """
+    Generador de muestras: produce tuplas (lazo_interno, segundos_por_ejecucion)
+
+    Se detiene al alcanzar repeticiones_max o cuando, con al menos
+    repeticiones_min muestras, el IC 95 % es menor que ic_relativo.
+    """
+    from performance_tester import _nuevo_buffer
+
+    buffers = []
+
+    def preparar(cantidad):
+        """Deja listas 'cantidad' entradas sin medir el costo de prepararlas"""
+        if in_place:
+            while len(buffers) < cantidad:
+                buffers.append(_nuevo_buffer(datos))
+            for buffer in buffers[:cantidad]:
+                buffer[:] = datos
+            return buffers[:cantidad]
+        return [datos.copy() for _ in range(cantidad)]
+
+    for entrada in preparar(calentamiento):
+        algoritmo(entrada)
+
+    # Calibración: una ejecución decide cuántas veces repetir por muestra
+    lazo = 1
+    primera = _cronometrar(algoritmo, preparar(1))
+    if 0 < primera < DURACION_MINIMA_MUESTRA_S:
+        lazo = math.ceil(DURACION_MINIMA_MUESTRA_S / primera)
+
+    tiempos = []
+    while len(tiempos) < repeticiones_max:
+        tiempo = _cronometrar(algoritmo, preparar(lazo)) / lazo
+        tiempos.append(tiempo)
+        yield lazo, tiempo
+
+        if len(tiempos) >= repeticiones_min:
+            if semiancho_ic95(tiempos) <= ic_relativo * statistics.mean(tiempos):
+                break
+
+
+def _cronometrar(algoritmo, entradas):
+    """Tiempo total en segundos de ordenar todas las entradas con el GC desactivado"""
+    gc.collect()
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        inicio = time.perf_counter_ns()
+        for entrada in entradas:
+            algoritmo(entrada)
+        fin = time.perf_counter_ns()
+    finally:
+        if gc_activo:
+            gc.enable()
+    return (fin - inicio) / 1e9
+
+
+def _trabajador(conexion, parametros):
+    """Proceso hijo: envía cada muestra al padre en cuanto está lista"""
+    try:
+        for lazo, tiempo in _muestras(*parametros):
+            conexion.send(('muestra', lazo, tiempo))
+        conexion.send(('fin', None, None))
+    except Exception as e:
+        conexion.send(('error', str(e), None))
+    finally:
+        conexion.close()
+
+
+def _medir_con_presupuesto(parametros, presupuesto_s):
+    """
+    Ejecuta _muestras en un proceso hijo y lo termina si excede el presupuesto
+
+    Returns:
+        Tupla (lazo_interno, tiempos, tiempo_agotado)
+    """
+    metodos = multiprocessing.get_all_start_methods()
+    contexto = multiprocessing.get_context('fork' if 'fork' in metodos else 'spawn')
+
+    receptor, emisor = contexto.Pipe(duplex=False)
+    proceso = contexto.Process(target=_trabajador, args=(emisor, parametros), daemon=True)
+    proceso.start()
+    emisor.close()
+
+    limite = time.monotonic() + presupuesto_s
+    lazo = 1
+    tiempos = []
+    tiempo_agotado = True
+
+    try:
+        while True:
+            restante = limite - time.monotonic()
+            if restante <= 0 or not receptor.poll(restante):
+                break
+            try:
+                tipo, valor, tiempo = receptor.recv()
+            except EOFError:
+                raise RuntimeError("El proceso de medición terminó inesperadamente")
+            if tipo == 'muestra':
+                lazo = valor
+                tiempos.append(tiempo)
+            elif tipo == 'error':
+                raise RuntimeError(valor)
+            else:
+                tiempo_agotado = False
+                break
+    finally:
+        if proceso.is_alive():
+            proceso.terminate()
+        proceso.join()
+        receptor.close()
+
+    return lazo, tiempos, tiempo_agotado
+
+
+def perfilar_memoria(algoritmo, datos, in_place=False):
+    """
+    Ejecuta el algoritmo una vez, sin medir tiempo, registrando su uso de memoria
+
+    Se ejecuta aparte de las repeticiones cronometradas porque tracemalloc
+    agrega un costo considerable a cada asignación. La entrada se prepara
+    antes de iniciar el rastreo, así que sólo se cuenta lo que asigna el
+    algoritmo (incluida su propia copia de la lista, si la hace).
+
+    Args:
+        algoritmo: Función del algoritmo a evaluar
+        datos: Lista (o buffer tipado) de datos a ordenar
+        in_place: Si es True, ordena una copia del buffer (ver medir_tiempo_riguroso)
+
+    Returns:
+        Diccionario con 'memoria_pico_bytes' (pico rastreado por tracemalloc),
+        'asignaciones_netas' y 'bytes_netos' (bloques y bytes que siguen vivos
+        al terminar, normalmente el resultado) y 'rss_delta_bytes' (variación
+        de la memoria residente del proceso)
+    """
+    from performance_tester import _nuevo_buffer
+
+    entrada = _nuevo_buffer(datos) if in_place else datos.copy()
+    gc.collect()
+
+    rss_antes = _rss_actual_bytes()
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.take_snapshot()
+        # El pico no debe incluir la instantánea (reset_peak existe desde Python 3.9)
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        else:
+            # Reiniciar también descarta las trazas: la línea de base queda vacía
+            tracemalloc.stop()
+            tracemalloc.start()
+            antes = None
+        resultado = algoritmo(entrada)
+        _, pico = tracemalloc.get_traced_memory()
+        despues = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    rss_despues = _rss_actual_bytes()
+
+    # Se filtra con el rastreo detenido, para no registrar lo que asigna el filtro
+    despues = _sin_tracemalloc(despues)
+    if antes is not None:
+        diferencias = [(d.count_diff, d.size_diff)
+                       for d in despues.compare_to(_sin_tracemalloc(antes), 'filename')]
+    else:
+        diferencias = [(s.count, s.size) for s in despues.statistics('filename')]
+    del resultado
+
+    return {
+        'memoria_pico_bytes': pico,
+        'asignaciones_netas': sum(cantidad for cantidad, _ in diferencias),
+        'bytes_netos': sum(tamano for _, tamano in diferencias),
+        'rss_delta_bytes': (rss_despues - rss_antes
+                            if rss_antes is not None and rss_despues is not None else None),
+    }
+
+
+def _sin_tracemalloc(instantanea):
+    """Descarta de una instantánea los bloques que asignó el propio tracemalloc"""
+    return instantanea.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+
+
+def _rss_actual_bytes():
+    """Memoria residente actual del proceso en bytes (None si no se puede leer)"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Sin /proc sólo se conoce el pico, que sirve como cota de la variación
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+
+# Prueba del módulo
+if __name__ == "__main__":
+    from sorting_algorithms import bubble_sort, introsort
+    from data_generator import generar_lista_aleatoria
+
+    pequena = generar_lista_aleatoria(100)
+    promedio, desviacion, tiempos, info = medir_tiempo_riguroso(introsort, pequena)
+    print(f"IntroSort n=100: {promedio*1e6:.2f} µs ± {info['ic95_segundos']*1e6:.2f} "
+          f"({len(tiempos)} muestras, lazo interno {info['lazo_interno']})")
+
+    grande = generar_lista_aleatoria(20_000)
+    try:
+        promedio, _, tiempos, info = medir_tiempo_riguroso(bubble_sort, grande,
+                                                          presupuesto_s=2)
+        print(f"Bubble Sort n=20000: {promedio:.2f} s, agotado: {info['tiempo_agotado']}")
+    except TimeoutError as e:
+        print(f"Bubble Sort n=20000: {e}")
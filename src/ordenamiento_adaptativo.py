@@ -0,0 +1,202 @@
+"""
+Módulo de Ordenamiento Adaptativo
+Descripción: Inspecciona la entrada con una sonda barata y elige el algoritmo
+de ordenamiento más conveniente para su forma (sort_auto)
+"""
+
+import random
+from itertools import islice
+from sorting_algorithms import (
+    insertion_sort, merge_sort_natural, counting_sort, radix_sort, introsort,
+    quicksort_inplace
+)
+
+
+# Por debajo de este tamaño siempre se usa inserción
+UMBRAL_PEQUENO = 32
+
+# Máximo de corridas por elemento para preferir Merge Sort natural
+PROPORCION_CORRIDAS_MERGE = 1 / 16
+
+# Rango máximo de claves (en múltiplos de n) para usar Counting Sort;
+# con rangos mayores los enteros se ordenan con Radix Sort
+FACTOR_RANGO_COUNTING = 2
+
+# Proporción mínima de duplicados en la muestra para preferir la partición de tres vías
+PROPORCION_DUPLICADOS_TRES_VIAS = 0.5
+
+# Fracción máxima de pares invertidos en la muestra para preferir Merge Sort natural
+PROPORCION_INVERSIONES_MERGE = 0.05
+
+# Tamaño de la muestra para estimar duplicados e inversiones
+TAMANO_MUESTRA = 64
+
+
+def _invertir(lista):
+    """Devuelve una lista no creciente en orden ascendente"""
+    return lista[::-1]
+
+
+def _copiar(lista):
+    """Devuelve la lista ya ordenada tal cual (copia)"""
+    return lista.copy()
+
+
+def _tres_vias(lista):
+    """Ordena una copia con QuickSort de partición de tres vías (muchos duplicados)"""
+    return quicksort_inplace(lista.copy())
+
+
+# Motores disponibles para el selector: nombre -> función
+MOTORES = {
+    'ordenada': _copiar,
+    'invertir': _invertir,
+    'insercion': insertion_sort,
+    'merge_natural': merge_sort_natural,
+    'tres_vias': _tres_vias,
+    'counting': counting_sort,
+    'radix': radix_sort,
+    'introsort': introsort,
+}
+
+
+def analizar_entrada(lista, tamano_muestra=TAMANO_MUESTRA):
+    """
+    Mide la forma de la entrada en una pasada O(n) más una muestra pequeña
+
+    Args:
+        lista: Lista a analizar
+        tamano_muestra: Elementos muestreados para duplicados e inversiones
+
+    Returns:
+        Diccionario con 'n', 'descensos', 'ascensos', 'corridas', 'minimo',
+        'maximo', 'enteros', 'proporcion_duplicados' e 'inversiones_estimadas'
+        (fracción de pares invertidos en la muestra, entre 0 y 1)
+    """
+    n = len(lista)
+    perfil = {
+        'n': n,
+        'descensos': 0,
+        'ascensos': 0,
+        'corridas': 1 if n else 0,
+        'minimo': None,
+        'maximo': None,
+        'enteros': False,
+        'proporcion_duplicados': 0.0,
+        'inversiones_estimadas': 0.0,
+    }
+    if n < 2:
+        return perfil
+
+    # Una pasada: descensos (a > b) y ascensos (a < b) entre vecinos
+    descensos = 0
+    ascensos = 0
+    for a, b in zip(lista, islice(lista, 1, None)):
+        if b < a:
+            descensos += 1
+        elif a < b:
+            ascensos += 1
+
+    perfil['descensos'] = descensos
+    perfil['ascensos'] = ascensos
+    perfil['corridas'] = descensos + 1
+
+    # Muestra ordenada por posición para estimar duplicados e inversiones
+    indices = sorted(random.sample(range(n), min(tamano_muestra, n)))
+    muestra = [lista[i] for i in indices]
+
+    # La muestra descarta rápido; si pasa, se verifica la lista completa
+    perfil['enteros'] = (all(type(x) is int for x in muestra)
+                         and all(type(x) is int for x in lista))
+    perfil['proporcion_duplicados'] = 1 - len(set(muestra)) / len(muestra)
+
+    pares = len(muestra) * (len(muestra) - 1) // 2
+    inversiones = sum(
+        1
+        for i in range(len(muestra))
+        for j in range(i + 1, len(muestra))
+        if muestra[j] < muestra[i]
+    )
+    perfil['inversiones_estimadas'] = inversiones / pares if pares else 0.0
+
+    # El rango de claves sólo interesa para enteros (posible Counting Sort)
+    if perfil['enteros']:
+        perfil['minimo'] = min(lista)
+        perfil['maximo'] = max(lista)
+
+    return perfil
+
+
+def elegir_algoritmo(perfil):
+    """
+    Decide qué motor de MOTORES usar según el perfil de la entrada
+
+    Args:
+        perfil: Diccionario devuelto por analizar_entrada
+
+    Returns:
+        Nombre del motor elegido
+    """
+    n = perfil['n']
+
+    if perfil['descensos'] == 0:
+        return 'ordenada'
+    if perfil['ascensos'] == 0:
+        return 'invertir'
+    if n < UMBRAL_PEQUENO:
+        return 'insercion'
+    if perfil['corridas'] <= n * PROPORCION_CORRIDAS_MERGE:
+        return 'merge_natural'
+    if perfil['enteros'] and perfil['minimo'] is not None:
+        rango = perfil['maximo'] - perfil['minimo'] + 1
+        if rango <= FACTOR_RANGO_COUNTING * n:
+            return 'counting'
+    # Con pocos valores distintos cada partición de tres vías aparta todos
+    # los iguales al pivote de una vez
+    if perfil['proporcion_duplicados'] >= PROPORCION_DUPLICADOS_TRES_VIAS:
+        return 'tres_vias'
+    if perfil['enteros'] and perfil['minimo'] is not None:
+        return 'radix'
+    # Casi ordenada aunque con muchas corridas cortas
+    if perfil['inversiones_estimadas'] <= PROPORCION_INVERSIONES_MERGE:
+        return 'merge_natural'
+    return 'introsort'
+
+
+def sort_auto(lista, devolver_decision=False):
+    """
+    Ordena la lista con el motor más adecuado para su forma
+
+    Args:
+        lista: Lista de elementos a ordenar
+        devolver_decision: Si es True, devuelve también el motor elegido
+
+    Returns:
+        Lista ordenada en orden ascendente, o tupla (lista, nombre_motor)
+        si devolver_decision es True
+    """
+    decision = elegir_algoritmo(analizar_entrada(lista))
+    resultado = MOTORES[decision](lista)
+
+    if devolver_decision:
+        return resultado, decision
+    return resultado
+
+
+# Prueba del módulo
+if __name__ == "__main__":
+    from data_generator import (
+        generar_lista_aleatoria, generar_lista_invertida, generar_lista_casi_ordenada
+    )
+
+    casos = {
+        'aleatoria': generar_lista_aleatoria(5000),
+        'invertida': generar_lista_invertida(5000),
+        'casi_ordenada': generar_lista_casi_ordenada(5000),
+        'ordenada': list(range(5000)),
+        'flotantes': [random.random() for _ in range(5000)],
+    }
+
+    for nombre, datos in casos.items():
+        resultado, decision = sort_auto(datos, devolver_decision=True)
+        print(f"{nombre:<15} -> {decision:<15} correcto: {resultado == sorted(datos)}")
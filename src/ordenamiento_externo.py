@@ -0,0 +1,160 @@
+"""
+Módulo de Ordenamiento Externo
+Descripción: Ordena archivos binarios de números de ancho fijo que no caben en
+memoria, mediante corridas ordenadas en disco y mezcla de k vías sobre mmap
+"""
+
+import os
+import mmap
+import heapq
+import shutil
+import tempfile
+from array import array
+from sorting_algorithms import introsort_inplace
+
+
+# Elementos que se ordenan en memoria por cada corrida
+ELEMENTOS_POR_BLOQUE = 1_000_000
+
+# Elementos que cada lector de corrida decodifica por lectura del mmap
+ELEMENTOS_POR_BUFFER = 64 * 1024
+
+
+def ordenamiento_externo(ruta_entrada, ruta_salida, tipo='q',
+                         elementos_por_bloque=ELEMENTOS_POR_BLOQUE,
+                         algoritmo=introsort_inplace, directorio_temporal=None):
+    """
+    Ordena un archivo binario de números de ancho fijo con memoria acotada
+
+    Fase 1: lee el archivo por bloques, ordena cada bloque en memoria con un
+    algoritmo in-place existente y lo escribe como corrida temporal.
+    Fase 2: mezcla las k corridas con un montículo, leyéndolas a través de
+    lectores con buffer sobre mmap, y escribe el resultado por bloques.
+
+    Args:
+        ruta_entrada: Archivo con valores en formato nativo de array.array
+        ruta_salida: Archivo donde se escribe el resultado ordenado
+        tipo: Código de tipo de array.array ('q', 'i', 'd', ...)
+        elementos_por_bloque: Elementos por corrida (define la memoria usada)
+        algoritmo: Función de ordenamiento in-place sobre array.array
+        directorio_temporal: Carpeta para las corridas (por defecto la del sistema)
+
+    Returns:
+        Diccionario con 'elementos', 'corridas' y 'bytes' procesados
+    """
+    ancho = array(tipo).itemsize
+    tamano_bytes = os.path.getsize(ruta_entrada)
+
+    if tamano_bytes % ancho != 0:
+        raise ValueError(
+            f"El archivo mide {tamano_bytes} bytes, que no es múltiplo de {ancho}"
+        )
+
+    carpeta = tempfile.mkdtemp(prefix='corridas_', dir=directorio_temporal)
+    try:
+        corridas = _generar_corridas(ruta_entrada, tamano_bytes, tipo,
+                                     elementos_por_bloque, algoritmo, carpeta)
+
+        if len(corridas) == 1:
+            # Una sola corrida ya es el resultado completo
+            shutil.move(corridas[0], ruta_salida)
+        else:
+            _mezclar_corridas(corridas, ruta_salida, tipo)
+    finally:
+        shutil.rmtree(carpeta, ignore_errors=True)
+
+    return {
+        'elementos': tamano_bytes // ancho,
+        'corridas': len(corridas),
+        'bytes': tamano_bytes,
+    }
+
+
+def _generar_corridas(ruta_entrada, tamano_bytes, tipo, elementos_por_bloque,
+                      algoritmo, carpeta):
+    """Fase 1: divide la entrada en bloques ordenados escritos en disco"""
+    ancho = array(tipo).itemsize
+    bytes_por_bloque = elementos_por_bloque * ancho
+    corridas = []
+
+    if tamano_bytes == 0:
+        ruta = os.path.join(carpeta, 'corrida_0.bin')
+        open(ruta, 'wb').close()
+        return [ruta]
+
+    with open(ruta_entrada, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        for desplazamiento in range(0, tamano_bytes, bytes_por_bloque):
+            bloque = array(tipo)
+            bloque.frombytes(mapa[desplazamiento:desplazamiento + bytes_por_bloque])
+            algoritmo(bloque)
+
+            ruta = os.path.join(carpeta, f'corrida_{len(corridas)}.bin')
+            with open(ruta, 'wb') as salida:
+                bloque.tofile(salida)
+            corridas.append(ruta)
+
+    return corridas
+
+
+def _leer_corrida(ruta, tipo, elementos_por_buffer=ELEMENTOS_POR_BUFFER):
+    """Generador que recorre una corrida ordenada decodificándola por buffers"""
+    tamano_bytes = os.path.getsize(ruta)
+    if tamano_bytes == 0:
+        return
+
+    bytes_por_buffer = elementos_por_buffer * array(tipo).itemsize
+
+    with open(ruta, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        for desplazamiento in range(0, tamano_bytes, bytes_por_buffer):
+            buffer = array(tipo)
+            buffer.frombytes(mapa[desplazamiento:desplazamiento + bytes_por_buffer])
+            yield from buffer
+
+
+def _mezclar_corridas(corridas, ruta_salida, tipo,
+                      elementos_por_buffer=ELEMENTOS_POR_BUFFER):
+    """Fase 2: mezcla de k vías de las corridas hacia el archivo de salida"""
+    lectores = [_leer_corrida(ruta, tipo, elementos_por_buffer) for ruta in corridas]
+
+    with open(ruta_salida, 'wb') as salida:
+        buffer = array(tipo)
+        for valor in heapq.merge(*lectores):
+            buffer.append(valor)
+            if len(buffer) >= elementos_por_buffer:
+                buffer.tofile(salida)
+                buffer = array(tipo)
+        buffer.tofile(salida)
+
+
+def leer_archivo_binario(ruta, tipo='q'):
+    """
+    Carga completo en memoria un archivo binario de números de ancho fijo
+
+    Returns:
+        array.array con el contenido del archivo
+    """
+    datos = array(tipo)
+    with open(ruta, 'rb') as f:
+        datos.frombytes(f.read())
+    return datos
+
+
+# Prueba del módulo
+if __name__ == "__main__":
+    import random
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        entrada = os.path.join(carpeta, 'entrada.bin')
+        salida = os.path.join(carpeta, 'salida.bin')
+
+        valores = array('q', (random.randint(-10**6, 10**6) for _ in range(100_000)))
+        with open(entrada, 'wb') as f:
+            valores.tofile(f)
+
+        info = ordenamiento_externo(entrada, salida, elementos_por_bloque=10_000)
+        resultado = leer_archivo_binario(salida)
+
+        print(f"Elementos: {info['elementos']:,}  Corridas: {info['corridas']}")
+        print("Ordenado correctamente:", resultado.tolist() == sorted(valores))
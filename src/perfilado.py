@@ -0,0 +1,224 @@
+"""
+Módulo de Perfilado por Caso
+Descripción: Ejecuta una repetición extra (no cronometrada) de un caso bajo
+cProfile y, opcionalmente, bajo un muestreador de pilas en Python puro. Guarda
+el .pstats y las pilas colapsadas (formato de flamegraph.pl, speedscope o
+inferno) de cada caso, y resume las funciones con más tiempo propio
+"""
+
+import os
+import re
+import sys
+import pstats
+import cProfile
+import threading
+from collections import Counter
+
+
+# Funciones calientes que se guardan en cada resultado
+FUNCIONES_CALIENTES = 8
+
+# Intervalo del muestreador de pilas
+INTERVALO_MUESTREO_S = 0.001
+
+
+def perfilar_caso(algoritmo, datos, nombre_algo, escenario, tamano, directorio,
+                  in_place=False, muestreo=False, intervalo_s=INTERVALO_MUESTREO_S):
+    """
+    Perfila una ejecución del algoritmo y guarda sus archivos
+
+    Los archivos se nombran por caso, ej: quicksort_aleatoria_10000.pstats y
+    quicksort_aleatoria_10000.pilas.txt (y .muestreo.txt con el muestreador).
+
+    Args:
+        algoritmo: Función del algoritmo a evaluar
+        datos: Lista (o buffer tipado) de datos a ordenar
+        nombre_algo, escenario, tamano: Identificación del caso
+        directorio: Carpeta donde se guardan los perfiles
+        in_place: Si es True, ordena una copia del buffer
+        muestreo: Si es True, hace otra ejecución bajo el muestreador de pilas
+        intervalo_s: Intervalo entre muestras del muestreador
+
+    Returns:
+        Diccionario con 'perfil_pstats', 'perfil_pilas' (rutas),
+        'perfil_muestreo' (ruta, si muestreo) y 'funciones_calientes' (ver
+        funciones_calientes)
+    """
+    from performance_tester import _nuevo_buffer
+
+    os.makedirs(directorio, exist_ok=True)
+    base = os.path.join(directorio, nombre_archivo_caso(nombre_algo, escenario, tamano))
+
+    entrada = _nuevo_buffer(datos) if in_place else datos.copy()
+    perfil = cProfile.Profile()
+    perfil.runcall(algoritmo, entrada)
+
+    estadisticas = pstats.Stats(perfil)
+    # Quitar la llamada que detiene el propio perfilador
+    for funcion in [f for f in estadisticas.stats if '_lsprof' in f[2]]:
+        estadisticas.total_tt -= estadisticas.stats.pop(funcion)[2]
+    estadisticas.dump_stats(base + '.pstats')
+    informacion = {
+        'perfil_pstats': base + '.pstats',
+        'perfil_pilas': base + '.pilas.txt',
+        'funciones_calientes': funciones_calientes(estadisticas),
+    }
+    escribir_pilas(pilas_desde_pstats(estadisticas), informacion['perfil_pilas'])
+
+    if muestreo:
+        entrada = _nuevo_buffer(datos) if in_place else datos.copy()
+        pilas = muestrear_pilas(algoritmo, entrada, intervalo_s)
+        informacion['perfil_muestreo'] = base + '.muestreo.txt'
+        escribir_pilas(pilas, informacion['perfil_muestreo'])
+
+    return informacion
+
+
+def nombre_archivo_caso(nombre_algo, escenario, tamano):
+    """Nombre base de los archivos de un caso, ej: 'bubble_sort_aleatoria_1000'"""
+    algoritmo = re.sub(r'[^a-z0-9]+', '_', nombre_algo.lower()).strip('_')
+    return f"{algoritmo}_{escenario}_{tamano}"
+
+
+def funciones_calientes(estadisticas, limite=FUNCIONES_CALIENTES):
+    """
+    Funciones con más tiempo propio (sin contar sus llamadas a otras funciones)
+
+    Las comprensiones de lista aparecen como '<listcomp>' de la función que
+    las contiene; las operaciones sin llamada (ej: concatenar listas con +)
+    cuentan como tiempo propio de la función donde ocurren.
+
+    Returns:
+        Lista de diccionarios con 'funcion', 'llamadas', 'tiempo_propio_s',
+        'tiempo_acumulado_s' y 'porcentaje' (del tiempo propio total), de
+        mayor a menor tiempo propio
+    """
+    total = estadisticas.total_tt or 1
+    filas = []
+    for funcion, (_, llamadas, propio, acumulado, _) in estadisticas.stats.items():
+        filas.append({
+            'funcion': _etiqueta(funcion),
+            'llamadas': llamadas,
+            'tiempo_propio_s': propio,
+            'tiempo_acumulado_s': acumulado,
+            'porcentaje': propio / total,
+        })
+    filas.sort(key=lambda f: f['tiempo_propio_s'], reverse=True)
+    return filas[:limite]
+
+
+def pilas_desde_pstats(estadisticas):
+    """
+    Aproxima pilas colapsadas a partir del grafo de llamadas de cProfile
+
+    cProfile no guarda pilas completas: el tiempo propio de cada función se
+    asigna a la cadena de sus llamadores más costosos hasta la raíz (las
+    recursiones quedan como un solo nivel). Para pilas exactas, usar el
+    muestreador.
+
+    Returns:
+        Counter pila -> microsegundos
+    """
+    datos = estadisticas.stats
+    pilas = Counter()
+    for funcion, (_, _, propio, _, _) in datos.items():
+        microsegundos = round(propio * 1e6)
+        if microsegundos == 0:
+            continue
+        cadena = [funcion]
+        visitadas = {funcion}
+        actual = funcion
+        while True:
+            llamadores = [llamador for llamador in datos[actual][4]
+                          if llamador not in visitadas and llamador in datos]
+            if not llamadores:
+                break
+            # El llamador que más tiempo acumulado le aporta
+            actual = max(llamadores, key=lambda ll: datos[actual][4][ll][3])
+            visitadas.add(actual)
+            cadena.append(actual)
+        pilas[';'.join(_etiqueta(f) for f in reversed(cadena))] += microsegundos
+    return pilas
+
+
+def muestrear_pilas(algoritmo, entrada, intervalo_s=INTERVALO_MUESTREO_S):
+    """
+    Ejecuta el algoritmo mientras un hilo toma muestras de su pila
+
+    Muestreador en Python puro: cada intervalo_s lee el marco actual del
+    hilo principal con sys._current_frames. Captura las pilas completas
+    (cada nivel de recursión por separado) con mucho menos costo que cProfile.
+
+    Returns:
+        Counter pila -> cantidad de muestras
+    """
+    hilo = threading.get_ident()
+    pilas = Counter()
+    terminado = threading.Event()
+    # Marco desde el que se llama al algoritmo: la pila se corta ahí
+    raiz = sys._getframe()
+
+    def muestrear():
+        while not terminado.wait(intervalo_s):
+            marco = sys._current_frames().get(hilo)
+            cadena = []
+            while marco is not None and marco is not raiz:
+                codigo = marco.f_code
+                cadena.append(f"{codigo.co_name} ({os.path.basename(codigo.co_filename)}:"
+                              f"{codigo.co_firstlineno})")
+                marco = marco.f_back
+            if marco is raiz and cadena:
+                pilas[';'.join(reversed(cadena))] += 1
+
+    # Cambios de hilo más frecuentes para que el muestreador despierte a tiempo
+    intervalo_original = sys.getswitchinterval()
+    sys.setswitchinterval(min(intervalo_original, intervalo_s))
+    muestreador = threading.Thread(target=muestrear, daemon=True)
+    muestreador.start()
+    try:
+        algoritmo(entrada)
+    finally:
+        terminado.set()
+        muestreador.join()
+        sys.setswitchinterval(intervalo_original)
+    return pilas
+
+
+def escribir_pilas(pilas, ruta):
+    """Escribe pilas colapsadas: una línea 'f1;f2;f3 peso' por pila"""
+    with open(ruta, 'w', encoding='utf-8') as f:
+        for pila, peso in pilas.most_common():
+            f.write(f"{pila} {peso}\n")
+
+
+def generar_reporte_perfiles(resultados, limite=5):
+    """
+    Resume las funciones calientes de los casos perfilados del mayor tamaño
+
+    Returns:
+        String con el reporte (vacío si no hay casos perfilados)
+    """
+    perfilados = [r for r in resultados if r.get('funciones_calientes')]
+    if not perfilados:
+        return ""
+
+    mayor = max(r['tamano'] for r in perfilados)
+    reporte = f"FUNCIONES CALIENTES (cProfile, {mayor:,} elementos, por tiempo propio):\n"
+    for r in perfilados:
+        if r['tamano'] != mayor:
+            continue
+        reporte += f"   • {r['algoritmo']} ({r['escenario']}) — {r['perfil_pstats']}\n"
+        for f in r['funciones_calientes'][:limite]:
+            reporte += (f"       {f['tiempo_propio_s'] * 1000:10.3f} ms "
+                        f"({f['porcentaje']:6.1%}) {f['llamadas']:>10,} "
+                        f"llamadas  {f['funcion']}\n")
+    return reporte + "\n"
+
+
+def _etiqueta(funcion):
+    """Nombre legible de una función de pstats: 'nombre (archivo:línea)'"""
+    archivo, linea, nombre = funcion
+    if archivo == '~':
+        # Funciones integradas, ej: "<method 'append' of 'list' objects>"
+        return nombre
+    return f"{nombre} ({os.path.basename(archivo)}:{linea})"
@@ -3,28 +3,96 @@ Módulo de Pruebas de Rendimiento
 Descripción: Ejecuta y mide el rendimiento de los algoritmos de ordenamiento
 """
 
+import os
+import sys
+import time
 import timeit
+import tempfile
 import statistics
-from sorting_algorithms import bubble_sort, quicksort
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from medicion import medir_tiempo_riguroso, perfilar_memoria
+from sorting_algorithms import (
+    bubble_sort, quicksort, introsort, counting_sort, radix_sort,
+    bubble_sort_inplace, quicksort_inplace, introsort_inplace, sample_sort_paralelo,
+    nth_element, partial_sort, top_k, mediana, odd_even_sort, odd_even_sort_numpy,
+)
 
 
-def medir_tiempo_algoritmo(algoritmo, datos, repeticiones=5):
+# Algoritmos evaluados por ejecutar_pruebas_completas
+ALGORITMOS = {
+    'Bubble Sort': bubble_sort,
+    'QuickSort': quicksort,
+    'IntroSort': introsort,
+    'Counting Sort': counting_sort,
+    'Radix Sort': radix_sort
+}
+
+# Algoritmos que sólo ordenan enteros (indexan o desplazan por valor)
+ALGORITMOS_SOLO_ENTEROS = ('Counting Sort', 'Radix Sort')
+
+# Variantes in-place sobre buffers tipados (modo in_place=True)
+ALGORITMOS_IN_PLACE = {
+    'Bubble Sort': bubble_sort_inplace,
+    'QuickSort': quicksort_inplace,
+    'IntroSort': introsort_inplace
+}
+
+
+def caso_soportado(nombre_algo, escenario, in_place=False):
+    """
+    Indica si un algoritmo puede ordenar los datos de un escenario
+    
+    Los algoritmos de ALGORITMOS_SOLO_ENTEROS no admiten los escenarios de
+    flotantes o cadenas, y en modo in-place los escenarios de texto no caben
+    en un buffer tipado. Esos casos no se ejecutan, para que la matriz y las
+    gráficas no se llenen de errores conocidos.
+    
+    Args:
+        nombre_algo: Nombre del algoritmo (clave de ALGORITMOS o ALGORITMOS_IN_PLACE)
+        escenario: Nombre del escenario
+        in_place: Si el caso se mide sobre un buffer tipado
+    
+    Returns:
+        True si el caso debe ejecutarse
+    """
+    from data_generator import ESCENARIOS_NO_ENTEROS, ESCENARIOS_TEXTO
+    
+    if in_place and escenario in ESCENARIOS_TEXTO:
+        return False
+    return not (nombre_algo in ALGORITMOS_SOLO_ENTEROS and escenario in ESCENARIOS_NO_ENTEROS)
+
+
+def medir_tiempo_algoritmo(algoritmo, datos, repeticiones=5, in_place=False):
     """
     Mide el tiempo de ejecución de un algoritmo de ordenamiento
     
     Args:
         algoritmo: Función del algoritmo a evaluar
-        datos: Lista de datos a ordenar
+        datos: Lista (o buffer tipado) de datos a ordenar
         repeticiones: Número de veces que se ejecuta el algoritmo
+        in_place: Si es True, el algoritmo ordena un único buffer de trabajo
+                  que se restaura desde datos antes de cada repetición; la
+                  restauración queda fuera de la medición
     
     Returns:
         Tupla (promedio, desviacion_estandar, tiempos_individuales)
     """
     tiempos = []
     
+    # En modo in-place se reserva un solo buffer y se reutiliza
+    buffer = _nuevo_buffer(datos) if in_place else None
+    
     for _ in range(repeticiones):
-        # Crear una copia de los datos para cada repetición
-        datos_copia = datos.copy()
+        if in_place:
+            # Restaurar el contenido original sin reservar memoria nueva
+            buffer[:] = datos
+            datos_copia = buffer
+        else:
+            # Crear una copia de los datos para cada repetición
+            datos_copia = datos.copy()
         
         # Medir tiempo de ejecución usando timeit
         tiempo = timeit.timeit(
@@ -40,7 +108,21 @@ def medir_tiempo_algoritmo(algoritmo, datos, repeticiones=5):
     return promedio, desviacion, tiempos
 
 
-def ejecutar_pruebas_completas(tamanos, escenarios, repeticiones=5):
+def _nuevo_buffer(datos):
+    """Crea un buffer de trabajo del mismo tipo y tamaño que datos"""
+    if isinstance(datos, array):
+        return array(datos.typecode, datos)
+    if isinstance(datos, memoryview):
+        return memoryview(bytearray(datos.tobytes())).cast(datos.format)
+    return datos.copy()
+
+
+def ejecutar_pruebas_completas(tamanos, escenarios, repeticiones=5, jobs=1,
+                               in_place=False, semilla=None, usar_cache=False,
+                               presupuesto_cache_mb=None, vectorizado=False,
+                               medicion=None, presupuesto_prediccion_s=None,
+                               perfil_memoria=False, contar_ops=False, perfilado=None,
+                               al_completar=None, completados=None, seleccion=None):
     """
     Ejecuta todas las pruebas de rendimiento para diferentes tamaños y escenarios
     
@@ -48,79 +130,703 @@ def ejecutar_pruebas_completas(tamanos, escenarios, repeticiones=5):
         tamanos: Lista de tamaños a probar
         escenarios: Lista de escenarios a probar
         repeticiones: Número de repeticiones por prueba
+        jobs: Número de procesos en paralelo (1 = secuencial). Cada proceso
+              se fija a su propia CPU para no distorsionar los tiempos
+        in_place: Si es True, mide las variantes in-place sobre buffers
+                  array.array tipados, sin contar la copia en el tiempo
+        semilla: Semilla base para generar conjuntos reproducibles
+        usar_cache: Si es True, carga los conjuntos desde la caché en disco
+        presupuesto_cache_mb: Tamaño máximo de la caché de conjuntos
+        vectorizado: Si es True, genera los conjuntos con NumPy
+        medicion: None para la medición clásica con timeit, o diccionario de
+                  opciones para medicion.medir_tiempo_riguroso (ej:
+                  {'presupuesto_s': 60, 'ic_relativo': 0.05})
+        presupuesto_prediccion_s: Si se indica, antes de cada tamaño se
+                  extrapola el tiempo de cada (algoritmo, escenario) con los
+                  tamaños ya medidos; los casos cuya predicción excede el
+                  presupuesto se omiten, y los que sólo lo exceden por las
+                  repeticiones se miden con menos repeticiones
+        perfil_memoria: Si es True, cada caso hace una ejecución extra (no
+                  cronometrada) bajo tracemalloc para registrar su memoria
+        contar_ops: Si es True, cada caso hace una ejecución extra (no
+                  cronometrada) con contadores de comparaciones, movimientos,
+                  particiones y profundidad de recursión
+        perfilado: None, u opciones de perfilado.perfilar_caso (ej:
+                  {'directorio': '../results/perfiles', 'muestreo': True}):
+                  cada caso hace una ejecución extra (no cronometrada) bajo
+                  cProfile y guarda su .pstats y sus pilas colapsadas
+        al_completar: Función que recibe cada resultado en cuanto termina su
+                  caso (ej: para agregarlo a un punto de control). Si se
+                  indica, los resultados no se acumulan en memoria
+        completados: Resultados de una ejecución anterior (ej: leídos del
+                  punto de control); sus casos (algoritmo, escenario, tamaño,
+                  semilla) no se repiten y sus tiempos sirven para predecir
+        seleccion: Conjunto de casos (algoritmo, escenario, tamano) a ejecutar
+                  (ej: un fragmento de la especificación); None = todos
     
     Returns:
-        Lista de diccionarios con los resultados
+        Lista de diccionarios con los resultados (vacía si se indica
+        al_completar); cada uno registra la 'semilla' y la 'huella_datos'
+        (SHA-256) de su conjunto de entrada
     """
-    from data_generator import obtener_conjuntos_prueba
+    from data_generator import obtener_conjuntos_prueba, convertir_a_buffer, huella_conjunto
+    from punto_control import clave_caso
+    
+    # Sólo se generan los conjuntos que usa la selección
+    if seleccion is not None:
+        tamanos = [n for n in tamanos if any(caso[2] == n for caso in seleccion)]
+        escenarios = [e for e in escenarios if any(caso[1] == e for caso in seleccion)]
     
     # Generar todos los conjuntos de datos
     print("Generando conjuntos de datos de prueba...")
-    conjuntos = obtener_conjuntos_prueba(tamanos, escenarios)
+    conjuntos = obtener_conjuntos_prueba(tamanos, escenarios, semilla=semilla,
+                                         usar_cache=usar_cache,
+                                         presupuesto_cache_mb=presupuesto_cache_mb,
+                                         vectorizado=vectorizado,
+                                         como_buffer=in_place)
+    huellas = {nombre: huella_conjunto(datos) for nombre, datos in conjuntos.items()}
     
     # Algoritmos a probar
-    algoritmos = {
-        'Bubble Sort': bubble_sort,
-        'QuickSort': quicksort
-    }
-    
-    resultados = []
-    total_pruebas = len(conjuntos) * len(algoritmos)
-    prueba_actual = 0
+    algoritmos = ALGORITMOS_IN_PLACE if in_place else ALGORITMOS
     
-    print(f"\nIniciando {total_pruebas} pruebas de rendimiento...")
-    print("=" * 70)
+    # Casos ya registrados en una ejecución anterior (reanudación)
+    hechos = set()
+    anteriores = []
+    for resultado in completados or ():
+        hechos.add(clave_caso(resultado))
+        anteriores.append(_resumen(resultado))
     
-    # Ejecutar pruebas para cada combinación
+    # Construir la lista de casos en el orden de ejecución
+    casos = []
+    no_convertibles = []
+    omitidos = 0
     for nombre_conjunto, datos in conjuntos.items():
         # Extraer información del nombre del conjunto
         partes = nombre_conjunto.split('_')
         escenario = '_'.join(partes[:-1])
         tamano = int(partes[-1])
         
+        pendientes = []
         for nombre_algo, funcion_algo in algoritmos.items():
-            prueba_actual += 1
-            print(f"\nPrueba {prueba_actual}/{total_pruebas}")
-            print(f"Algoritmo: {nombre_algo}")
-            print(f"Escenario: {escenario}")
-            print(f"Tamaño: {tamano:,} elementos")
-            print(f"Repeticiones: {repeticiones}")
-            
+            if (nombre_algo, escenario, tamano, semilla) in hechos:
+                continue
+            if seleccion is not None and (nombre_algo, escenario, tamano) not in seleccion:
+                continue
+            if not caso_soportado(nombre_algo, escenario, in_place):
+                omitidos += 1
+                continue
+            pendientes.append((nombre_algo, funcion_algo))
+        
+        if in_place and pendientes and not isinstance(datos, array):
+            # La conversión falla con elementos no representables en el
+            # buffer; se registra como error de cada caso, no de la ejecución
             try:
-                # Medir tiempo
-                promedio, desviacion, tiempos = medir_tiempo_algoritmo(
-                    funcion_algo, 
-                    datos, 
-                    repeticiones
-                )
-                
-                # Guardar resultados
-                resultado = {
-                    'algoritmo': nombre_algo,
-                    'escenario': escenario,
-                    'tamano': tamano,
-                    'repeticiones': repeticiones,
-                    'promedio_segundos': promedio,
-                    'desviacion_estandar': desviacion,
-                    'tiempos_individuales': tiempos,
-                    'promedio_ms': promedio * 1000  # Convertir a milisegundos
-                }
-                
-                resultados.append(resultado)
-                
-                print(f"✓ Tiempo promedio: {promedio*1000:.4f} ms")
-                print(f"  Desviación estándar: {desviacion*1000:.4f} ms")
+                datos = convertir_a_buffer(datos)
+            except (TypeError, ValueError, OverflowError) as e:
+                no_convertibles.extend((nombre_algo, escenario, tamano, str(e))
+                                       for nombre_algo, _ in pendientes)
+                continue
+        
+        for nombre_algo, funcion_algo in pendientes:
+            casos.append((nombre_algo, funcion_algo, escenario, tamano, datos,
+                          repeticiones, in_place, medicion, perfil_memoria,
+                          contar_ops, perfilado))
+    
+    total_pruebas = len(casos)
+    
+    if hechos:
+        print(f"\nReanudando: {len(hechos)} casos ya completados se omiten")
+    if omitidos:
+        print(f"\nSe omiten {omitidos} casos no soportados "
+              f"(algoritmos de enteros con flotantes o cadenas, o texto en modo in-place)")
+    print(f"\nIniciando {total_pruebas} pruebas de rendimiento...")
+    print("=" * 70)
+    
+    resultados = []
+    
+    def registrar(resultado):
+        """Completa la trazabilidad del resultado y lo entrega o acumula"""
+        # Cada tiempo queda ligado a su entrada exacta
+        _agregar_huella(resultado, semilla,
+                        huellas[f"{resultado['escenario']}_{resultado['tamano']}"])
+        anteriores.append(_resumen(resultado))
+        if al_completar is not None:
+            al_completar(resultado)
+        else:
+            resultados.append(resultado)
+    
+    for nombre_algo, escenario, tamano, mensaje in no_convertibles:
+        resultado = {
+            'algoritmo': nombre_algo,
+            'escenario': escenario,
+            'tamano': tamano,
+            'repeticiones': repeticiones,
+            'in_place': in_place,
+            'error': f"Entrada no convertible a buffer tipado: {mensaje}"
+        }
+        print(f"\n✗ {nombre_algo} / {escenario} / {tamano:,}: {resultado['error']}")
+        registrar(resultado)
+    
+    # Se ejecuta por oleadas de igual tamaño para poder extrapolar cada
+    # tamaño a partir de los anteriores
+    inicio = 0
+    while inicio < len(casos):
+        fin = inicio
+        while fin < len(casos) and casos[fin][3] == casos[inicio][3]:
+            fin += 1
+        
+        oleada = casos[inicio:fin]
+        if presupuesto_prediccion_s is not None:
+            _ejecutar_con_prediccion(oleada, anteriores, jobs, presupuesto_prediccion_s,
+                                     inicio + 1, total_pruebas, registrar)
+        else:
+            _ejecutar_oleada(oleada, jobs, inicio + 1, total_pruebas, registrar)
+        inicio = fin
+    
+    print("\n" + "=" * 70)
+    print("Pruebas completadas!")
+    
+    return resultados
+
+
+def _resumen(resultado):
+    """Campos de un resultado que necesita la predicción de complejidad"""
+    return {clave: resultado[clave]
+            for clave in ('algoritmo', 'escenario', 'tamano', 'promedio_segundos', 'error')
+            if clave in resultado}
+
+
+def _ejecutar_oleada(casos, jobs, numero_inicial, total, al_completar):
+    """Ejecuta una lista de casos, en secuencia o en el pool de procesos"""
+    if jobs > 1:
+        _ejecutar_casos_paralelo(casos, jobs, numero_inicial, total, al_completar)
+        return
+    
+    for numero, caso in enumerate(casos, start=numero_inicial):
+        _imprimir_encabezado(numero, total, caso)
+        resultado = ejecutar_caso(*caso)
+        _imprimir_resultado(resultado)
+        al_completar(resultado)
+
+
+def _ejecutar_con_prediccion(casos, anteriores, jobs, presupuesto_s, numero_inicial, total,
+                             al_completar):
+    """
+    Ejecuta una oleada omitiendo o muestreando los casos que se predicen inviables
+    
+    Args:
+        casos: Casos de la oleada (todos del mismo tamaño)
+        anteriores: Resultados ya medidos, usados para la extrapolación
+        presupuesto_s: Tiempo máximo estimado por caso (todas sus repeticiones)
+        al_completar: Función que recibe cada resultado (medido u omitido)
+    """
+    from complejidad import predecir_desde_resultados
+    
+    a_ejecutar = []
+    predicciones = {}
+    for caso in casos:
+        nombre_algo, _, escenario, tamano, _, repeticiones, in_place = caso[:7]
+        prediccion = predecir_desde_resultados(anteriores, nombre_algo, escenario, tamano)
+        predicciones[(nombre_algo, escenario)] = (prediccion, repeticiones)
+        
+        if prediccion is None or prediccion * repeticiones <= presupuesto_s:
+            a_ejecutar.append(caso)
+        elif prediccion <= presupuesto_s:
+            # Muestrear: tantas repeticiones como quepan en el presupuesto
+            reducidas = max(1, int(presupuesto_s // prediccion))
+            a_ejecutar.append(caso[:5] + (reducidas,) + caso[6:])
+        else:
+            resultado = {
+                'algoritmo': nombre_algo,
+                'escenario': escenario,
+                'tamano': tamano,
+                'repeticiones': repeticiones,
+                'in_place': in_place,
+                'error': (f"Omitido: predicción de {prediccion:.1f} s excede "
+                          f"el presupuesto de {presupuesto_s} s"),
+                'omitido': True,
+                'prediccion_segundos': prediccion
+            }
+            print(f"\n⏭ {nombre_algo} / {escenario} / {tamano:,}: {resultado['error']}")
+            al_completar(resultado)
+    
+    def anotar(resultado):
+        """Agrega la predicción al resultado medido antes de entregarlo"""
+        prediccion, repeticiones = predicciones[(resultado['algoritmo'],
+                                                 resultado['escenario'])]
+        resultado['muestreado'] = (prediccion is not None
+                                   and prediccion * repeticiones > presupuesto_s)
+        resultado['prediccion_segundos'] = prediccion
+        al_completar(resultado)
+    
+    _ejecutar_oleada(a_ejecutar, jobs, numero_inicial, total, anotar)
+
+
+def ejecutar_caso(nombre_algo, funcion_algo, escenario, tamano, datos, repeticiones,
+                  in_place=False, medicion=None, perfil_memoria=False,
+                  contar_ops=False, perfilado=None):
+    """
+    Mide un caso (algoritmo, escenario, tamaño) y construye su diccionario de resultado
+    
+    Args:
+        medicion: Opciones de medicion.medir_tiempo_riguroso, o None para
+                  usar medir_tiempo_algoritmo con repeticiones fijas
+        perfil_memoria: Si es True, agrega las columnas de memoria de
+                  medicion.perfilar_memoria (ejecución aparte, sin cronometrar)
+        contar_ops: Si es True, agrega los conteos de contadores.contar_operaciones
+                  (ejecución aparte, sin cronometrar)
+        perfilado: Opciones de perfilado.perfilar_caso ('directorio' y
+                  'muestreo'), o None; agrega las rutas de los perfiles y las
+                  funciones calientes (ejecución aparte, sin cronometrar)
+    
+    Returns:
+        Diccionario con el resultado, o con la clave 'error' si la prueba falló
+    """
+    try:
+        info = {}
+        if medicion is None:
+            # Medir tiempo
+            promedio, desviacion, tiempos = medir_tiempo_algoritmo(
+                funcion_algo, 
+                datos, 
+                repeticiones,
+                in_place=in_place
+            )
+        else:
+            opciones = {'repeticiones_min': repeticiones, **medicion}
+            promedio, desviacion, tiempos, info = medir_tiempo_riguroso(
+                funcion_algo,
+                datos,
+                in_place=in_place,
+                **opciones
+            )
+        
+        resultado = {
+            'algoritmo': nombre_algo,
+            'escenario': escenario,
+            'tamano': tamano,
+            'repeticiones': len(tiempos),
+            'promedio_segundos': promedio,
+            'desviacion_estandar': desviacion,
+            'tiempos_individuales': tiempos,
+            'promedio_ms': promedio * 1000,  # Convertir a milisegundos
+            'in_place': in_place
+        }
+        
+        if info:
+            resultado['lazo_interno'] = info['lazo_interno']
+            resultado['ic95_ms'] = (info['ic95_segundos'] * 1000
+                                    if info['ic95_segundos'] is not None else None)
+            resultado['tiempo_agotado'] = info['tiempo_agotado']
+        
+        # Después de las repeticiones cronometradas, para no contaminarlas
+        if perfil_memoria:
+            resultado.update(perfilar_memoria(funcion_algo, datos, in_place=in_place))
+        if contar_ops:
+            from contadores import contar_operaciones
+            resultado.update(contar_operaciones(funcion_algo, datos))
+        if perfilado:
+            from perfilado import perfilar_caso
+            resultado.update(perfilar_caso(funcion_algo, datos, nombre_algo, escenario,
+                                           tamano, in_place=in_place, **perfilado))
+        
+        return resultado
+        
+    except Exception as e:
+        resultado = {
+            'algoritmo': nombre_algo,
+            'escenario': escenario,
+            'tamano': tamano,
+            'repeticiones': repeticiones,
+            'in_place': in_place,
+            'error': str(e)
+        }
+        if isinstance(e, TimeoutError):
+            resultado['tiempo_agotado'] = True
+        return resultado
+
+
+def _imprimir_encabezado(numero, total, caso):
+    """Imprime la descripción de una prueba antes (o al recibir) su resultado"""
+    nombre_algo, _, escenario, tamano, _, repeticiones = caso[:6]
+    print(f"\nPrueba {numero}/{total}")
+    print(f"Algoritmo: {nombre_algo}")
+    print(f"Escenario: {escenario}")
+    print(f"Tamaño: {tamano:,} elementos")
+    print(f"Repeticiones: {repeticiones}")
+
+
+def _imprimir_resultado(resultado):
+    """Imprime el resumen de un resultado"""
+    if 'error' in resultado:
+        print(f"✗ Error en la prueba: {resultado['error']}")
+    else:
+        print(f"✓ Tiempo promedio: {resultado['promedio_ms']:.4f} ms")
+        print(f"  Desviación estándar: {resultado['desviacion_estandar']*1000:.4f} ms")
+        if resultado.get('ic95_ms') is not None:
+            print(f"  IC 95%: ±{resultado['ic95_ms']:.4f} ms "
+                  f"({resultado['repeticiones']} muestras, lazo interno {resultado['lazo_interno']})")
+        if resultado.get('tiempo_agotado'):
+            print("  ⚠ Presupuesto de tiempo agotado: muestras parciales")
+        if 'memoria_pico_bytes' in resultado:
+            print(f"  Memoria pico: {resultado['memoria_pico_bytes'] / 1024:.1f} KB")
+        if 'comparaciones' in resultado:
+            print(f"  Comparaciones: {resultado['comparaciones']:,}  "
+                  f"Movimientos: {resultado['movimientos']:,}  "
+                  f"Profundidad máx.: {resultado['profundidad_max']}")
+
+
+def _cpus_disponibles():
+    """Devuelve la lista de CPUs en las que este proceso puede ejecutarse"""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _fijar_cpu_trabajador(cola_cpus):
+    """Inicializador de cada proceso: lo fija a una CPU exclusiva"""
+    cpu = cola_cpus.get()
+    if hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, {cpu})
+
+
+def _ejecutar_casos_paralelo(casos, jobs, numero_inicial=1, total=None, al_completar=None):
+    """
+    Ejecuta los casos en un pool de procesos, uno por CPU
+    
+    Los resultados se devuelven en el mismo orden que los casos, igual que
+    en la ejecución secuencial. Si se indica al_completar, cada resultado se
+    le entrega en ese orden en lugar de acumularse.
+    """
+    cpus = _cpus_disponibles()
+    jobs = max(1, min(jobs, len(cpus), len(casos)))
+    if not casos:
+        return []
+    
+    print(f"Ejecutando en paralelo con {jobs} procesos (CPUs {cpus[:jobs]})")
+    
+    with multiprocessing.Manager() as gestor:
+        cola_cpus = gestor.Queue()
+        for cpu in cpus[:jobs]:
+            cola_cpus.put(cpu)
+        
+        with ProcessPoolExecutor(max_workers=jobs,
+                                 initializer=_fijar_cpu_trabajador,
+                                 initargs=(cola_cpus,)) as pool:
+            futuros = [pool.submit(ejecutar_caso, *caso) for caso in casos]
+            
+            resultados = []
+            for numero, (caso, futuro) in enumerate(zip(casos, futuros),
+                                                    start=numero_inicial):
+                resultado = futuro.result()
+                _imprimir_encabezado(numero, total or len(casos), caso)
+                _imprimir_resultado(resultado)
+                if al_completar is not None:
+                    al_completar(resultado)
+                else:
+                    resultados.append(resultado)
+    
+    return resultados
+
+
+def _agregar_huella(resultado, semilla, huella):
+    """Registra la semilla y el hash de la entrada exacta de un resultado"""
+    resultado['semilla'] = semilla
+    resultado['huella_datos'] = huella
+
+
+def _huella_archivo(ruta, bytes_por_lectura=2**24):
+    """
+    Hash SHA-256 de un archivo binario, leído por partes
+    
+    Coincide con huella_conjunto de su contenido como array.array.
+    """
+    import hashlib
+    
+    huella = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for parte in iter(functools.partial(f.read, bytes_por_lectura), b''):
+            huella.update(parte)
+    return huella.hexdigest()
+
+
+def ejecutar_pruebas_externas(tamanos, escenarios, repeticiones=3,
+                              elementos_por_bloque=1_000_000, directorio=None, semilla=None):
+    """
+    Compara el ordenamiento externo contra QuickSort en memoria sobre archivos
+    
+    Cada conjunto se escribe a disco por bloques y cada repetición se ejecuta
+    en un proceso nuevo para medir el pico de memoria residente (RSS) propio
+    de ese caso. Si QuickSort en memoria no cabe en RAM, el caso queda
+    registrado con la clave 'error'.
+    
+    Args:
+        tamanos: Lista de tamaños a probar
+        escenarios: Lista de escenarios a probar
+        repeticiones: Número de repeticiones por prueba
+        elementos_por_bloque: Tamaño de corrida del ordenamiento externo
+        directorio: Carpeta para los archivos temporales
+        semilla: Semilla para generar los archivos
+    
+    Returns:
+        Lista de diccionarios con los resultados, incluyendo 'throughput_mb_s',
+        'rss_pico_mb', 'semilla' y 'huella_datos'
+    """
+    from data_generator import escribir_conjunto_binario
+    
+    objetivos = ['Externo (mmap)', 'QuickSort (RAM)']
+    resultados = []
+    total_pruebas = len(tamanos) * len(escenarios) * len(objetivos)
+    
+    print(f"\nIniciando {total_pruebas} pruebas de ordenamiento externo...")
+    print("=" * 70)
+    
+    contexto = multiprocessing.get_context('spawn')
+    
+    with tempfile.TemporaryDirectory(dir=directorio) as carpeta:
+        for tamano in tamanos:
+            for escenario in escenarios:
+                entrada = os.path.join(carpeta, f'{escenario}_{tamano}.bin')
+                tamano_bytes = escribir_conjunto_binario(entrada, escenario, tamano,
+                                                         semilla=semilla)
+                huella = _huella_archivo(entrada)
                 
-            except Exception as e:
-                print(f"✗ Error en la prueba: {str(e)}")
-                resultado = {
-                    'algoritmo': nombre_algo,
-                    'escenario': escenario,
-                    'tamano': tamano,
-                    'repeticiones': repeticiones,
-                    'error': str(e)
-                }
-                resultados.append(resultado)
+                for objetivo in objetivos:
+                    caso = (objetivo, None, escenario, tamano, None, repeticiones)
+                    _imprimir_encabezado(len(resultados) + 1, total_pruebas, caso)
+                    
+                    tiempos = []
+                    rss = []
+                    try:
+                        for _ in range(repeticiones):
+                            # Proceso nuevo por repetición: RSS pico aislado
+                            with ProcessPoolExecutor(max_workers=1,
+                                                     mp_context=contexto) as pool:
+                                tiempo, rss_pico = pool.submit(
+                                    _medir_archivo, objetivo, entrada, carpeta,
+                                    elementos_por_bloque
+                                ).result()
+                            tiempos.append(tiempo)
+                            rss.append(rss_pico)
+                        
+                        promedio = statistics.mean(tiempos)
+                        resultado = {
+                            'algoritmo': objetivo,
+                            'escenario': escenario,
+                            'tamano': tamano,
+                            'repeticiones': repeticiones,
+                            'promedio_segundos': promedio,
+                            'desviacion_estandar': statistics.stdev(tiempos) if len(tiempos) > 1 else 0,
+                            'tiempos_individuales': tiempos,
+                            'promedio_ms': promedio * 1000,
+                            'throughput_mb_s': tamano_bytes / 2**20 / promedio if promedio > 0 else 0,
+                            'rss_pico_mb': max(rss)
+                        }
+                    except Exception as e:
+                        resultado = {
+                            'algoritmo': objetivo,
+                            'escenario': escenario,
+                            'tamano': tamano,
+                            'repeticiones': repeticiones,
+                            'error': str(e) or type(e).__name__
+                        }
+                    _agregar_huella(resultado, semilla, huella)
+                    
+                    _imprimir_resultado(resultado)
+                    if 'error' not in resultado:
+                        print(f"  Throughput: {resultado['throughput_mb_s']:.2f} MB/s")
+                        print(f"  RSS pico: {resultado['rss_pico_mb']:.1f} MB")
+                    resultados.append(resultado)
+    
+    print("\n" + "=" * 70)
+    print("Pruebas completadas!")
+    
+    return resultados
+
+
+def _medir_archivo(objetivo, entrada, carpeta, elementos_por_bloque):
+    """
+    Ordena el archivo de entrada con el objetivo indicado (en un proceso hijo)
+    
+    Returns:
+        Tupla (segundos, rss_pico_mb) del proceso
+    """
+    from ordenamiento_externo import ordenamiento_externo, leer_archivo_binario
+    
+    salida = os.path.join(carpeta, f'salida_{os.getpid()}.bin')
+    inicio = time.perf_counter()
+    
+    if objetivo == 'Externo (mmap)':
+        ordenamiento_externo(entrada, salida,
+                             elementos_por_bloque=elementos_por_bloque,
+                             directorio_temporal=carpeta)
+    else:
+        # Cargar todo en memoria, ordenar con quicksort y escribir el resultado
+        datos = leer_archivo_binario(entrada).tolist()
+        with open(salida, 'wb') as f:
+            array('q', quicksort(datos)).tofile(f)
+    
+    tiempo = time.perf_counter() - inicio
+    os.remove(salida)
+    
+    return tiempo, _rss_pico_mb()
+
+
+def _rss_pico_mb():
+    """Pico de memoria residente del proceso actual en MB (0 si no disponible)"""
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KB; macOS reporta bytes
+    return pico / 2**20 if sys.platform == 'darwin' else pico / 1024
+
+
+def ejecutar_pruebas_adaptativas(tamanos, escenarios, repeticiones=5, semilla=None):
+    """
+    Mide sort_auto: costo de la sonda, motor elegido y aceleración frente a IntroSort
+    
+    Args:
+        tamanos: Lista de tamaños a probar
+        escenarios: Lista de escenarios a probar
+        repeticiones: Número de repeticiones por prueba
+        semilla: Semilla para generar los conjuntos
+    
+    Returns:
+        Lista de diccionarios con los resultados de 'Auto', incluyendo
+        'decision' (el motor más elegido en las repeticiones medidas),
+        'decisiones' (veces que se eligió cada motor), 'sonda_ms',
+        'aceleracion' (tiempo IntroSort / tiempo Auto), 'semilla' y 'huella_datos'
+    """
+    from collections import Counter
+    from data_generator import obtener_conjuntos_prueba, huella_conjunto
+    from ordenamiento_adaptativo import sort_auto, analizar_entrada
+    
+    print("Generando conjuntos de datos de prueba...")
+    conjuntos = obtener_conjuntos_prueba(tamanos, escenarios, semilla=semilla)
+    
+    resultados = []
+    
+    print(f"\nIniciando {len(conjuntos)} pruebas del selector adaptativo...")
+    print("=" * 70)
+    
+    for nombre_conjunto, datos in conjuntos.items():
+        partes = nombre_conjunto.split('_')
+        escenario = '_'.join(partes[:-1])
+        tamano = int(partes[-1])
+        
+        # La sonda muestrea al azar: se registra el motor de cada ejecución
+        # medida, no el de una sonda aparte que podría elegir otro
+        decisiones = Counter()
+        
+        def auto(lista):
+            ordenada, decision = sort_auto(lista, devolver_decision=True)
+            decisiones[decision] += 1
+            return ordenada
+        
+        caso = ('Auto', auto, escenario, tamano, datos, repeticiones)
+        _imprimir_encabezado(len(resultados) + 1, len(conjuntos), caso)
+        
+        resultado = ejecutar_caso(*caso)
+        
+        if 'error' not in resultado:
+            sonda, _, _ = medir_tiempo_algoritmo(analizar_entrada, datos, repeticiones)
+            base, _, _ = medir_tiempo_algoritmo(introsort, datos, repeticiones)
+            
+            resultado['decision'] = decisiones.most_common(1)[0][0]
+            resultado['decisiones'] = dict(decisiones)
+            resultado['sonda_ms'] = sonda * 1000
+            resultado['aceleracion'] = base / resultado['promedio_segundos']
+        _agregar_huella(resultado, semilla, huella_conjunto(datos))
+        
+        _imprimir_resultado(resultado)
+        if 'error' not in resultado:
+            print(f"  Motor elegido: {resultado['decision']}"
+                  + (f" (varía: {resultado['decisiones']})"
+                     if len(resultado['decisiones']) > 1 else ""))
+            print(f"  Costo de la sonda: {resultado['sonda_ms']:.4f} ms")
+            print(f"  Aceleración vs IntroSort: {resultado['aceleracion']:.2f}x")
+        resultados.append(resultado)
+    
+    print("\n" + "=" * 70)
+    print("Pruebas completadas!")
+    
+    return resultados
+
+
+def ejecutar_pruebas_paralelas(tamanos, escenarios, repeticiones=5, procesos=None,
+                               semilla=None):
+    """
+    Mide Sample Sort paralelo con distinto número de procesos contra QuickSort
+    
+    Sample Sort se fuerza a usar la ruta paralela en todos los tamaños (umbral
+    0), de modo que las curvas muestran también dónde deja de compensar.
+    
+    Args:
+        tamanos: Lista de tamaños a probar
+        escenarios: Lista de escenarios a probar
+        repeticiones: Número de repeticiones por prueba
+        procesos: Lista de números de procesos a barrer (por defecto, potencias
+                  de dos hasta las CPUs disponibles)
+        semilla: Semilla para generar los conjuntos
+    
+    Returns:
+        Lista de diccionarios con los resultados de QuickSort y de cada
+        'Sample Sort Np', estos con 'procesos', 'aceleracion' (tiempo
+        QuickSort / tiempo Sample Sort) y 'eficiencia' (aceleración / procesos);
+        todos registran 'semilla' y 'huella_datos'
+    """
+    from data_generator import obtener_conjuntos_prueba, huella_conjunto
+    
+    if procesos is None:
+        cpus = len(_cpus_disponibles())
+        procesos = sorted({2 ** k for k in range(cpus.bit_length()) if 2 ** k <= cpus} | {cpus})
+    
+    print("Generando conjuntos de datos de prueba...")
+    conjuntos = obtener_conjuntos_prueba(tamanos, escenarios, semilla=semilla)
+    
+    total = len(conjuntos) * (1 + len(procesos))
+    resultados = []
+    
+    print(f"\nIniciando {total} pruebas de Sample Sort paralelo (procesos: {procesos})...")
+    print("=" * 70)
+    
+    for nombre_conjunto, datos in conjuntos.items():
+        partes = nombre_conjunto.split('_')
+        escenario = '_'.join(partes[:-1])
+        tamano = int(partes[-1])
+        huella = huella_conjunto(datos)
+        
+        caso = ('QuickSort', quicksort, escenario, tamano, datos, repeticiones)
+        _imprimir_encabezado(len(resultados) + 1, total, caso)
+        base = ejecutar_caso(*caso)
+        _agregar_huella(base, semilla, huella)
+        _imprimir_resultado(base)
+        resultados.append(base)
+        
+        for p in procesos:
+            funcion = functools.partial(sample_sort_paralelo, procesos=p, umbral=0)
+            # Ejecución previa: crea el pool de procesos fuera de la medición
+            funcion(datos[:1000])
+            
+            caso = (f'Sample Sort {p}p', funcion, escenario, tamano, datos, repeticiones)
+            _imprimir_encabezado(len(resultados) + 1, total, caso)
+            resultado = ejecutar_caso(*caso)
+            
+            if 'error' not in resultado and 'error' not in base:
+                resultado['procesos'] = p
+                resultado['aceleracion'] = (base['promedio_segundos']
+                                            / resultado['promedio_segundos'])
+                resultado['eficiencia'] = resultado['aceleracion'] / p
+            _agregar_huella(resultado, semilla, huella)
+            
+            _imprimir_resultado(resultado)
+            if 'aceleracion' in resultado:
+                print(f"  Aceleración vs QuickSort: {resultado['aceleracion']:.2f}x "
+                      f"(eficiencia {resultado['eficiencia']:.0%})")
+            resultados.append(resultado)
     
     print("\n" + "=" * 70)
     print("Pruebas completadas!")
@@ -128,60 +834,434 @@ def ejecutar_pruebas_completas(tamanos, escenarios, repeticiones=5):
     return resultados
 
 
+def ejecutar_pruebas_registros(tamanos, repeticiones=5, semilla=None):
+    """
+    Compara ordenar registros de sensores como tuplas contra argsort + gather
+    
+    Todas las variantes ordenan por (sensor_id, timestamp), de forma estable:
+    
+    - 'Tuplas (clave)': IntroSort sobre la lista de tuplas con key=
+    - 'Argsort+gather': estructura de arreglos; argsort sobre las columnas
+      clave y reunión de cada columna con la permutación
+    - 'Argsort NumPy': lo mismo con np.lexsort (si NumPy está instalado)
+    
+    Args:
+        tamanos: Lista de cantidades de registros
+        repeticiones: Número de repeticiones por prueba
+        semilla: Semilla para generar los registros
+    
+    Returns:
+        Lista de diccionarios con escenario 'registros', 'registros_por_segundo'
+        y 'aceleracion' respecto de la variante de tuplas
+    """
+    from data_generator import generar_registros_sensores, CAMPOS_REGISTRO
+    from registros import a_columnas, ordenar_registros, ordenar_columnas
+    
+    claves = ['sensor_id', 'timestamp']
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    
+    total = len(tamanos) * (3 if np is not None else 2)
+    resultados = []
+    
+    print(f"\nIniciando {total} pruebas de ordenamiento de registros "
+          f"(claves: {', '.join(claves)})...")
+    print("=" * 70)
+    
+    for tamano in tamanos:
+        registros = generar_registros_sensores(tamano, semilla=semilla)
+        columnas = a_columnas(registros, CAMPOS_REGISTRO)
+        casos = [
+            ('Tuplas (clave)', functools.partial(ordenar_registros, campos=CAMPOS_REGISTRO,
+                                                 claves=claves), registros),
+            ('Argsort+gather', functools.partial(ordenar_columnas, claves=claves), columnas),
+        ]
+        if np is not None:
+            vectores = {campo: np.asarray(columna) for campo, columna in columnas.items()}
+            casos.append(('Argsort NumPy', functools.partial(ordenar_columnas, claves=claves),
+                          vectores))
+        
+        base = None
+        for nombre, funcion, datos in casos:
+            caso = (nombre, funcion, 'registros', tamano, datos, repeticiones)
+            _imprimir_encabezado(len(resultados) + 1, total, caso)
+            resultado = ejecutar_caso(*caso)
+            
+            if 'error' not in resultado and resultado['promedio_segundos'] > 0:
+                resultado['registros_por_segundo'] = tamano / resultado['promedio_segundos']
+                if base is None:
+                    base = resultado
+                resultado['aceleracion'] = (base['promedio_segundos']
+                                            / resultado['promedio_segundos'])
+            
+            _imprimir_resultado(resultado)
+            if 'registros_por_segundo' in resultado:
+                print(f"  Throughput: {resultado['registros_por_segundo']:,.0f} registros/s "
+                      f"({resultado['aceleracion']:.2f}x vs tuplas)")
+            resultados.append(resultado)
+    
+    print("\n" + "=" * 70)
+    print("Pruebas completadas!")
+    
+    return resultados
+
+
+def ejecutar_pruebas_seleccion(tamanos, escenarios, repeticiones=5, k=100, semilla=None):
+    """
+    Compara las operaciones de selección contra ordenar la lista completa
+    
+    Por cada conjunto se mide IntroSort (referencia) y:
+    
+    - 'Mediana': introselect
+    - 'Percentil 99': nth_element
+    - 'Top-k': montículo de k elementos
+    - 'Partial sort n/4': introselect + IntroSort de la cuarta parte menor
+    
+    Args:
+        tamanos: Lista de tamaños a probar
+        escenarios: Lista de escenarios a probar
+        repeticiones: Número de repeticiones por prueba
+        k: Cantidad de elementos de top_k
+        semilla: Semilla para generar los conjuntos
+    
+    Returns:
+        Lista de diccionarios; los de selección incluyen 'referencia' y
+        'aceleracion' (tiempo de IntroSort / tiempo de la operación)
+    """
+    from data_generator import obtener_conjuntos_prueba
+    
+    print("Generando conjuntos de datos de prueba...")
+    conjuntos = obtener_conjuntos_prueba(tamanos, escenarios, semilla=semilla)
+    
+    total = len(conjuntos) * 5
+    resultados = []
+    
+    print(f"\nIniciando {total} pruebas de selección vs ordenamiento completo...")
+    print("=" * 70)
+    
+    for nombre_conjunto, datos in conjuntos.items():
+        partes = nombre_conjunto.split('_')
+        escenario = '_'.join(partes[:-1])
+        tamano = int(partes[-1])
+        
+        caso = ('IntroSort', introsort, escenario, tamano, datos, repeticiones)
+        _imprimir_encabezado(len(resultados) + 1, total, caso)
+        base = ejecutar_caso(*caso)
+        _imprimir_resultado(base)
+        resultados.append(base)
+        
+        operaciones = [
+            ('Mediana', mediana),
+            ('Percentil 99', functools.partial(nth_element, k=int(0.99 * (tamano - 1)))),
+            (f'Top-{k}', functools.partial(top_k, k=k)),
+            ('Partial sort n/4', functools.partial(partial_sort, k=tamano // 4)),
+        ]
+        for nombre, funcion in operaciones:
+            caso = (nombre, funcion, escenario, tamano, datos, repeticiones)
+            _imprimir_encabezado(len(resultados) + 1, total, caso)
+            resultado = ejecutar_caso(*caso)
+            
+            if 'error' not in resultado and 'error' not in base:
+                resultado['referencia'] = 'IntroSort'
+                resultado['aceleracion'] = (base['promedio_segundos']
+                                            / resultado['promedio_segundos'])
+            
+            _imprimir_resultado(resultado)
+            if 'aceleracion' in resultado:
+                print(f"  Aceleración vs ordenar todo: {resultado['aceleracion']:.2f}x")
+            resultados.append(resultado)
+    
+    print("\n" + "=" * 70)
+    print("Pruebas completadas!")
+    
+    return resultados
+
+
+def ejecutar_pruebas_flujo(tamanos, repeticiones=3, tamano_lote=1000, semilla=None):
+    """
+    Compara mantener datos en flujo ordenados contra reordenar en cada lote
+    
+    Los datos llegan en lotes de tamano_lote elementos; tras cada lote la
+    colección debe estar ordenada. Al crecer el volumen crece la cantidad de
+    lotes, y reordenar todo en cada uno cuesta O(n²/lote · log n) en total.
+    Variantes:
+    
+    - 'Reordenar por lote (QuickSort)': agregar el lote y ordenar todo de nuevo
+    - 'Reordenar por lote (sorted)': ídem con list.sort (Timsort, en C)
+    - 'ListaOrdenada (lote)': ListaOrdenada.actualizar por lote
+    - 'ListaOrdenada (uno a uno)': ListaOrdenada.agregar por elemento
+    
+    Args:
+        tamanos: Lista de volúmenes totales de datos
+        repeticiones: Número de repeticiones por prueba
+        tamano_lote: Cantidad de elementos de cada lote
+        semilla: Semilla para generar los datos
+    
+    Returns:
+        Lista de diccionarios con escenario 'flujo', 'tamano_lote', 'referencia' y
+        'aceleracion' (respecto de reordenar con QuickSort)
+    """
+    from data_generator import generar_conjunto
+    
+    variantes = [
+        ('Reordenar por lote (QuickSort)', _flujo_reordenando),
+        ('Reordenar por lote (sorted)', functools.partial(_flujo_reordenando,
+                                                          ordenar=sorted)),
+        ('ListaOrdenada (lote)', _flujo_contenedor),
+        ('ListaOrdenada (uno a uno)', functools.partial(_flujo_contenedor,
+                                                        uno_a_uno=True)),
+    ]
+    total = len(tamanos) * len(variantes)
+    resultados = []
+    
+    print(f"\nIniciando {total} pruebas de datos en flujo (lotes de {tamano_lote:,})...")
+    print("=" * 70)
+    
+    for tamano in tamanos:
+        datos = generar_conjunto('aleatoria', tamano, semilla)
+        base = None
+        for nombre, funcion in variantes:
+            funcion = functools.partial(funcion, tamano_lote=tamano_lote)
+            caso = (nombre, funcion, 'flujo', tamano, datos, repeticiones)
+            _imprimir_encabezado(len(resultados) + 1, total, caso)
+            resultado = ejecutar_caso(*caso)
+            
+            if 'error' not in resultado:
+                resultado['tamano_lote'] = tamano_lote
+                base = base or resultado
+                resultado['referencia'] = base['algoritmo']
+                resultado['aceleracion'] = (base['promedio_segundos']
+                                            / resultado['promedio_segundos'])
+            
+            _imprimir_resultado(resultado)
+            if 'aceleracion' in resultado:
+                print(f"  Aceleración vs reordenar con QuickSort: "
+                      f"{resultado['aceleracion']:.2f}x")
+            resultados.append(resultado)
+    
+    print("\n" + "=" * 70)
+    print("Pruebas completadas!")
+    
+    return resultados
+
+
+def _flujo_reordenando(datos, tamano_lote, ordenar=quicksort):
+    """Recibe datos por lotes reordenando todo lo acumulado tras cada uno"""
+    acumulado = []
+    for inicio in range(0, len(datos), tamano_lote):
+        acumulado.extend(datos[inicio:inicio + tamano_lote])
+        acumulado = ordenar(acumulado)
+    return acumulado
+
+
+def _flujo_contenedor(datos, tamano_lote, uno_a_uno=False):
+    """Recibe datos por lotes en una ListaOrdenada"""
+    from contenedor_ordenado import ListaOrdenada
+    
+    contenedor = ListaOrdenada()
+    for inicio in range(0, len(datos), tamano_lote):
+        if uno_a_uno:
+            for valor in datos[inicio:inicio + tamano_lote]:
+                contenedor.agregar(valor)
+        else:
+            contenedor.actualizar(datos[inicio:inicio + tamano_lote])
+    return contenedor
+
+
+def ejecutar_pruebas_burbuja(tamanos, escenarios, repeticiones=3, ancho_ventana=32,
+                            semilla=None):
+    """
+    Separa el costo de Bubble Sort entre el algoritmo y el intérprete
+    
+    Odd-Even Sort hace las mismas comparaciones e intercambios que Bubble
+    Sort (O(n²)), pero agrupadas en fases independientes. Por cada conjunto
+    se mide:
+    
+    - 'Bubble Sort' (referencia) y 'Odd-Even (Python)': el algoritmo en el intérprete
+    - 'Odd-Even (NumPy)': el mismo algoritmo, una operación vectorizada por fase
+    - 'np.sort': un algoritmo O(n log n) en C
+    
+    Odd-Even (Python) / Odd-Even (NumPy) es la sobrecarga del intérprete;
+    Odd-Even (NumPy) / np.sort, lo que cuesta el algoritmo cuadrático en sí.
+    Además, por tamaño, se ordenan tamano // ancho_ventana ventanas de
+    lecturas de ancho_ventana elementos (escenario 'ventanas_<ancho>'): una
+    por una en Python, o todas juntas con Odd-Even (NumPy) sobre un bloque 2-D.
+    
+    Args:
+        tamanos: Lista de tamaños a probar
+        escenarios: Lista de escenarios a probar (numéricos)
+        repeticiones: Número de repeticiones por prueba
+        ancho_ventana: Elementos de cada ventana del ordenamiento por lotes
+        semilla: Semilla para generar los datos
+    
+    Returns:
+        Lista de diccionarios con 'referencia' y 'aceleracion' (respecto de
+        Bubble Sort); los de Odd-Even (NumPy) incluyen además
+        'sobrecarga_interprete' y 'costo_algoritmico'
+    """
+    import numpy as np
+    from data_generator import obtener_conjuntos_prueba
+    
+    print("Generando conjuntos de datos de prueba...")
+    conjuntos = obtener_conjuntos_prueba(tamanos, escenarios, semilla=semilla)
+    
+    grupos = []
+    for nombre_conjunto, datos in conjuntos.items():
+        partes = nombre_conjunto.split('_')
+        arreglo = np.array(datos)
+        grupos.append(('_'.join(partes[:-1]), int(partes[-1]), [
+            ('Bubble Sort', bubble_sort, datos),
+            ('Odd-Even (Python)', odd_even_sort, datos),
+            ('Odd-Even (NumPy)', odd_even_sort_numpy, arreglo),
+            ('np.sort', np.sort, arreglo),
+        ]))
+    
+    generador = np.random.default_rng(semilla)
+    for tamano in tamanos:
+        if tamano < ancho_ventana:
+            continue
+        # Lecturas de temperatura agrupadas en ventanas
+        bloque = generador.normal(20.0, 5.0, (tamano // ancho_ventana, ancho_ventana))
+        ventanas = bloque.tolist()
+        grupos.append((f'ventanas_{ancho_ventana}', bloque.size, [
+            ('Bubble Sort', functools.partial(_ordenar_ventanas, motor=bubble_sort), ventanas),
+            ('Odd-Even (Python)', functools.partial(_ordenar_ventanas, motor=odd_even_sort),
+             ventanas),
+            ('Odd-Even (NumPy)', odd_even_sort_numpy, bloque),
+            ('np.sort', functools.partial(np.sort, axis=1), bloque),
+        ]))
+    
+    total = sum(len(variantes) for _, _, variantes in grupos)
+    resultados = []
+    
+    print(f"\nIniciando {total} pruebas de Bubble Sort vs Odd-Even vectorizado...")
+    print("=" * 70)
+    
+    for escenario, tamano, variantes in grupos:
+        medidos = {}
+        for nombre, funcion, datos in variantes:
+            caso = (nombre, funcion, escenario, tamano, datos, repeticiones)
+            _imprimir_encabezado(len(resultados) + 1, total, caso)
+            resultado = ejecutar_caso(*caso)
+            if 'error' not in resultado:
+                medidos[nombre] = resultado
+            
+            base = medidos.get('Bubble Sort')
+            if base is not None and resultado is not base and 'error' not in resultado:
+                resultado['referencia'] = 'Bubble Sort'
+                resultado['aceleracion'] = (base['promedio_segundos']
+                                            / resultado['promedio_segundos'])
+            
+            _imprimir_resultado(resultado)
+            if 'aceleracion' in resultado:
+                print(f"  Aceleración vs Bubble Sort: {resultado['aceleracion']:.2f}x")
+            resultados.append(resultado)
+        
+        if all(nombre in medidos for nombre, _, _ in variantes):
+            vectorizado = medidos['Odd-Even (NumPy)']
+            vectorizado['sobrecarga_interprete'] = (medidos['Odd-Even (Python)']['promedio_segundos']
+                                                    / vectorizado['promedio_segundos'])
+            vectorizado['costo_algoritmico'] = (vectorizado['promedio_segundos']
+                                                / medidos['np.sort']['promedio_segundos'])
+            print(f"  Sobrecarga del intérprete: {vectorizado['sobrecarga_interprete']:.1f}x, "
+                  f"costo del algoritmo O(n²) vs np.sort: {vectorizado['costo_algoritmico']:.1f}x")
+    
+    print("\n" + "=" * 70)
+    print("Pruebas completadas!")
+    
+    return resultados
+
+
+def _ordenar_ventanas(ventanas, motor):
+    """Ordena cada ventana (lista) por separado con el motor dado"""
+    return [motor(ventana) for ventana in ventanas]
+
+
 def generar_tabla_resultados(resultados):
     """
     Genera una tabla formateada con los resultados
     
+    Si los resultados incluyen perfil de memoria, se agregan las columnas
+    de memoria pico (tracemalloc) y variación de RSS; si incluyen contadores
+    de operaciones, las de comparaciones, movimientos y profundidad.
+    
     Args:
         resultados: Lista de diccionarios con resultados
     
     Returns:
         String con la tabla formateada
     """
+    con_memoria = any('memoria_pico_bytes' in r for r in resultados)
+    con_contadores = any('comparaciones' in r for r in resultados)
+    ancho = 100 + 30 * con_memoria + 45 * con_contadores
+    
     # Encabezado
-    tabla = "\n" + "=" * 100 + "\n"
+    tabla = "\n" + "=" * ancho + "\n"
     tabla += "RESULTADOS DE PRUEBAS DE RENDIMIENTO\n"
-    tabla += "=" * 100 + "\n\n"
+    tabla += "=" * ancho + "\n\n"
     
     # Formato de columnas
-    formato = "{:<15} {:<20} {:<12} {:<12} {:<15} {:<15}\n"
-    
-    tabla += formato.format(
+    formato = "{:<15} {:<20} {:<12} {:<12} {:<15} {:<15}"
+    columnas = [
         "Algoritmo",
         "Escenario",
         "Tamaño",
         "Repeticiones",
         "Promedio (ms)",
         "Desv. Est. (ms)"
-    )
-    tabla += "-" * 100 + "\n"
+    ]
+    if con_memoria:
+        formato += " {:<15} {:<14}"
+        columnas += ["Mem. pico (KB)", "RSS Δ (KB)"]
+    if con_contadores:
+        formato += " {:<16} {:<16} {:<10}"
+        columnas += ["Comparaciones", "Movimientos", "Prof. máx."]
+    formato += "\n"
+    
+    tabla += formato.format(*columnas)
+    tabla += "-" * ancho + "\n"
     
     # Datos
     for r in resultados:
         if 'error' not in r:
-            tabla += formato.format(
+            valores = [
                 r['algoritmo'],
                 r['escenario'],
                 f"{r['tamano']:,}",
                 r['repeticiones'],
                 f"{r['promedio_ms']:.4f}",
                 f"{r['desviacion_estandar']*1000:.4f}"
-            )
+            ]
+            if con_memoria:
+                valores += [_kb(r.get('memoria_pico_bytes')), _kb(r.get('rss_delta_bytes'))]
+            if con_contadores:
+                valores += [f"{r.get('comparaciones', 0):,}", f"{r.get('movimientos', 0):,}",
+                            r.get('profundidad_max', '-')]
+            tabla += formato.format(*valores)
     
-    tabla += "=" * 100 + "\n"
+    tabla += "=" * ancho + "\n"
     
     return tabla
 
 
+def _kb(valor_bytes):
+    """Formatea bytes como KB (o '-' si no hay dato)"""
+    return "-" if valor_bytes is None else f"{valor_bytes / 1024:,.1f}"
+
+
 # Función principal
 if __name__ == "__main__":
-    # Configuración de pruebas
-    TAMANOS = [100, 1000, 5000, 10000]
-    ESCENARIOS = ['aleatoria', 'invertida']
-    REPETICIONES = 5
+    from especificacion import cargar_especificacion
+    
+    # Configuración de pruebas (especificación por defecto)
+    especificacion = cargar_especificacion()
     
     # Ejecutar pruebas
-    resultados = ejecutar_pruebas_completas(TAMANOS, ESCENARIOS, REPETICIONES)
+    resultados = ejecutar_pruebas_completas(especificacion['tamanos'],
+                                            especificacion['escenarios'],
+                                            especificacion['repeticiones'])
     
     # Mostrar resultados
     print(generar_tabla_resultados(resultados))
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Módulo de Puntos de Control
+Descripción: Registro JSONL de resultados, agregado y sincronizado a disco en
+cuanto termina cada caso, para reanudar ejecuciones interrumpidas y escribir
+los reportes finales leyendo del archivo en lugar de la memoria
+"""
+
+import os
+import json
+
+
+def agregar_resultado(ruta, resultado):
+    """
+    Agrega un resultado como una línea JSON y lo sincroniza a disco (fsync)
+
+    Args:
+        ruta: Archivo JSONL del punto de control
+        resultado: Diccionario con el resultado de un caso
+    """
+    linea = (json.dumps(resultado, ensure_ascii=False) + "\n").encode('utf-8')
+    with open(ruta, 'ab+') as f:
+        # Si una ejecución anterior se interrumpió a mitad de una línea, el
+        # nuevo resultado empieza en otra para no quedar unido al fragmento
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                linea = b"\n" + linea
+        f.write(linea)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def leer_resultados(ruta):
+    """
+    Recorre los resultados del punto de control sin cargarlos todos a memoria
+
+    Una última línea incompleta (proceso terminado mientras escribía) se ignora.
+
+    Yields:
+        Diccionarios de resultado en el orden en que se registraron
+    """
+    if not os.path.exists(ruta):
+        return
+
+    with open(ruta, 'r', encoding='utf-8') as f:
+        for linea in f:
+            linea = linea.strip()
+            if not linea:
+                continue
+            try:
+                yield json.loads(linea)
+            except json.JSONDecodeError:
+                # Sólo puede estar dañada la última línea
+                continue
+
+
+def leer_archivo_resultados(ruta):
+    """
+    Lee los resultados de un punto de control (.jsonl) o de un resultados_*.json
+
+    Returns:
+        Lista de resultados
+    """
+    if ruta.endswith('.jsonl'):
+        return list(leer_resultados(ruta))
+    with open(ruta, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class ResultadosPuntoControl:
+    """Vista re-iterable de los resultados de un punto de control"""
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+
+    def __iter__(self):
+        return leer_resultados(self.ruta)
+
+
+def clave_caso(resultado):
+    """Identidad de un caso para reanudar: (algoritmo, escenario, tamaño, semilla)"""
+    return (resultado['algoritmo'], resultado['escenario'], resultado['tamano'],
+            resultado.get('semilla'))
+
@@ -0,0 +1,113 @@
+"""
+Módulo de Ordenamiento de Registros
+Descripción: Ordena datos estructurados (lecturas de sensores) por una o varias
+claves, ya sea como lista de tuplas o como estructura de arreglos (una columna
+por campo): se calcula la permutación con argsort sobre las columnas clave y se
+reúne cada columna una sola vez en ese orden
+"""
+
+from array import array
+from operator import itemgetter
+from sorting_algorithms import introsort, argsort_multiple
+
+
+def a_columnas(registros, campos):
+    """
+    Convierte una lista de tuplas en una estructura de arreglos
+
+    Las columnas enteras se guardan como array('q') y las reales como
+    array('d'); las demás quedan como listas.
+
+    Args:
+        registros: Lista de tuplas con un valor por campo
+        campos: Nombres de los campos, en el orden de las tuplas
+
+    Returns:
+        Diccionario campo -> columna
+    """
+    columnas = {}
+    for posicion, campo in enumerate(campos):
+        valores = [r[posicion] for r in registros]
+        if all(type(v) is int for v in valores):
+            columnas[campo] = array('q', valores)
+        elif all(type(v) is float for v in valores):
+            columnas[campo] = array('d', valores)
+        else:
+            columnas[campo] = valores
+    return columnas
+
+
+def a_registros(columnas):
+    """Convierte una estructura de arreglos en una lista de tuplas"""
+    return list(zip(*columnas.values()))
+
+
+def ordenar_registros(registros, campos, claves, reverso=False, motor=introsort):
+    """
+    Ordena una lista de tuplas por los campos indicados (estable)
+
+    Args:
+        registros: Lista de tuplas
+        campos: Nombres de los campos, en el orden de las tuplas
+        claves: Campos por los que se ordena, del más al menos significativo
+        reverso: Booleano, o lista con uno por clave
+        motor: Algoritmo que acepta key= y reverse= (ej: introsort)
+
+    Returns:
+        Nueva lista ordenada
+    """
+    posiciones = [campos.index(clave) for clave in claves]
+    if isinstance(reverso, (list, tuple)):
+        return motor(registros, key=[itemgetter(p) for p in posiciones], reverse=reverso)
+    return motor(registros, key=itemgetter(*posiciones), reverse=reverso)
+
+
+def ordenar_columnas(columnas, claves, reverso=False, motor=None):
+    """
+    Ordena una estructura de arreglos por las columnas clave (argsort + gather)
+
+    Sólo se comparan las columnas clave; el resto se reúne con la
+    permutación sin comparar nada. Si las columnas son arreglos de NumPy se
+    usan np.lexsort y la indexación con arreglos.
+
+    Args:
+        columnas: Diccionario campo -> columna (list, array o numpy.ndarray)
+        claves: Campos por los que se ordena, del más al menos significativo
+        reverso: Booleano, o lista con uno por clave
+        motor: Algoritmo de ordenamiento para argsort (por defecto, introsort)
+
+    Returns:
+        Nuevo diccionario campo -> columna ordenada, del mismo tipo
+    """
+    reversos = reverso if isinstance(reverso, (list, tuple)) else [reverso] * len(claves)
+    primera = columnas[claves[0]]
+
+    if type(primera).__module__ == 'numpy':
+        import numpy as np
+        orden = _argsort_numpy(np, [columnas[c] for c in claves], reversos)
+        return {campo: columna[orden] for campo, columna in columnas.items()}
+
+    orden = argsort_multiple([columnas[c] for c in claves], reversos, motor)
+    ordenadas = {}
+    for campo, columna in columnas.items():
+        reunidos = map(columna.__getitem__, orden)
+        if isinstance(columna, array):
+            ordenadas[campo] = array(columna.typecode, reunidos)
+        else:
+            ordenadas[campo] = list(reunidos)
+    return ordenadas
+
+
+def _argsort_numpy(np, columnas, reversos):
+    """Permutación estable con NumPy; lexsort toma la clave principal al final"""
+    if len(columnas) == 1 and not reversos[0]:
+        return np.argsort(columnas[0], kind='stable')
+    # Descendente estable: ordenar ascendente por la clave negada
+    # (los enteros sin signo se restan de su máximo para no desbordar)
+    ajustadas = []
+    for columna, reverso in zip(columnas, reversos):
+        if reverso:
+            columna = (np.iinfo(columna.dtype).max - columna
+                       if columna.dtype.kind == 'u' else -columna)
+        ajustadas.append(columna)
+    return np.lexsort(ajustadas[::-1])
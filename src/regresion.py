@@ -0,0 +1,265 @@
+"""
+Módulo de Detección de Regresiones
+Descripción: Compara una ejecución contra una línea base caso por caso con la
+prueba U de Mann-Whitney sobre los tiempos individuales, reporta regresiones y
+mejoras significativas con su tamaño de efecto y permite cortar un despliegue
+con un código de salida distinto de cero
+"""
+
+import os
+import sys
+import glob
+import math
+import argparse
+import functools
+import statistics
+from punto_control import leer_archivo_resultados
+
+
+# Nivel de significancia y cambio relativo mínimo por defecto
+ALFA = 0.05
+UMBRAL_RELATIVO = 0.10
+
+# Hasta este total de muestras (y sin empates) se usa la distribución exacta de U
+MAX_MUESTRAS_EXACTA = 40
+
+
+def mann_whitney_u(base, nuevo):
+    """
+    Prueba U de Mann-Whitney de dos colas
+
+    Args:
+        base: Tiempos de la línea base
+        nuevo: Tiempos de la ejecución nueva
+
+    Returns:
+        Tupla (u, valor_p), donde u es el estadístico de 'nuevo' (cuántos
+        pares nuevo > base, los empates cuentan 1/2)
+    """
+    n1, n2 = len(nuevo), len(base)
+    combinados = sorted([(t, 0) for t in nuevo] + [(t, 1) for t in base])
+
+    # Rangos promedio con empates
+    rangos_nuevo = 0.0
+    correccion_empates = 0
+    i = 0
+    while i < len(combinados):
+        j = i
+        while j < len(combinados) and combinados[j][0] == combinados[i][0]:
+            j += 1
+        rango = (i + 1 + j) / 2
+        rangos_nuevo += rango * sum(1 for _, grupo in combinados[i:j] if grupo == 0)
+        empatados = j - i
+        correccion_empates += empatados ** 3 - empatados
+        i = j
+
+    u = rangos_nuevo - n1 * (n1 + 1) / 2
+
+    if correccion_empates == 0 and n1 + n2 <= MAX_MUESTRAS_EXACTA:
+        return u, _valor_p_exacto(u, n1, n2)
+
+    # Aproximación normal con corrección por empates y por continuidad
+    media = n1 * n2 / 2
+    n = n1 + n2
+    varianza = n1 * n2 / 12 * ((n + 1) - correccion_empates / (n * (n - 1)))
+    if varianza <= 0:
+        return u, 1.0
+    z = (abs(u - media) - 0.5) / math.sqrt(varianza)
+    return u, min(1.0, math.erfc(max(z, 0) / math.sqrt(2)))
+
+
+def _valor_p_exacto(u, n1, n2):
+    """Valor p de dos colas con la distribución exacta de U (sin empates)"""
+    extremo = math.floor(min(u, n1 * n2 - u) + 1e-9)
+    cola = sum(_frecuencia_u(k, n1, n2) for k in range(extremo + 1))
+    return min(1.0, 2 * cola / math.comb(n1 + n2, n1))
+
+
+@functools.lru_cache(maxsize=None)
+def _frecuencia_u(u, n1, n2):
+    """Cantidad de ordenamientos de n1 + n2 elementos con estadístico U = u"""
+    if u < 0:
+        return 0
+    if n1 == 0 or n2 == 0:
+        return 1 if u == 0 else 0
+    # El mayor elemento es del primer grupo (supera a los n2) o del segundo
+    return _frecuencia_u(u - n2, n1 - 1, n2) + _frecuencia_u(u, n1, n2 - 1)
+
+
+def delta_cliff(base, nuevo):
+    """
+    Tamaño de efecto delta de Cliff: P(nuevo > base) - P(nuevo < base)
+
+    Va de -1 (siempre más rápido) a 1 (siempre más lento); |δ| ≥ 0.474 se
+    considera un efecto grande.
+    """
+    mayores = sum(1 for x in nuevo for y in base if x > y)
+    menores = sum(1 for x in nuevo for y in base if x < y)
+    return (mayores - menores) / (len(nuevo) * len(base))
+
+
+def magnitud_efecto(delta):
+    """Clasificación habitual del delta de Cliff"""
+    delta = abs(delta)
+    if delta < 0.147:
+        return 'despreciable'
+    if delta < 0.33:
+        return 'pequeño'
+    if delta < 0.474:
+        return 'mediano'
+    return 'grande'
+
+
+def clave_comparacion(resultado):
+    """Identidad de un caso entre ejecuciones: (algoritmo, escenario, tamaño, in-place)"""
+    return (resultado['algoritmo'], resultado['escenario'], resultado['tamano'],
+            bool(resultado.get('in_place', False)))
+
+
+def comparar_resultados(base, nuevos, alfa=ALFA, umbral=UMBRAL_RELATIVO):
+    """
+    Empareja los casos de ambas ejecuciones y los compara estadísticamente
+
+    Un caso es 'regresion' (o 'mejora') si la prueba es significativa y la
+    mediana cambió más que el umbral relativo; en otro caso es 'sin_cambio'.
+    Los casos sin tiempos individuales en alguna ejecución son 'sin_datos'.
+
+    Args:
+        base: Resultados de la línea base
+        nuevos: Resultados de la ejecución nueva
+        alfa: Nivel de significancia
+        umbral: Cambio relativo mínimo de la mediana (0.10 = 10 %)
+
+    Returns:
+        Lista de diccionarios por caso con 'algoritmo', 'escenario', 'tamano',
+        'mediana_base_ms', 'mediana_nueva_ms', 'cambio_relativo', 'valor_p',
+        'delta_cliff', 'magnitud' y 'veredicto'
+    """
+    por_clave = {clave_comparacion(r): r for r in base if 'error' not in r}
+
+    comparaciones = []
+    for r in nuevos:
+        if 'error' in r:
+            continue
+        anterior = por_clave.get(clave_comparacion(r))
+        if anterior is None:
+            continue
+
+        tiempos_base = anterior.get('tiempos_individuales') or []
+        tiempos_nuevos = r.get('tiempos_individuales') or []
+        comparacion = {
+            'algoritmo': r['algoritmo'],
+            'escenario': r['escenario'],
+            'tamano': r['tamano'],
+        }
+        if len(tiempos_base) < 2 or len(tiempos_nuevos) < 2:
+            comparacion['veredicto'] = 'sin_datos'
+            comparaciones.append(comparacion)
+            continue
+
+        mediana_base = statistics.median(tiempos_base)
+        mediana_nueva = statistics.median(tiempos_nuevos)
+        cambio = mediana_nueva / mediana_base - 1 if mediana_base > 0 else 0.0
+        _, valor_p = mann_whitney_u(tiempos_base, tiempos_nuevos)
+        delta = delta_cliff(tiempos_base, tiempos_nuevos)
+
+        if valor_p < alfa and cambio > umbral:
+            veredicto = 'regresion'
+        elif valor_p < alfa and cambio < -umbral:
+            veredicto = 'mejora'
+        else:
+            veredicto = 'sin_cambio'
+
+        comparacion.update({
+            'mediana_base_ms': mediana_base * 1000,
+            'mediana_nueva_ms': mediana_nueva * 1000,
+            'cambio_relativo': cambio,
+            'valor_p': valor_p,
+            'delta_cliff': delta,
+            'magnitud': magnitud_efecto(delta),
+            'veredicto': veredicto,
+        })
+        comparaciones.append(comparacion)
+
+    return comparaciones
+
+
+def hay_regresiones(comparaciones):
+    """Indica si alguna comparación es una regresión significativa"""
+    return any(c['veredicto'] == 'regresion' for c in comparaciones)
+
+
+def generar_reporte_regresion(comparaciones, alfa=ALFA, umbral=UMBRAL_RELATIVO):
+    """
+    Genera el texto con las regresiones y mejoras significativas
+
+    Returns:
+        String con el reporte
+    """
+    reporte = (f"--- COMPARACIÓN CONTRA LÍNEA BASE (Mann-Whitney U, α = {alfa}, "
+               f"umbral ±{umbral:.0%}) ---\n\n")
+    if not comparaciones:
+        return reporte + "   • Ningún caso coincide con la línea base\n\n"
+
+    etiquetas = {'regresion': 'REGRESIÓN', 'mejora': 'MEJORA'}
+    for c in comparaciones:
+        if c['veredicto'] not in etiquetas:
+            continue
+        reporte += (f"   • {etiquetas[c['veredicto']]}: {c['algoritmo']} ({c['escenario']}, "
+                    f"{c['tamano']:,}): {c['mediana_base_ms']:.4f} → "
+                    f"{c['mediana_nueva_ms']:.4f} ms ({c['cambio_relativo']:+.1%}), "
+                    f"p = {c['valor_p']:.4f}, δ de Cliff = {c['delta_cliff']:+.2f} "
+                    f"({c['magnitud']})\n")
+
+    conteo = {v: sum(1 for c in comparaciones if c['veredicto'] == v)
+              for v in ('regresion', 'mejora', 'sin_cambio', 'sin_datos')}
+    reporte += (f"\n   Casos comparados: {len(comparaciones)} — regresiones: "
+                f"{conteo['regresion']}, mejoras: {conteo['mejora']}, sin cambio: "
+                f"{conteo['sin_cambio']}, sin tiempos individuales: {conteo['sin_datos']}\n\n")
+    return reporte
+
+
+def cargar_linea_base(ruta, excluir=None):
+    """
+    Carga los resultados de una ejecución guardada
+
+    Args:
+        ruta: resultados_*.json, checkpoint_*.jsonl, o 'latest' para el
+              resultados_*.json más reciente de ../results/
+        excluir: Ruta a ignorar al buscar el más reciente (ej: la ejecución actual)
+
+    Returns:
+        Lista de resultados
+    """
+    if ruta == 'latest':
+        candidatos = [a for a in glob.glob("../results/resultados_*.json")
+                      if excluir is None or os.path.abspath(a) != os.path.abspath(excluir)]
+        if not candidatos:
+            raise FileNotFoundError("No hay resultados_*.json en ../results/ como línea base")
+        ruta = max(candidatos)
+
+    return leer_archivo_resultados(ruta)
+
+
+def main():
+    """Compara dos archivos de resultados y termina con código 1 si hay regresiones"""
+    parser = argparse.ArgumentParser(
+        description="Compara una ejecución contra una línea base (Mann-Whitney U)"
+    )
+    parser.add_argument('base', help="Resultados de la línea base (.json o .jsonl)")
+    parser.add_argument('nuevo', help="Resultados de la ejecución nueva (.json o .jsonl)")
+    parser.add_argument('--alfa', type=float, default=ALFA,
+                        help=f"Nivel de significancia (default: {ALFA})")
+    parser.add_argument('--umbral', type=float, default=UMBRAL_RELATIVO,
+                        help=f"Cambio relativo mínimo de la mediana (default: {UMBRAL_RELATIVO})")
+    args = parser.parse_args()
+
+    comparaciones = comparar_resultados(cargar_linea_base(args.base),
+                                        cargar_linea_base(args.nuevo),
+                                        args.alfa, args.umbral)
+    print(generar_reporte_regresion(comparaciones, args.alfa, args.umbral))
+    sys.exit(1 if hay_regresiones(comparaciones) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,500 @@
+"""
+Módulo de Servicio de Ordenamiento
+Descripción: Servidor asyncio (socket Unix o TCP local) que expone los motores
+de sorting_algorithms a varios procesos productores, para que no pague cada uno
+el costo de importar y arrancar. Recibe arreglos en binario, agrupa en lotes
+las solicitudes pequeñas concurrentes, ordena en un pool de procesos y devuelve
+cada resultado apenas está listo. Incluye un generador de carga que reporta
+throughput y latencias p50/p95/p99 con distintos niveles de concurrencia
+"""
+
+import os
+import sys
+import time
+import signal
+import struct
+import asyncio
+import argparse
+import tempfile
+import multiprocessing
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Motores disponibles; en el protocolo se identifican por su posición
+MOTORES = ('introsort', 'quicksort', 'merge_sort_natural', 'radix_sort', 'counting_sort')
+
+# Tipos de elemento admitidos (8 bytes cada uno)
+TIPOS = ('q', 'd')
+
+# Solicitud: id, cantidad de elementos, motor, tipo; luego los elementos
+CABECERA_SOLICITUD = struct.Struct('<IIBc')
+
+# Respuesta: id, longitud del contenido en bytes, estado; luego el contenido
+# (los elementos ordenados, o el mensaje de error en UTF-8)
+CABECERA_RESPUESTA = struct.Struct('<IIB')
+ESTADO_OK = 0
+ESTADO_ERROR = 1
+
+PUERTO = 8765
+
+# Elementos máximos por solicitud (protege al servidor de cabeceras corruptas)
+MAX_ELEMENTOS_SOLICITUD = 50_000_000
+
+# Un lote se despacha al acumular estos elementos aunque no haya procesos libres;
+# las solicitudes de este tamaño o mayores van solas
+MAX_ELEMENTOS_LOTE = 100_000
+
+
+class ServicioOrdenamiento:
+    """
+    Agrupa solicitudes concurrentes en lotes y los ordena en un pool de procesos
+
+    Mientras haya procesos libres cada solicitud se despacha de inmediato;
+    cuando todos están ocupados las nuevas se acumulan y salen juntas en un
+    solo lote apenas se libera uno (o al llegar a MAX_ELEMENTOS_LOTE). Con
+    carga baja no se agrega latencia y con carga alta se paga un solo viaje
+    al pool por muchas solicitudes pequeñas.
+    """
+
+    def __init__(self, procesos=None, max_elementos_lote=MAX_ELEMENTOS_LOTE):
+        """
+        Args:
+            procesos: Procesos del pool (None = CPUs disponibles)
+            max_elementos_lote: Elementos a partir de los cuales un lote sale
+                                sin esperar a que se libere un proceso
+        """
+        self.procesos = procesos or len(os.sched_getaffinity(0) if hasattr(os, 'sched_getaffinity')
+                                        else range(os.cpu_count() or 1))
+        self.max_elementos_lote = max_elementos_lote
+        # forkserver: los trabajadores no heredan los sockets de las conexiones
+        # (con fork, un cliente que cierra no llegaría al fin del flujo)
+        self._pool = ProcessPoolExecutor(self.procesos,
+                                         mp_context=multiprocessing.get_context('forkserver'),
+                                         initializer=_iniciar_trabajador)
+        self._pendientes = []
+        self._elementos_pendientes = 0
+        self._en_vuelo = 0
+        # Lotes enviados al pool y aún no terminados
+        self._trabajos = set()
+        # Tareas de las conexiones abiertas, para esperarlas al detener el servidor
+        self.conexiones = set()
+        self.estadisticas = {'solicitudes': 0, 'lotes': 0, 'elementos': 0}
+
+    async def ordenar(self, motor, tipo, contenido):
+        """
+        Ordena un arreglo codificado
+
+        Args:
+            motor: Nombre del motor (ver MOTORES)
+            tipo: Código de tipo de array ('q' o 'd')
+            contenido: Bytes de los elementos
+
+        Returns:
+            Bytes de los elementos ordenados
+
+        Raises:
+            ValueError: Si el motor falla con estos datos
+        """
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        elementos = len(contenido) // 8
+        self.estadisticas['solicitudes'] += 1
+        self.estadisticas['elementos'] += elementos
+
+        if elementos >= self.max_elementos_lote:
+            self._despachar([((motor, tipo, contenido), futuro)])
+        else:
+            self._pendientes.append(((motor, tipo, contenido), futuro))
+            self._elementos_pendientes += elementos
+            if (self._en_vuelo < self.procesos
+                    or self._elementos_pendientes >= self.max_elementos_lote):
+                self._despachar_pendientes()
+
+        return await futuro
+
+    async def calentar(self):
+        """Arranca los procesos del pool antes de la primera solicitud"""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _ordenar_lote, [])
+                               for _ in range(self.procesos)))
+
+    def cerrar(self):
+        """Detiene el pool de procesos, descartando los lotes que no empezaron"""
+        if sys.version_info >= (3, 9):
+            self._pool.shutdown(cancel_futures=True)
+            return
+        # Python 3.8 no tiene cancel_futures: se cancela cada lote que no empezó
+        for trabajo in list(self._trabajos):
+            trabajo.cancel()
+        self._pool.shutdown()
+
+    def _despachar_pendientes(self):
+        """Envía las solicitudes acumuladas como un solo lote"""
+        if self._pendientes:
+            lote, self._pendientes = self._pendientes, []
+            self._elementos_pendientes = 0
+            self._despachar(lote)
+
+    def _despachar(self, lote):
+        """Envía un lote al pool y reparte los resultados al terminar"""
+        self._en_vuelo += 1
+        self.estadisticas['lotes'] += 1
+        concurrente = self._pool.submit(_ordenar_lote, [solicitud for solicitud, _ in lote])
+        self._trabajos.add(concurrente)
+        concurrente.add_done_callback(self._trabajos.discard)
+        trabajo = asyncio.wrap_future(concurrente)
+        trabajo.add_done_callback(lambda t: self._lote_terminado(t, lote))
+
+    def _lote_terminado(self, trabajo, lote):
+        """Resuelve los futuros del lote y despacha lo acumulado mientras tanto"""
+        self._en_vuelo -= 1
+        if trabajo.cancelled() or trabajo.exception() is not None:
+            error = trabajo.exception() if not trabajo.cancelled() else asyncio.CancelledError()
+            for _, futuro in lote:
+                if not futuro.done():
+                    futuro.set_exception(error)
+        else:
+            for (ok, valor), (_, futuro) in zip(trabajo.result(), lote):
+                if futuro.done():
+                    continue
+                if ok:
+                    futuro.set_result(valor)
+                else:
+                    futuro.set_exception(ValueError(valor))
+        self._despachar_pendientes()
+
+
+def _iniciar_trabajador():
+    """Los trabajadores ignoran Ctrl+C: el servidor los detiene al cerrar el pool"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Los motores se importan una sola vez por proceso, no en cada solicitud
+    import sorting_algorithms
+
+
+def _ordenar_lote(solicitudes):
+    """
+    Ordena un lote de solicitudes en un proceso del pool
+
+    Returns:
+        Lista de (True, bytes ordenados) o (False, mensaje de error)
+    """
+    import sorting_algorithms
+
+    resultados = []
+    for motor, tipo, contenido in solicitudes:
+        try:
+            datos = array(tipo, contenido).tolist()
+            ordenados = getattr(sorting_algorithms, motor)(datos)
+            resultados.append((True, array(tipo, ordenados).tobytes()))
+        except Exception as e:
+            resultados.append((False, f"{type(e).__name__}: {e}"))
+    return resultados
+
+
+async def _atender_conexion(servicio, reader, writer):
+    """Lee solicitudes de una conexión y responde cada una al terminar"""
+    escritura = asyncio.Lock()
+    tareas = set()
+    servicio.conexiones.add(asyncio.current_task())
+
+    async def responder(id_solicitud, motor, tipo, contenido):
+        try:
+            respuesta = await servicio.ordenar(motor, tipo, contenido)
+            estado = ESTADO_OK
+        except Exception as e:
+            respuesta = str(e).encode('utf-8')
+            estado = ESTADO_ERROR
+        async with escritura:
+            writer.write(CABECERA_RESPUESTA.pack(id_solicitud, len(respuesta), estado)
+                         + respuesta)
+            await writer.drain()
+
+    try:
+        while True:
+            try:
+                cabecera = await reader.readexactly(CABECERA_SOLICITUD.size)
+            except asyncio.IncompleteReadError:
+                break
+            id_solicitud, n, codigo_motor, tipo = CABECERA_SOLICITUD.unpack(cabecera)
+            tipo = tipo.decode('ascii')
+            if (n > MAX_ELEMENTOS_SOLICITUD or codigo_motor >= len(MOTORES)
+                    or tipo not in TIPOS):
+                # Cabecera inválida: el resto del flujo no es confiable
+                mensaje = (f"Solicitud inválida: {n} elementos, motor {codigo_motor}, "
+                           f"tipo '{tipo}'").encode('utf-8')
+                async with escritura:
+                    writer.write(CABECERA_RESPUESTA.pack(id_solicitud, len(mensaje),
+                                                         ESTADO_ERROR) + mensaje)
+                    await writer.drain()
+                break
+            contenido = await reader.readexactly(8 * n)
+            tarea = asyncio.create_task(
+                responder(id_solicitud, MOTORES[codigo_motor], tipo, contenido))
+            tareas.add(tarea)
+            tarea.add_done_callback(tareas.discard)
+        if tareas:
+            await asyncio.gather(*tareas, return_exceptions=True)
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        servicio.conexiones.discard(asyncio.current_task())
+        writer.close()
+
+
+async def iniciar_servidor(servicio, ruta_unix=None, host='127.0.0.1', puerto=PUERTO):
+    """
+    Inicia el servidor sobre un socket Unix o TCP local
+
+    Returns:
+        asyncio.Server (usar 'async with' o close() para detenerlo)
+    """
+    def atender(reader, writer):
+        return _atender_conexion(servicio, reader, writer)
+
+    if ruta_unix:
+        return await asyncio.start_unix_server(atender, path=ruta_unix)
+    return await asyncio.start_server(atender, host, puerto)
+
+
+class ClienteOrdenamiento:
+    """
+    Cliente del servicio; admite varias solicitudes en curso por conexión
+
+    Ejemplo:
+        cliente = await ClienteOrdenamiento.conectar(ruta_unix='/tmp/ordenar.sock')
+        ordenados = await cliente.ordenar([5, 3, 9], motor='introsort')
+        await cliente.cerrar()
+    """
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._siguiente_id = 0
+        self._esperando = {}
+        self._lector = asyncio.create_task(self._leer_respuestas())
+
+    @classmethod
+    async def conectar(cls, ruta_unix=None, host='127.0.0.1', puerto=PUERTO):
+        """Abre una conexión con el servicio"""
+        if ruta_unix:
+            reader, writer = await asyncio.open_unix_connection(ruta_unix)
+        else:
+            reader, writer = await asyncio.open_connection(host, puerto)
+        return cls(reader, writer)
+
+    async def ordenar(self, datos, motor='introsort', tipo=None):
+        """
+        Ordena datos en el servicio
+
+        Args:
+            datos: Lista de enteros o de reales, o array.array 'q'/'d'
+            motor: Nombre del motor (ver MOTORES)
+            tipo: 'q' o 'd' (None = deducido de los datos)
+
+        Returns:
+            array.array con los datos ordenados
+
+        Raises:
+            ValueError: Si el servicio responde con un error
+        """
+        if tipo is None:
+            tipo = getattr(datos, 'typecode', None) or (
+                'd' if any(isinstance(x, float) for x in datos) else 'q')
+        contenido = datos.tobytes() if isinstance(datos, array) else array(tipo, datos).tobytes()
+
+        id_solicitud = self._siguiente_id
+        self._siguiente_id = (self._siguiente_id + 1) % 2 ** 32
+        futuro = asyncio.get_running_loop().create_future()
+        self._esperando[id_solicitud] = (futuro, tipo)
+
+        self._writer.write(CABECERA_SOLICITUD.pack(id_solicitud, len(contenido) // 8,
+                                                   MOTORES.index(motor), tipo.encode('ascii'))
+                           + contenido)
+        await self._writer.drain()
+        return await futuro
+
+    async def cerrar(self):
+        """Cierra la conexión"""
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._lector.cancel()
+
+    async def _leer_respuestas(self):
+        """Resuelve las solicitudes en curso a medida que llegan sus respuestas"""
+        try:
+            while True:
+                cabecera = await self._reader.readexactly(CABECERA_RESPUESTA.size)
+                id_solicitud, longitud, estado = CABECERA_RESPUESTA.unpack(cabecera)
+                contenido = await self._reader.readexactly(longitud)
+                futuro, tipo = self._esperando.pop(id_solicitud)
+                if estado == ESTADO_OK:
+                    futuro.set_result(array(tipo, contenido))
+                else:
+                    futuro.set_exception(ValueError(contenido.decode('utf-8')))
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            for futuro, _ in self._esperando.values():
+                if not futuro.done():
+                    futuro.set_exception(ConnectionError(f"Conexión cerrada: {e}"))
+
+
+def percentil(latencias, p):
+    """Percentil p (0-100) por rango más cercano, sin ordenar la lista (introselect)"""
+    from sorting_algorithms import nth_element
+    return nth_element(latencias, round(p / 100 * (len(latencias) - 1)))
+
+
+async def generar_carga(concurrencia, solicitudes, tamano, motor='introsort',
+                        ruta_unix=None, host='127.0.0.1', puerto=PUERTO, semilla=None):
+    """
+    Envía solicitudes desde varios productores concurrentes y mide latencias
+
+    Cada productor usa su propia conexión y envía una solicitud tras otra,
+    como un proceso independiente del robot.
+
+    Args:
+        concurrencia: Cantidad de productores simultáneos
+        solicitudes: Total de solicitudes a enviar
+        tamano: Elementos por solicitud
+        motor: Motor a usar (ver MOTORES)
+        semilla: Semilla para generar los datos
+
+    Returns:
+        Diccionario con 'concurrencia', 'solicitudes', 'duracion_s',
+        'solicitudes_por_segundo', 'elementos_por_segundo', 'p50_ms',
+        'p95_ms', 'p99_ms' y 'errores'
+    """
+    from data_generator import generar_conjunto
+
+    datos = array('q', generar_conjunto('aleatoria', tamano, semilla))
+    latencias = []
+    errores = 0
+    restantes = solicitudes
+
+    async def productor():
+        nonlocal restantes, errores
+        cliente = await ClienteOrdenamiento.conectar(ruta_unix, host, puerto)
+        try:
+            while restantes > 0:
+                restantes -= 1
+                inicio = time.perf_counter()
+                try:
+                    await cliente.ordenar(datos, motor)
+                    latencias.append(time.perf_counter() - inicio)
+                except ValueError:
+                    errores += 1
+        finally:
+            await cliente.cerrar()
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(productor() for _ in range(concurrencia)))
+    duracion = time.perf_counter() - inicio
+
+    return {
+        'concurrencia': concurrencia,
+        'solicitudes': len(latencias),
+        'duracion_s': duracion,
+        'solicitudes_por_segundo': len(latencias) / duracion,
+        'elementos_por_segundo': len(latencias) * tamano / duracion,
+        'p50_ms': percentil(latencias, 50) * 1000 if latencias else None,
+        'p95_ms': percentil(latencias, 95) * 1000 if latencias else None,
+        'p99_ms': percentil(latencias, 99) * 1000 if latencias else None,
+        'errores': errores,
+    }
+
+
+def generar_reporte_carga(mediciones, tamano, motor):
+    """Tabla de throughput y latencias por nivel de concurrencia"""
+    reporte = (f"\nServicio de ordenamiento: {motor}, {tamano:,} elementos por solicitud\n"
+               f"{'Concurrencia':>12} {'Solicitudes/s':>14} {'Elementos/s':>14} "
+               f"{'p50 (ms)':>10} {'p95 (ms)':>10} {'p99 (ms)':>10} {'Errores':>8}\n")
+    for m in mediciones:
+        # Sin solicitudes exitosas no hay latencias
+        p50, p95, p99 = (f"{m[clave]:>10.3f}" if m[clave] is not None else f"{'-':>10}"
+                         for clave in ('p50_ms', 'p95_ms', 'p99_ms'))
+        reporte += (f"{m['concurrencia']:>12} {m['solicitudes_por_segundo']:>14,.1f} "
+                    f"{m['elementos_por_segundo']:>14,.0f} {p50} {p95} {p99} "
+                    f"{m['errores']:>8}\n")
+    return reporte
+
+
+async def _servir(args):
+    """Atiende solicitudes hasta recibir Ctrl+C"""
+    servicio = ServicioOrdenamiento(args.procesos)
+    await servicio.calentar()
+    servidor = await iniciar_servidor(servicio, args.unix, args.host, args.puerto)
+    destino = args.unix or f"{args.host}:{args.puerto}"
+    print(f"Servicio de ordenamiento en {destino} ({servicio.procesos} procesos)")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        servicio.cerrar()
+
+
+async def _carga(args):
+    """Ejecuta el generador de carga, levantando un servidor local si se pide"""
+    servicio = servidor = None
+    ruta_unix = args.unix
+    if args.local:
+        ruta_unix = ruta_unix or os.path.join(tempfile.mkdtemp(), 'ordenar.sock')
+        servicio = ServicioOrdenamiento(args.procesos)
+        await servicio.calentar()
+        servidor = await iniciar_servidor(servicio, ruta_unix)
+
+    try:
+        mediciones = []
+        for concurrencia in (int(c) for c in args.concurrencia.split(',')):
+            mediciones.append(await generar_carga(concurrencia, args.solicitudes, args.tamano,
+                                                  args.motor, ruta_unix, args.host,
+                                                  args.puerto, args.semilla))
+        print(generar_reporte_carga(mediciones, args.tamano, args.motor))
+        if servicio is not None:
+            e = servicio.estadisticas
+            print(f"Lotes despachados: {e['lotes']:,} para {e['solicitudes']:,} solicitudes "
+                  f"({e['solicitudes'] / max(e['lotes'], 1):.1f} por lote)")
+    finally:
+        if servidor is not None:
+            servidor.close()
+            # Los clientes ya cerraron: las conexiones terminan al leer el fin del flujo
+            await asyncio.wait_for(asyncio.gather(*servicio.conexiones), timeout=5)
+            await servidor.wait_closed()
+            servicio.cerrar()
+
+
+def main():
+    """Punto de entrada: 'servir' inicia el servicio, 'carga' lo mide"""
+    parser = argparse.ArgumentParser(description="Servicio de ordenamiento asyncio")
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+
+    for nombre, ayuda in (('servir', "Inicia el servicio"),
+                          ('carga', "Genera carga y reporta throughput y latencias")):
+        sub = subcomandos.add_parser(nombre, help=ayuda)
+        sub.add_argument('--unix', default=None, metavar='RUTA',
+                         help="Socket Unix (default: TCP en --host:--puerto)")
+        sub.add_argument('--host', default='127.0.0.1')
+        sub.add_argument('--puerto', type=int, default=PUERTO)
+        sub.add_argument('--procesos', type=int, default=None,
+                         help="Procesos del pool del servidor (default: CPUs disponibles)")
+
+    carga = subcomandos.choices['carga']
+    carga.add_argument('--local', action='store_true',
+                       help="Levanta el servidor en este mismo proceso (socket Unix temporal)")
+    carga.add_argument('--concurrencia', default='1,8,32', metavar='LISTA',
+                       help="Niveles de concurrencia separados por comas (default: 1,8,32)")
+    carga.add_argument('--solicitudes', type=int, default=500,
+                       help="Solicitudes por nivel de concurrencia (default: 500)")
+    carga.add_argument('--tamano', type=int, default=1000,
+                       help="Elementos por solicitud (default: 1000)")
+    carga.add_argument('--motor', default='introsort', choices=MOTORES)
+    carga.add_argument('--semilla', type=int, default=None)
+
+    args = parser.parse_args()
+    try:
+        asyncio.run(_servir(args) if args.comando == 'servir' else _carga(args))
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
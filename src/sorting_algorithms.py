@@ -2,7 +2,9 @@
 Módulo de Algoritmos de Ordenamiento
 Autor: Esmeralda Gómez
 Fecha: Febrero 2026
-Descripción: Implementación de Bubble Sort y QuickSort para análisis comparativo
+Descripción: Implementación de algoritmos de ordenamiento (Bubble Sort, Odd-Even,
+QuickSort, IntroSort, Counting Sort, Radix Sort, Sample Sort paralelo, ...) para análisis comparativo,
+y de selección (nth_element, partial_sort, top_k, mediana) con la misma partición
 """
 
 def bubble_sort(lista):
@@ -20,6 +22,24 @@ def bubble_sort(lista):
     """
     # Crear una copia para no modificar la lista original
     arr = lista.copy()
+    bubble_sort_inplace(arr)
+    return arr
+
+
+def bubble_sort_inplace(arr):
+    """
+    Bubble Sort in-place sobre cualquier secuencia mutable indexable
+    
+    Acepta listas, array.array, memoryview escribibles de una dimensión y
+    arreglos de NumPy sin convertirlos a lista ni copiarlos.
+    
+    Args:
+        arr: Secuencia mutable a ordenar (se modifica directamente)
+    
+    Returns:
+        La misma secuencia arr, ya ordenada
+    """
+    _validar_buffer(arr)
     n = len(arr)
     
     # Recorrer todos los elementos
@@ -42,7 +62,161 @@ def bubble_sort(lista):
     return arr
 
 
-def quicksort(lista):
+def odd_even_sort(lista):
+    """
+    Ordenamiento por transposición par-impar (Odd-Even Sort)
+    
+    Es la red de comparación e intercambio de Bubble Sort reorganizada en
+    fases: en las pares se comparan los pares (0,1), (2,3), ...; en las
+    impares (1,2), (3,4), ... Las comparaciones de una fase son
+    independientes entre sí, por lo que cada fase puede vectorizarse
+    (ver odd_even_sort_numpy).
+    
+    Complejidad temporal: O(n²) en el peor caso (n fases de n/2 comparaciones)
+    Complejidad espacial: O(1) - ordenamiento in-place
+    
+    Args:
+        lista: Lista de elementos a ordenar
+    
+    Returns:
+        Lista ordenada en orden ascendente
+    """
+    arr = lista.copy()
+    odd_even_sort_inplace(arr)
+    return arr
+
+
+def odd_even_sort_inplace(arr):
+    """
+    Odd-Even Sort in-place en Python, sobre cualquier secuencia mutable indexable
+    
+    Args:
+        arr: Secuencia mutable a ordenar (se modifica directamente)
+    
+    Returns:
+        La misma secuencia arr, ya ordenada
+    """
+    _validar_buffer(arr)
+    n = len(arr)
+    
+    # Ordenado cuando una fase par y una impar seguidas no intercambian nada
+    fases_sin_intercambio = 0
+    fase = 0
+    while fases_sin_intercambio < 2 and n > 1:
+        intercambio = False
+        for j in range(fase % 2, n - 1, 2):
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                intercambio = True
+        fases_sin_intercambio = 0 if intercambio else fases_sin_intercambio + 1
+        fase += 1
+    
+    return arr
+
+
+def odd_even_sort_numpy(arr):
+    """
+    Odd-Even Sort vectorizado con NumPy, in-place
+    
+    Cada fase es una sola operación sobre dos vistas con paso 2 (los
+    elementos izquierdo y derecho de cada par): np.minimum queda a la
+    izquierda y np.maximum a la derecha, sin recorrer los pares en Python.
+    Termina antes si una fase par y una impar seguidas no intercambian nada,
+    como la bandera 'intercambio' de Bubble Sort.
+    
+    Con un arreglo 2-D ordena cada fila por separado en las mismas fases:
+    sirve para ordenar muchas ventanas pequeñas de un sensor a la vez. Las
+    filas se trasponen a un bloque contiguo para que cada operando de una
+    fase sea memoria contigua, y el resultado se copia de vuelta.
+    
+    Args:
+        arr: Arreglo de NumPy de 1 o 2 dimensiones, o buffer escribible
+             (array.array, memoryview) que se ordena a través de una vista
+    
+    Returns:
+        El arreglo de NumPy ordenado (una vista de arr si arr era un buffer)
+    
+    Raises:
+        TypeError: Si arr es de sólo lectura o tiene más de dos dimensiones
+    """
+    import numpy as np
+    
+    vista = arr if isinstance(arr, np.ndarray) else np.asarray(memoryview(arr))
+    if not vista.flags.writeable:
+        raise TypeError("El arreglo es de sólo lectura")
+    if vista.ndim not in (1, 2):
+        raise TypeError("Sólo se admiten arreglos de una o dos dimensiones")
+    if vista.shape[-1] < 2:
+        return vista
+    
+    trabajo = vista if vista.ndim == 1 else np.ascontiguousarray(vista.T)
+    # np.minimum/np.maximum propagan NaN: con NaN sólo se mueven los pares desordenados
+    con_nan = vista.dtype.kind == 'f' and bool(np.isnan(vista).any())
+    _fases_odd_even(np, trabajo, con_nan)
+    if trabajo is not vista:
+        vista[...] = trabajo.T
+    
+    return vista
+
+
+def _fases_odd_even(np, arr, con_nan=False):
+    """
+    Fases de comparación e intercambio a lo largo del primer eje de arr
+    
+    Args:
+        np: Módulo numpy
+        arr: Arreglo a ordenar in-place por su primer eje
+        con_nan: Si es True, intercambia sólo donde izquierda > derecha
+    """
+    n = arr.shape[0]
+    
+    # Vistas izquierda/derecha y buffers de trabajo de cada paridad, reservados una vez
+    fases = []
+    for inicio in (0, 1):
+        izquierda = arr[inicio:n - 1:2]
+        derecha = arr[inicio + 1:n:2]
+        fases.append((izquierda, derecha, np.empty(izquierda.shape, dtype=bool),
+                      np.empty_like(izquierda)))
+    
+    fases_sin_intercambio = 0
+    fase = 0
+    while fases_sin_intercambio < 2:
+        izquierda, derecha, desordenados, menores = fases[fase % 2]
+        fase += 1
+        
+        np.greater(izquierda, derecha, out=desordenados)
+        if not desordenados.any():
+            fases_sin_intercambio += 1
+            continue
+        fases_sin_intercambio = 0
+        
+        if con_nan:
+            # Con NaN la comparación es falsa: el par no se toca y no se pierden valores
+            np.copyto(menores, izquierda)
+            np.minimum(izquierda, derecha, out=izquierda, where=desordenados)
+            np.maximum(menores, derecha, out=derecha, where=desordenados)
+        else:
+            np.minimum(izquierda, derecha, out=menores)
+            np.maximum(izquierda, derecha, out=derecha)
+            np.copyto(izquierda, menores)
+
+
+def odd_even_sort_lote(ventanas):
+    """
+    Ordena muchas ventanas del mismo largo a la vez (cada una por separado)
+    
+    Args:
+        ventanas: Arreglo 2-D de NumPy o lista de listas del mismo largo
+    
+    Returns:
+        Nuevo arreglo 2-D de NumPy con cada fila ordenada
+    """
+    import numpy as np
+    
+    return odd_even_sort_numpy(np.array(ventanas))
+
+
+def quicksort(lista, key=None, reverse=False):
     """
     Implementación del algoritmo QuickSort (Recursivo)
     
@@ -60,10 +234,15 @@ def quicksort(lista):
     
     Args:
         lista: Lista de elementos a ordenar
+        key: Función que extrae la clave de cada elemento (ver ordenar_con_clave)
+        reverse: Si es True, orden descendente (estable)
     
     Returns:
         Lista ordenada en orden ascendente
     """
+    if key is not None or reverse:
+        return ordenar_con_clave(lista, quicksort, key, reverse)
+    
     # Caso base: listas de 0 o 1 elemento ya están ordenadas
     if len(lista) <= 1:
         return lista.copy()
@@ -80,6 +259,874 @@ def quicksort(lista):
     return quicksort(menores) + iguales + quicksort(mayores)
 
 
+def quicksort_inplace(arr):
+    """
+    QuickSort in-place sobre cualquier secuencia mutable indexable
+    
+    Conserva la estrategia de quicksort (pivote central y partición en
+    menores / iguales / mayores) pero particiona dentro del mismo buffer
+    con el esquema de la bandera holandesa, sin crear sublistas. La
+    recursión se hace sobre la parte menor para acotar la pila a O(log n).
+    
+    Args:
+        arr: Lista, array.array, memoryview escribible o arreglo de NumPy
+    
+    Returns:
+        La misma secuencia arr, ya ordenada
+    """
+    _validar_buffer(arr)
+    _quicksort_inplace(arr, 0, len(arr))
+    return arr
+
+
+def _quicksort_inplace(arr, inicio, fin):
+    """Ordena arr[inicio:fin] con partición de tres vías in-place"""
+    while fin - inicio > 1:
+        pivote = arr[inicio + (fin - inicio) // 2]
+        
+        # Invariante: [inicio, lt) < pivote, [lt, i) == pivote, (gt, fin) > pivote
+        lt = inicio
+        i = inicio
+        gt = fin - 1
+        while i <= gt:
+            valor = arr[i]
+            if valor < pivote:
+                arr[lt], arr[i] = valor, arr[lt]
+                lt += 1
+                i += 1
+            elif valor > pivote:
+                arr[i], arr[gt] = arr[gt], valor
+                gt -= 1
+            else:
+                i += 1
+        
+        # Recursión sobre la parte menor, ciclo sobre la mayor
+        if lt - inicio < fin - gt - 1:
+            _quicksort_inplace(arr, inicio, lt)
+            inicio = gt + 1
+        else:
+            _quicksort_inplace(arr, gt + 1, fin)
+            fin = lt
+
+
+# Tamaño bajo el cual IntroSort termina con ordenamiento por inserción
+UMBRAL_INSERCION = 16
+
+# Tamaño a partir del cual el pivote se elige con "ninther" (mediana de medianas de tres)
+UMBRAL_NINTHER = 128
+
+
+def introsort(lista, key=None, reverse=False):
+    """
+    Implementación del algoritmo IntroSort (QuickSort introspectivo in-place)
+    
+    Mejoras respecto a quicksort:
+    - Partición de Hoare en una sola pasada, sin listas intermedias
+    - Pivote por mediana de tres (o "ninther" en rangos grandes)
+    - Ordenamiento por inserción en rangos menores a UMBRAL_INSERCION
+    - Recursión sólo sobre la mitad menor (la mayor se procesa en el ciclo)
+    - Cambio a HeapSort si la profundidad supera 2·log2(n)
+    
+    Complejidad temporal: O(n log n) garantizado en el peor caso
+    Complejidad espacial: O(log n) para la pila de recursión
+    
+    Args:
+        lista: Lista de elementos a ordenar
+        key: Función que extrae la clave de cada elemento (ver ordenar_con_clave)
+        reverse: Si es True, orden descendente (estable)
+    
+    Returns:
+        Lista ordenada en orden ascendente
+    """
+    if key is not None or reverse:
+        return ordenar_con_clave(lista, introsort, key, reverse)
+    
+    # Una sola copia; todo el trabajo posterior es in-place
+    arr = lista.copy()
+    introsort_inplace(arr)
+    return arr
+
+
+def introsort_inplace(arr):
+    """
+    IntroSort in-place sobre cualquier secuencia mutable indexable
+    
+    Args:
+        arr: Lista, array.array, memoryview escribible o arreglo de NumPy
+    
+    Returns:
+        La misma secuencia arr, ya ordenada
+    """
+    _validar_buffer(arr)
+    n = len(arr)
+    
+    if n > 1:
+        _introsort(arr, 0, n, 2 * (n.bit_length() - 1))
+    
+    return arr
+
+
+def _introsort(arr, inicio, fin, profundidad):
+    """Ordena arr[inicio:fin] in-place con límite de profundidad"""
+    while fin - inicio > UMBRAL_INSERCION:
+        if profundidad == 0:
+            # Demasiadas particiones desbalanceadas: garantizar O(n log n)
+            _heapsort(arr, inicio, fin)
+            return
+        profundidad -= 1
+        
+        corte = _particionar(arr, inicio, fin)
+        
+        # Recursión sobre la parte menor, ciclo sobre la mayor
+        if corte - inicio < fin - corte:
+            _introsort(arr, inicio, corte, profundidad)
+            inicio = corte
+        else:
+            _introsort(arr, corte, fin, profundidad)
+            fin = corte
+    
+    _ordenar_insercion(arr, inicio, fin)
+
+
+def _ordenar_insercion(arr, inicio, fin):
+    """Ordenamiento por inserción de arr[inicio:fin] in-place"""
+    for i in range(inicio + 1, fin):
+        valor = arr[i]
+        j = i - 1
+        while j >= inicio and arr[j] > valor:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = valor
+
+
+def _indice_mediana(arr, a, b, c):
+    """Devuelve el índice (a, b o c) cuyo valor es la mediana de los tres"""
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+
+def _seleccionar_pivote(arr, inicio, fin):
+    """Elige el índice del pivote: mediana de tres o ninther"""
+    n = fin - inicio
+    medio = inicio + n // 2
+    ultimo = fin - 1
+    
+    if n > UMBRAL_NINTHER:
+        paso = n // 8
+        a = _indice_mediana(arr, inicio, inicio + paso, inicio + 2 * paso)
+        b = _indice_mediana(arr, medio - paso, medio, medio + paso)
+        c = _indice_mediana(arr, ultimo - 2 * paso, ultimo - paso, ultimo)
+        return _indice_mediana(arr, a, b, c)
+    
+    return _indice_mediana(arr, inicio, medio, ultimo)
+
+
+def _particionar(arr, inicio, fin, indice=None):
+    """
+    Partición de Hoare de arr[inicio:fin] en una sola pasada
+    
+    Args:
+        indice: Índice del pivote (None = _seleccionar_pivote)
+    
+    Returns:
+        Índice de corte c tal que arr[inicio:c] <= pivote <= arr[c:fin],
+        con ambas partes no vacías
+    """
+    if indice is None:
+        indice = _seleccionar_pivote(arr, inicio, fin)
+    # Mover el pivote al inicio garantiza que ninguna parte quede vacía
+    arr[inicio], arr[indice] = arr[indice], arr[inicio]
+    pivote = arr[inicio]
+    
+    i = inicio - 1
+    j = fin
+    while True:
+        i += 1
+        while arr[i] < pivote:
+            i += 1
+        j -= 1
+        while arr[j] > pivote:
+            j -= 1
+        if i >= j:
+            return j + 1
+        arr[i], arr[j] = arr[j], arr[i]
+
+
+def _heapsort(arr, inicio, fin):
+    """HeapSort in-place de arr[inicio:fin] (respaldo de IntroSort)"""
+    n = fin - inicio
+    
+    # Construir el montículo de máximos
+    for raiz in range(n // 2 - 1, -1, -1):
+        _hundir(arr, inicio, raiz, n)
+    
+    # Extraer el máximo repetidamente al final del rango
+    for tam in range(n - 1, 0, -1):
+        arr[inicio], arr[inicio + tam] = arr[inicio + tam], arr[inicio]
+        _hundir(arr, inicio, 0, tam)
+
+
+def _hundir(arr, inicio, raiz, tam):
+    """Hunde arr[inicio + raiz] dentro de un montículo de tamaño tam"""
+    valor = arr[inicio + raiz]
+    while True:
+        hijo = 2 * raiz + 1
+        if hijo >= tam:
+            break
+        if hijo + 1 < tam and arr[inicio + hijo] < arr[inicio + hijo + 1]:
+            hijo += 1
+        if not valor < arr[inicio + hijo]:
+            break
+        arr[inicio + raiz] = arr[inicio + hijo]
+        raiz = hijo
+    arr[inicio + raiz] = valor
+
+
+# Con k <= n / UMBRAL_MONTICULO, partial_sort y top_k usan un montículo de k elementos
+# (heapq, en C); por encima conviene introselect + IntroSort de los k elegidos
+UMBRAL_MONTICULO = 16
+
+
+def nth_element(lista, k):
+    """
+    Devuelve el k-ésimo menor elemento (k = 0 es el mínimo) sin ordenar la lista
+    
+    Sirve también para percentiles: el percentil p es nth_element(lista,
+    int(p / 100 * (len(lista) - 1))).
+    
+    Complejidad temporal: O(n) garantizado (introselect)
+    
+    Args:
+        lista: Lista de elementos comparables
+        k: Posición en el orden ascendente (admite índices negativos)
+    
+    Returns:
+        El elemento que quedaría en la posición k si la lista se ordenara
+    
+    Raises:
+        IndexError: Si k está fuera de rango
+    """
+    arr = lista.copy()
+    n = len(arr)
+    if not -n <= k < n:
+        raise IndexError(f"k = {k} fuera de rango para {n} elementos")
+    k %= n
+    nth_element_inplace(arr, k)
+    return arr[k]
+
+
+def nth_element_inplace(arr, k):
+    """
+    Reordena arr de modo que arr[k] quede en su posición final (introselect)
+    
+    Después de la llamada arr[:k] <= arr[k] <= arr[k + 1:], sin más orden
+    dentro de cada parte. Usa la partición de Hoare de IntroSort y se
+    queda sólo con la parte que contiene k; si la profundidad supera
+    2·log2(n), el pivote pasa a ser la mediana de medianas, lo que
+    garantiza tiempo lineal en el peor caso.
+    
+    Args:
+        arr: Lista, array.array, memoryview escribible o arreglo de NumPy
+        k: Posición en el orden ascendente (0 <= k < len(arr))
+    
+    Returns:
+        La misma secuencia arr
+    """
+    _validar_buffer(arr)
+    n = len(arr)
+    if n > 1:
+        _seleccionar(arr, 0, n, k, 2 * (n.bit_length() - 1))
+    return arr
+
+
+def _seleccionar(arr, inicio, fin, k, profundidad):
+    """Deja en arr[k] el elemento de esa posición, con k en [inicio, fin)"""
+    while fin - inicio > UMBRAL_INSERCION:
+        if profundidad == 0:
+            indice = _pivote_mediana_de_medianas(arr, inicio, fin)
+        else:
+            profundidad -= 1
+            indice = None
+        
+        corte = _particionar(arr, inicio, fin, indice)
+        
+        # Sólo se sigue por la parte que contiene k
+        if k < corte:
+            fin = corte
+        else:
+            inicio = corte
+    
+    _ordenar_insercion(arr, inicio, fin)
+
+
+def _pivote_mediana_de_medianas(arr, inicio, fin):
+    """
+    Índice de la mediana de las medianas de grupos de cinco (BFPRT)
+    
+    Las medianas se mueven al principio del rango y su mediana se
+    selecciona recursivamente, también con este pivote: al menos 3/10 del
+    rango queda a cada lado, de modo que la selección es lineal.
+    """
+    medianas = inicio
+    for grupo in range(inicio, fin, 5):
+        fin_grupo = min(grupo + 5, fin)
+        _ordenar_insercion(arr, grupo, fin_grupo)
+        medio = (grupo + fin_grupo) // 2
+        arr[medianas], arr[medio] = arr[medio], arr[medianas]
+        medianas += 1
+    
+    centro = (inicio + medianas) // 2
+    _seleccionar(arr, inicio, medianas, centro, 0)
+    return centro
+
+
+def partial_sort(lista, k):
+    """
+    Devuelve los k menores elementos en orden ascendente
+    
+    Con k pequeño respecto de n (k <= n / UMBRAL_MONTICULO) se usa un
+    montículo de k elementos, O(n log k); en otro caso introselect deja los
+    k menores al principio y sólo esos se ordenan con IntroSort,
+    O(n + k log k).
+    
+    Args:
+        lista: Lista de elementos comparables
+        k: Cantidad de elementos (se acota a len(lista))
+    
+    Returns:
+        Nueva lista con los k menores, ordenados
+    """
+    n = len(lista)
+    k = max(0, min(k, n))
+    if k == 0:
+        return []
+    if k * UMBRAL_MONTICULO <= n:
+        import heapq
+        return heapq.nsmallest(k, lista)
+    
+    arr = lista.copy()
+    if k < n:
+        nth_element_inplace(arr, k - 1)
+    if k > 1:
+        _introsort(arr, 0, k, 2 * (k.bit_length() - 1))
+    del arr[k:]
+    return arr
+
+
+def top_k(lista, k):
+    """
+    Devuelve los k mayores elementos en orden descendente
+    
+    Misma estrategia que partial_sort: montículo con k pequeño, introselect
+    más IntroSort de los k seleccionados en otro caso.
+    
+    Args:
+        lista: Lista de elementos comparables
+        k: Cantidad de elementos (se acota a len(lista))
+    
+    Returns:
+        Nueva lista con los k mayores, de mayor a menor
+    """
+    n = len(lista)
+    k = max(0, min(k, n))
+    if k == 0:
+        return []
+    if k * UMBRAL_MONTICULO <= n:
+        import heapq
+        return heapq.nlargest(k, lista)
+    
+    arr = lista.copy()
+    if k < n:
+        nth_element_inplace(arr, n - k)
+    if k > 1:
+        _introsort(arr, n - k, n, 2 * (k.bit_length() - 1))
+    mayores = arr[n - k:]
+    mayores.reverse()
+    return mayores
+
+
+def mediana(lista):
+    """
+    Mediana en tiempo lineal (introselect), sin ordenar la lista
+    
+    Con una cantidad par de elementos devuelve el promedio de los dos
+    centrales, como statistics.median.
+    
+    Args:
+        lista: Lista de números
+    
+    Returns:
+        La mediana
+    
+    Raises:
+        ValueError: Si la lista está vacía
+    """
+    n = len(lista)
+    if n == 0:
+        raise ValueError("No hay mediana de una lista vacía")
+    
+    arr = lista.copy()
+    medio = n // 2
+    nth_element_inplace(arr, medio)
+    if n % 2:
+        return arr[medio]
+    # El central inferior es el máximo de la parte izquierda
+    return (max(arr[:medio]) + arr[medio]) / 2
+
+
+def insertion_sort(lista):
+    """
+    Implementación del algoritmo de Ordenamiento por Inserción
+    
+    Complejidad temporal: O(n + inversiones); O(n) si la lista ya está ordenada
+    Complejidad espacial: O(1) adicional sobre la copia
+    
+    Args:
+        lista: Lista de elementos a ordenar
+    
+    Returns:
+        Lista ordenada en orden ascendente
+    """
+    arr = lista.copy()
+    _ordenar_insercion(arr, 0, len(arr))
+    return arr
+
+
+def merge_sort_natural(lista, key=None, reverse=False):
+    """
+    Implementación de Merge Sort natural (mezcla de corridas ya ordenadas)
+    
+    Detecta las corridas ascendentes existentes y las mezcla por pares hasta
+    obtener una sola, por lo que es muy eficiente en listas casi ordenadas.
+    Es estable.
+    
+    Complejidad temporal: O(n log r), con r el número de corridas
+    Complejidad espacial: O(n)
+    
+    Args:
+        lista: Lista de elementos a ordenar
+        key: Función que extrae la clave de cada elemento (ver ordenar_con_clave)
+        reverse: Si es True, orden descendente (estable)
+    
+    Returns:
+        Lista ordenada en orden ascendente
+    """
+    if key is not None or reverse:
+        return ordenar_con_clave(lista, merge_sort_natural, key, reverse)
+    
+    n = len(lista)
+    if n <= 1:
+        return lista.copy()
+    
+    # Límites de las corridas ascendentes: [limites[k], limites[k+1])
+    limites = [0]
+    for i in range(1, n):
+        if lista[i] < lista[i - 1]:
+            limites.append(i)
+    limites.append(n)
+    
+    origen = lista.copy()
+    destino = [None] * n
+    
+    while len(limites) > 2:
+        nuevos = [0]
+        for k in range(0, len(limites) - 1, 2):
+            inicio = limites[k]
+            medio = limites[k + 1]
+            fin = limites[k + 2] if k + 2 < len(limites) else medio
+            _mezclar(origen, destino, inicio, medio, fin)
+            nuevos.append(fin)
+        limites = nuevos
+        origen, destino = destino, origen
+    
+    return origen
+
+
+def _mezclar(origen, destino, inicio, medio, fin):
+    """Mezcla origen[inicio:medio] y origen[medio:fin] en destino[inicio:fin]"""
+    i = inicio
+    j = medio
+    for k in range(inicio, fin):
+        if j >= fin or (i < medio and not origen[j] < origen[i]):
+            destino[k] = origen[i]
+            i += 1
+        else:
+            destino[k] = origen[j]
+            j += 1
+
+
+def counting_sort(lista):
+    """
+    Implementación del algoritmo Counting Sort para enteros
+    
+    Admite enteros negativos desplazando por el mínimo.
+    
+    Complejidad temporal: O(n + k), con k = máximo - mínimo + 1
+    Complejidad espacial: O(k)
+    
+    Args:
+        lista: Lista de enteros a ordenar
+    
+    Returns:
+        Lista ordenada en orden ascendente
+    """
+    if len(lista) <= 1:
+        return lista.copy()
+    
+    minimo = min(lista)
+    conteos = [0] * (max(lista) - minimo + 1)
+    
+    for x in lista:
+        conteos[x - minimo] += 1
+    
+    resultado = []
+    for desplazamiento, veces in enumerate(conteos):
+        if veces:
+            resultado.extend([desplazamiento + minimo] * veces)
+    
+    return resultado
+
+
+def radix_sort(lista):
+    """
+    Implementación de Radix Sort LSD por bytes para enteros
+    
+    Las claves se desplazan por el mínimo, por lo que admite enteros negativos
+    y valores de 64 bits (o mayores); el número de pasadas es el número de
+    bytes de (máximo - mínimo). Cada pasada es estable y reparte los
+    elementos en 256 cubetas según un byte de la clave.
+    
+    Complejidad temporal: O(b·n), con b = bytes de (máximo - mínimo)
+    Complejidad espacial: O(n)
+    
+    Args:
+        lista: Lista de enteros a ordenar
+    
+    Returns:
+        Lista ordenada en orden ascendente
+    """
+    if len(lista) <= 1:
+        return lista.copy()
+    
+    minimo = min(lista)
+    claves = [x - minimo for x in lista]
+    pasadas = (max(claves).bit_length() + 7) // 8
+    
+    for pasada in range(pasadas):
+        desplazamiento = 8 * pasada
+        cubetas = [[] for _ in range(256)]
+        for clave in claves:
+            cubetas[(clave >> desplazamiento) & 0xFF].append(clave)
+        claves = [clave for cubeta in cubetas for clave in cubeta]
+    
+    return [clave + minimo for clave in claves]
+
+
+def ordenar_con_clave(lista, motor, key=None, reverse=False):
+    """
+    Ordena elementos por clave de forma estable con cualquier motor
+    
+    Se calcula una sola vez la clave de cada elemento, se obtiene la
+    permutación con argsort y se reúnen los elementos en ese orden: el motor
+    nunca compara los elementos (tuplas, diccionarios, registros).
+    
+    Args:
+        lista: Lista de elementos
+        motor: Algoritmo de ordenamiento (ej: introsort)
+        key: Función que extrae la clave; una lista o tupla de funciones
+             ordena por varias claves, de la más a la menos significativa
+        reverse: Orden descendente; con varias claves puede ser una lista
+                 con un valor por clave
+    
+    Returns:
+        Lista ordenada (los elementos con claves iguales conservan su orden)
+    """
+    if isinstance(key, (list, tuple)):
+        columnas = [[k(x) for x in lista] for k in key]
+        orden = argsort_multiple(columnas, reverse, motor)
+    else:
+        claves = lista if key is None else [key(x) for x in lista]
+        orden = argsort(claves, reverse, motor)
+    return [lista[i] for i in orden]
+
+
+def argsort(claves, reverse=False, motor=None):
+    """
+    Permutación estable que ordena una columna de claves
+    
+    Con claves enteras, cada par (clave, índice) se codifica en un solo
+    entero (clave - mínimo)·n + índice, de modo que el motor compara enteros
+    y no tuplas; el índice desempata y hace el orden estable también en
+    orden descendente (se usa máximo - clave).
+    
+    Args:
+        claves: Lista (o buffer) de claves comparables
+        reverse: Si es True, orden descendente
+        motor: Algoritmo de ordenamiento (por defecto, introsort)
+    
+    Returns:
+        Lista de índices: claves[orden[0]], claves[orden[1]], ... está ordenado
+    """
+    return argsort_multiple([claves], [reverse], motor)
+
+
+def argsort_multiple(columnas, reverse=False, motor=None):
+    """
+    Permutación estable que ordena por varias columnas de claves
+    
+    Args:
+        columnas: Lista de columnas, de la más a la menos significativa
+        reverse: Booleano, o lista con uno por columna
+        motor: Algoritmo de ordenamiento (por defecto, introsort)
+    
+    Returns:
+        Lista de índices
+    """
+    motor = motor or introsort
+    n = len(columnas[0]) if columnas else 0
+    if n <= 1:
+        return list(range(n))
+    reversos = reverse if isinstance(reverse, (list, tuple)) else [reverse] * len(columnas)
+    
+    if all(_columna_entera(columna) for columna in columnas):
+        # Codificación en base mixta: un entero por fila, el índice al final
+        compuestas = [0] * n
+        for columna, reverso in zip(columnas, reversos):
+            minimo, maximo = min(columna), max(columna)
+            base = maximo - minimo + 1
+            if reverso:
+                compuestas = [c * base + (maximo - x) for c, x in zip(compuestas, columna)]
+            else:
+                compuestas = [c * base + (x - minimo) for c, x in zip(compuestas, columna)]
+        compuestas = [c * n + i for i, c in enumerate(compuestas)]
+        return [c % n for c in motor(compuestas)]
+    
+    # Claves no enteras: pasadas estables de la columna menos a la más significativa
+    orden = list(range(n))
+    for columna, reverso in reversed(list(zip(columnas, reversos))):
+        if reverso:
+            # Índice negado: al invertir, los empates quedan en su orden original
+            pares = motor([(columna[i], -posicion) for posicion, i in enumerate(orden)])
+            pares.reverse()
+            orden = [orden[-posicion] for _, posicion in pares]
+        else:
+            pares = motor([(columna[i], posicion) for posicion, i in enumerate(orden)])
+            orden = [orden[posicion] for _, posicion in pares]
+    return orden
+
+
+def _columna_entera(columna):
+    """Indica si todas las claves de la columna son enteros (no bool)"""
+    typecode = getattr(columna, 'typecode', None)
+    if typecode is not None:
+        return typecode not in 'fd'
+    return all(type(x) is int for x in columna)
+
+
+# Tamaño bajo el cual Sample Sort ordena en un solo proceso: coordinar los
+# procesos cuesta más de lo que se gana
+UMBRAL_PARALELO = 50_000
+
+# Muestras por proceso para elegir los separadores de las cubetas
+SOBREMUESTREO = 32
+
+# Pools de procesos reutilizados entre llamadas (procesos -> pool)
+_POOLS = {}
+
+
+def sample_sort_paralelo(lista, procesos=None, umbral=UMBRAL_PARALELO):
+    """
+    Implementación de Sample Sort paralelo sobre memoria compartida
+    
+    Los datos se copian a un bloque de multiprocessing.shared_memory como
+    enteros de 64 bits (o flotantes si hay alguno) y se ordenan con
+    sample_sort_paralelo_inplace.
+    
+    Args:
+        lista: Lista de enteros de 64 bits o flotantes
+        procesos: Número de procesos (por defecto, las CPUs disponibles)
+        umbral: Tamaño bajo el cual se ordena con IntroSort en este proceso
+    
+    Returns:
+        Lista ordenada en orden ascendente
+    """
+    from array import array
+    
+    tipo = 'd' if any(isinstance(x, float) for x in lista) else 'q'
+    buffer = array(tipo, lista)
+    sample_sort_paralelo_inplace(buffer, procesos, umbral)
+    return buffer.tolist()
+
+
+def sample_sort_paralelo_inplace(arr, procesos=None, umbral=UMBRAL_PARALELO):
+    """
+    Sample Sort paralelo in-place sobre un buffer tipado
+    
+    1. Se toman procesos·SOBREMUESTREO muestras y se eligen procesos - 1
+       separadores
+    2. Cada proceso ordena (IntroSort) un bloque contiguo de la memoria
+       compartida y localiza los separadores en él con búsqueda binaria
+    3. Cada proceso mezcla los trozos de su cubeta (uno por bloque) y los
+       escribe en su posición final de un segundo bloque compartido
+    
+    Los procesos sólo reciben nombres de memoria compartida e índices: los
+    datos nunca se serializan.
+    
+    Complejidad temporal: O((n/p) log n) por proceso con p procesos
+    Complejidad espacial: O(n) en memoria compartida
+    
+    Args:
+        arr: array.array, memoryview escribible o arreglo de NumPy de una dimensión
+        procesos: Número de procesos (por defecto, las CPUs disponibles)
+        umbral: Tamaño bajo el cual se ordena con IntroSort en este proceso
+    
+    Returns:
+        La misma secuencia arr, ya ordenada
+    """
+    import os
+    import random
+    from multiprocessing import shared_memory
+    
+    _validar_buffer(arr)
+    n = len(arr)
+    procesos = procesos or len(os.sched_getaffinity(0) if hasattr(os, 'sched_getaffinity')
+                                else range(os.cpu_count() or 1))
+    procesos = max(1, min(procesos, n // (2 * SOBREMUESTREO) or 1))
+    
+    if n < umbral or procesos == 1:
+        return introsort_inplace(arr)
+    
+    entrada = memoryview(arr)
+    formato = entrada.format
+    bytes_totales = n * entrada.itemsize
+    
+    origen = shared_memory.SharedMemory(create=True, size=bytes_totales)
+    destino = shared_memory.SharedMemory(create=True, size=bytes_totales)
+    try:
+        vista = origen.buf.cast('B').cast(formato)
+        vista[:] = entrada
+        
+        # Separadores a partir de una muestra (semilla fija: ejecución reproducible)
+        rng = random.Random(n)
+        muestras = sorted(vista[rng.randrange(n)] for _ in range(procesos * SOBREMUESTREO))
+        separadores = muestras[SOBREMUESTREO::SOBREMUESTREO][:procesos - 1]
+        vista.release()
+        
+        pool = _pool_procesos(procesos)
+        
+        # Fase 1: ordenar bloques y localizar en ellos los separadores
+        bloques = [(i * n // procesos, (i + 1) * n // procesos) for i in range(procesos)]
+        cortes = list(pool.map(_ordenar_bloque, *zip(*[
+            (origen.name, formato, n, inicio, fin, separadores) for inicio, fin in bloques
+        ])))
+        
+        # Fase 2: cada cubeta reúne un trozo de cada bloque y los mezcla
+        tareas = []
+        desplazamiento = 0
+        for j in range(procesos):
+            trozos = [(corte[j], corte[j + 1]) for corte in cortes]
+            tareas.append((origen.name, destino.name, formato, n, trozos, desplazamiento))
+            desplazamiento += sum(fin - inicio for inicio, fin in trozos)
+        list(pool.map(_mezclar_cubeta, *zip(*tareas)))
+        
+        vista = destino.buf.cast('B').cast(formato)
+        entrada[:] = vista
+        vista.release()
+    finally:
+        entrada.release()
+        for memoria in (origen, destino):
+            memoria.close()
+            memoria.unlink()
+    
+    return arr
+
+
+def _pool_procesos(procesos):
+    """Devuelve (creándolo la primera vez) un pool de procesos reutilizable"""
+    import atexit
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    if procesos not in _POOLS:
+        metodos = multiprocessing.get_all_start_methods()
+        contexto = multiprocessing.get_context('fork' if 'fork' in metodos else 'spawn')
+        _POOLS[procesos] = ProcessPoolExecutor(max_workers=procesos, mp_context=contexto)
+        atexit.register(_POOLS[procesos].shutdown)
+    return _POOLS[procesos]
+
+
+def _ordenar_bloque(nombre, formato, n, inicio, fin, separadores):
+    """
+    Proceso de la fase 1: ordena arr[inicio:fin] de la memoria compartida
+    
+    Returns:
+        Lista con inicio, la posición de cada separador en el bloque ordenado
+        y fin (los límites de los trozos de cada cubeta)
+    """
+    from bisect import bisect_right
+    from multiprocessing import shared_memory
+    
+    memoria = shared_memory.SharedMemory(name=nombre)
+    try:
+        vista = memoria.buf.cast('B').cast(formato)
+        bloque = vista[inicio:fin]
+        introsort_inplace(bloque)
+        cortes = [inicio] + [inicio + bisect_right(bloque, s) for s in separadores] + [fin]
+        bloque.release()
+        vista.release()
+    finally:
+        memoria.close()
+    return cortes
+
+
+def _mezclar_cubeta(nombre_origen, nombre_destino, formato, n, trozos, desplazamiento):
+    """Proceso de la fase 2: mezcla los trozos ordenados de una cubeta en su destino"""
+    import heapq
+    from array import array
+    from multiprocessing import shared_memory
+    
+    origen = shared_memory.SharedMemory(name=nombre_origen)
+    destino = shared_memory.SharedMemory(name=nombre_destino)
+    try:
+        entrada = origen.buf.cast('B').cast(formato)
+        salida = destino.buf.cast('B').cast(formato)
+        partes = [entrada[inicio:fin] for inicio, fin in trozos if fin > inicio]
+        mezcla = array(formato, heapq.merge(*partes))
+        salida[desplazamiento:desplazamiento + len(mezcla)] = memoryview(mezcla)
+        for parte in partes:
+            parte.release()
+        entrada.release()
+        salida.release()
+    finally:
+        origen.close()
+        destino.close()
+
+
+def _validar_buffer(arr):
+    """
+    Verifica que arr pueda ordenarse in-place
+    
+    Raises:
+        TypeError: Si arr es de sólo lectura o tiene más de una dimensión
+    """
+    if isinstance(arr, memoryview):
+        if arr.readonly:
+            raise TypeError("El memoryview es de sólo lectura")
+        if arr.ndim != 1:
+            raise TypeError("Sólo se admiten memoryview de una dimensión")
+    elif hasattr(arr, 'flags') and hasattr(arr, 'ndim'):
+        # Arreglo de NumPy (sin importar numpy)
+        if not arr.flags.writeable:
+            raise TypeError("El arreglo de NumPy es de sólo lectura")
+        if arr.ndim != 1:
+            raise TypeError("Sólo se admiten arreglos de NumPy de una dimensión")
+
+
 # Función de prueba rápida
 if __name__ == "__main__":
     # Datos de prueba
@@ -87,5 +1134,17 @@ if __name__ == "__main__":
     
     print("Lista original:", test_data)
     print("Bubble Sort:", bubble_sort(test_data))
+    print("Odd-Even Sort:", odd_even_sort(test_data))
     print("QuickSort:", quicksort(test_data))
+    print("IntroSort:", introsort(test_data))
+    print("Counting Sort:", counting_sort(test_data))
+    print("Radix Sort:", radix_sort(test_data))
+    print("Sample Sort paralelo:", sample_sort_paralelo(test_data, umbral=0))
+    print("Mediana:", mediana(test_data), "- Top 3:", top_k(test_data, 3))
+    
+    # Variantes in-place sobre un buffer tipado (8 bytes por elemento)
+    from array import array
+    buffer = array('q', test_data)
+    introsort_inplace(memoryview(buffer))
+    print("IntroSort in-place (array.array):", buffer.tolist())
 
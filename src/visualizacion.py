@@ -1,13 +1,27 @@
 """
 Módulo de Visualización de Resultados
 Genera gráficas comparativas del rendimiento de los algoritmos
+
+Los resultados se pivotan una sola vez en una tabla escenario -> algoritmo ->
+tamaño, y las gráficas se construyen a partir de ella para cualquier número de
+algoritmos y escenarios. matplotlib se importa sólo al dibujar, y cada gráfica
+se regenera únicamente si cambiaron los datos que muestra.
 """
 
+import os
 import json
-import matplotlib.pyplot as plt
-import pandas as pd
-import numpy as np
-import glob
+import hashlib
+from almacen_resultados import conectar, importar_directorio, ultima_ejecucion, consultar
+
+
+# Resolución por defecto de las imágenes (300 dpi sólo para el reporte impreso)
+DPI = 150
+
+# Manifiesto con la huella de los datos de cada gráfica ya dibujada
+ARCHIVO_MANIFIESTO = '.graficas.json'
+
+# Algoritmo contra el que se calcula el factor de mejora (si está presente)
+ALGORITMO_REFERENCIA = 'Bubble Sort'
 
 
 def cargar_resultados(ruta_json):
@@ -16,126 +30,304 @@ def cargar_resultados(ruta_json):
         return json.load(f)
 
 
-def crear_grafica_comparativa(resultados, ruta_salida):
-    """Crea una gráfica comparativa de los tiempos de ejecución"""
-    # Filtrar resultados válidos
-    resultados_validos = [r for r in resultados if 'error' not in r]
-    
-    # Convertir a DataFrame
-    df = pd.DataFrame(resultados_validos)
-    
-    # Crear figura con subplots
-    fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-    fig.suptitle('Evaluación de Rendimiento: Bubble Sort vs QuickSort', 
-                 fontsize=16, fontweight='bold')
-    
-    # Gráfica 1: Barras - Escenario Aleatorio
-    ax1 = axes[0, 0]
-    datos_aleatorio = df[df['escenario'] == 'aleatoria']
-    
-    tamanos = sorted(datos_aleatorio['tamano'].unique())
-    bubble_times = [datos_aleatorio[(datos_aleatorio['tamano'] == t) & 
-                                     (datos_aleatorio['algoritmo'] == 'Bubble Sort')]['promedio_ms'].values[0] 
-                    for t in tamanos]
-    quick_times = [datos_aleatorio[(datos_aleatorio['tamano'] == t) & 
-                                    (datos_aleatorio['algoritmo'] == 'QuickSort')]['promedio_ms'].values[0] 
-                   for t in tamanos]
-    
-    x = np.arange(len(tamanos))
-    width = 0.35
-    
-    ax1.bar(x - width/2, bubble_times, width, label='Bubble Sort', color='#FF6B6B')
-    ax1.bar(x + width/2, quick_times, width, label='QuickSort', color='#4ECDC4')
-    
-    ax1.set_xlabel('Tamaño de la lista', fontweight='bold')
-    ax1.set_ylabel('Tiempo (ms)', fontweight='bold')
-    ax1.set_title('Escenario: Lista Aleatoria')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels([f'{t:,}' for t in tamanos])
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    
-    # Gráfica 2: Barras - Escenario Invertido
-    ax2 = axes[0, 1]
-    datos_invertido = df[df['escenario'] == 'invertida']
-    
-    bubble_times_inv = [datos_invertido[(datos_invertido['tamano'] == t) & 
-                                         (datos_invertido['algoritmo'] == 'Bubble Sort')]['promedio_ms'].values[0] 
-                        for t in tamanos]
-    quick_times_inv = [datos_invertido[(datos_invertido['tamano'] == t) & 
-                                        (datos_invertido['algoritmo'] == 'QuickSort')]['promedio_ms'].values[0] 
-                       for t in tamanos]
-    
-    ax2.bar(x - width/2, bubble_times_inv, width, label='Bubble Sort', color='#FF6B6B')
-    ax2.bar(x + width/2, quick_times_inv, width, label='QuickSort', color='#4ECDC4')
-    
-    ax2.set_xlabel('Tamaño de la lista', fontweight='bold')
-    ax2.set_ylabel('Tiempo (ms)', fontweight='bold')
-    ax2.set_title('Escenario: Lista Invertida')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels([f'{t:,}' for t in tamanos])
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
-    
-    # Gráfica 3: Líneas - Escalabilidad
-    ax3 = axes[1, 0]
-    
-    ax3.plot(tamanos, bubble_times, marker='o', linewidth=2, 
-             markersize=8, label='Bubble Sort (Aleatoria)', color='#FF6B6B')
-    ax3.plot(tamanos, bubble_times_inv, marker='s', linewidth=2, 
-             markersize=8, label='Bubble Sort (Invertida)', color='#FF8E8E', linestyle='--')
-    ax3.plot(tamanos, quick_times, marker='o', linewidth=2, 
-             markersize=8, label='QuickSort (Aleatoria)', color='#4ECDC4')
-    ax3.plot(tamanos, quick_times_inv, marker='s', linewidth=2, 
-             markersize=8, label='QuickSort (Invertida)', color='#6FD9D0', linestyle='--')
-    
-    ax3.set_xlabel('Tamaño de la lista', fontweight='bold')
-    ax3.set_ylabel('Tiempo (ms)', fontweight='bold')
-    ax3.set_title('Escalabilidad de los Algoritmos')
-    ax3.set_xscale('log')
-    ax3.set_yscale('log')
-    ax3.legend()
-    ax3.grid(True, which="both", alpha=0.3)
-    
-    # Gráfica 4: Factor de mejora
-    ax4 = axes[1, 1]
-    
-    factores_aleatorio = [b/q for b, q in zip(bubble_times, quick_times)]
-    factores_invertido = [b/q for b, q in zip(bubble_times_inv, quick_times_inv)]
-    
-    ax4.bar(x - width/2, factores_aleatorio, width, label='Lista Aleatoria', color='#95E1D3')
-    ax4.bar(x + width/2, factores_invertido, width, label='Lista Invertida', color='#F38181')
-    
-    ax4.set_xlabel('Tamaño de la lista', fontweight='bold')
-    ax4.set_ylabel('Factor de mejora (veces más rápido)', fontweight='bold')
-    ax4.set_title('QuickSort vs Bubble Sort: Factor de Mejora')
-    ax4.set_xticks(x)
-    ax4.set_xticklabels([f'{t:,}' for t in tamanos])
-    ax4.legend()
-    ax4.grid(True, alpha=0.3)
-    
-    # Añadir valores sobre las barras
-    for i, (v1, v2) in enumerate(zip(factores_aleatorio, factores_invertido)):
-        ax4.text(i - width/2, v1, f'{v1:.1f}x', ha='center', va='bottom', fontsize=9)
-        ax4.text(i + width/2, v2, f'{v2:.1f}x', ha='center', va='bottom', fontsize=9)
-    
-    plt.tight_layout()
-    plt.savefig(ruta_salida, dpi=300, bbox_inches='tight')
+def cargar_ultima_ejecucion(algoritmos=None, escenarios=None):
+    """
+    Carga del almacén sólo los resultados que usan las gráficas
+
+    Antes de consultar se importan los resultados_*.json que aún no estén en
+    el almacén, así que también funciona con ejecuciones antiguas.
+
+    Args:
+        algoritmos: Algoritmos a cargar (None = todos)
+        escenarios: Escenarios a cargar (None = todos)
+
+    Returns:
+        Lista de resultados de la ejecución más reciente (vacía si no hay)
+    """
+    conexion = conectar()
+    try:
+        importar_directorio(conexion)
+        ejecucion = ultima_ejecucion(conexion)
+        if ejecucion is None:
+            return []
+        return consultar(conexion, algoritmo=algoritmos, escenario=escenarios,
+                         ejecucion=ejecucion)
+    finally:
+        conexion.close()
+
+
+def pivotar(resultados):
+    """
+    Reorganiza los resultados válidos en una sola pasada
+
+    Args:
+        resultados: Iterable de resultados
+
+    Returns:
+        Diccionario con 'tabla' (escenario -> algoritmo -> tamaño -> promedio_ms),
+        'algoritmos' y 'escenarios' (en orden de aparición) y 'tamanos' (ordenados)
+    """
+    tabla = {}
+    algoritmos = {}
+    tamanos = set()
+    for r in resultados:
+        if 'error' in r:
+            continue
+        tabla.setdefault(r['escenario'], {}).setdefault(r['algoritmo'], {})[r['tamano']] = \
+            r['promedio_ms']
+        algoritmos.setdefault(r['algoritmo'], None)
+        tamanos.add(r['tamano'])
+    return {
+        'tabla': tabla,
+        'algoritmos': list(algoritmos),
+        'escenarios': list(tabla),
+        'tamanos': sorted(tamanos),
+    }
+
+
+def graficas_disponibles(pivote):
+    """
+    Lista las gráficas que se pueden dibujar con los datos pivotados
+
+    Returns:
+        Lista de tuplas (archivo, dibujar, datos), donde datos es la porción
+        de la tabla que muestra la gráfica (de ella sale su huella)
+    """
+    tabla = pivote['tabla']
+    graficas = [(f"grafica_{escenario}.png", _dibujar_barras,
+                 {'escenario': escenario, 'series': tabla[escenario]})
+                for escenario in pivote['escenarios']]
+    graficas.append(("grafica_escalabilidad.png", _dibujar_escalabilidad, {'tabla': tabla}))
+    if len(pivote['algoritmos']) > 1:
+        graficas.append(("grafica_factor.png", _dibujar_factor, {'tabla': tabla}))
+    # Resumen con todos los paneles en una sola figura
+    graficas.append(("grafica_comparativa.png", _dibujar_resumen, {'tabla': tabla}))
+    return graficas
+
+
+def renderizar_reporte(resultados, directorio_salida, dpi=DPI, forzar=False):
+    """
+    Dibuja las gráficas cuyos datos cambiaron desde el último renderizado
+
+    Args:
+        resultados: Iterable de resultados (lista, almacén o punto de control)
+        directorio_salida: Carpeta de las imágenes
+        dpi: Resolución de las imágenes
+        forzar: Si es True, redibuja todas las gráficas
+
+    Returns:
+        Lista de tuplas (ruta, regenerada)
+    """
+    pivote = pivotar(resultados)
+    if not pivote['tabla']:
+        return []
+
+    os.makedirs(directorio_salida, exist_ok=True)
+    ruta_manifiesto = os.path.join(directorio_salida, ARCHIVO_MANIFIESTO)
+    manifiesto = _leer_manifiesto(ruta_manifiesto)
+    colores = None
+
+    generadas = []
+    for archivo, dibujar, datos in graficas_disponibles(pivote):
+        ruta = os.path.join(directorio_salida, archivo)
+        huella = _huella(datos, dpi, pivote['algoritmos'])
+        if not forzar and manifiesto.get(archivo) == huella and os.path.exists(ruta):
+            generadas.append((ruta, False))
+            continue
+
+        plt = _pyplot()
+        if colores is None:
+            colores = _colores(pivote['algoritmos'])
+        figura = dibujar(plt, datos, colores)
+        figura.savefig(ruta, dpi=dpi, bbox_inches='tight')
+        plt.close(figura)
+
+        manifiesto[archivo] = huella
+        generadas.append((ruta, True))
+        print(f"✓ Gráfica guardada en: {ruta}")
+
+    _escribir_manifiesto(ruta_manifiesto, manifiesto)
+    return generadas
+
+
+def crear_grafica_comparativa(resultados, ruta_salida, dpi=DPI):
+    """Crea la gráfica resumen con todos los algoritmos y escenarios"""
+    pivote = pivotar(resultados)
+    plt = _pyplot()
+    figura = _dibujar_resumen(plt, {'tabla': pivote['tabla']}, _colores(pivote['algoritmos']))
+    figura.savefig(ruta_salida, dpi=dpi, bbox_inches='tight')
+    plt.close(figura)
     print(f"✓ Gráfica guardada en: {ruta_salida}")
 
 
+def _pyplot():
+    """Importa matplotlib sin interfaz gráfica sólo cuando hay algo que dibujar"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _colores(algoritmos):
+    """Color fijo por algoritmo, el mismo en todas las gráficas"""
+    paleta = ['#FF6B6B', '#4ECDC4', '#FFD93D', '#6C5CE7', '#95E1D3', '#F38181',
+              '#A8E6CF', '#FF8B94', '#3D84A8', '#FFA45B']
+    return {algo: paleta[i % len(paleta)] for i, algo in enumerate(algoritmos)}
+
+
+def _huella(datos, dpi, algoritmos):
+    """Huella de los datos de una gráfica (incluye el orden de colores y el dpi)"""
+    texto = json.dumps([datos, dpi, algoritmos], sort_keys=True, default=str)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+def _leer_manifiesto(ruta):
+    """Lee el manifiesto de gráficas (vacío si no existe o está dañado)"""
+    try:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _escribir_manifiesto(ruta, manifiesto):
+    """Escribe el manifiesto de forma atómica"""
+    temporal = ruta + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(manifiesto, f, indent=2)
+    os.replace(temporal, ruta)
+
+
+def _panel_barras(ax, escenario, series, colores):
+    """Barras agrupadas por tamaño, una por algoritmo"""
+    tamanos = sorted({n for tiempos in series.values() for n in tiempos})
+    ancho = 0.8 / max(1, len(series))
+    for i, (algoritmo, tiempos) in enumerate(series.items()):
+        desplazamiento = (i - (len(series) - 1) / 2) * ancho
+        posiciones = [j + desplazamiento for j, n in enumerate(tamanos) if n in tiempos]
+        ax.bar(posiciones, [tiempos[n] for n in tamanos if n in tiempos], ancho,
+               label=algoritmo, color=colores[algoritmo])
+
+    ax.set_xlabel('Tamaño de la lista', fontweight='bold')
+    ax.set_ylabel('Tiempo (ms)', fontweight='bold')
+    ax.set_title(f'Escenario: {escenario}')
+    ax.set_xticks(range(len(tamanos)))
+    ax.set_xticklabels([f'{n:,}' for n in tamanos])
+    ax.set_yscale('log')
+    ax.legend(fontsize=8)
+    ax.grid(True, alpha=0.3)
+
+
+def _panel_escalabilidad(ax, tabla, colores):
+    """Líneas log-log de cada algoritmo, un estilo de línea por escenario"""
+    estilos = ['-', '--', ':', '-.']
+    marcadores = ['o', 's', '^', 'D']
+    for i, (escenario, series) in enumerate(tabla.items()):
+        for algoritmo, tiempos in series.items():
+            tamanos = sorted(tiempos)
+            ax.plot(tamanos, [tiempos[n] for n in tamanos],
+                    marker=marcadores[i % len(marcadores)],
+                    linestyle=estilos[i % len(estilos)], linewidth=2, markersize=6,
+                    label=f'{algoritmo} ({escenario})', color=colores[algoritmo])
+
+    ax.set_xlabel('Tamaño de la lista', fontweight='bold')
+    ax.set_ylabel('Tiempo (ms)', fontweight='bold')
+    ax.set_title('Escalabilidad de los Algoritmos')
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.legend(fontsize=7)
+    ax.grid(True, which="both", alpha=0.3)
+
+
+def _panel_factor(ax, tabla, colores):
+    """Factor de mejora de cada algoritmo contra la referencia en el mayor tamaño"""
+    escenarios = list(tabla)
+    algoritmos = list(dict.fromkeys(a for series in tabla.values() for a in series))
+    referencia = ALGORITMO_REFERENCIA if ALGORITMO_REFERENCIA in algoritmos else algoritmos[0]
+    otros = [a for a in algoritmos if a != referencia]
+
+    ancho = 0.8 / max(1, len(otros))
+    for i, algoritmo in enumerate(otros):
+        posiciones, factores = [], []
+        for j, escenario in enumerate(escenarios):
+            base = tabla[escenario].get(referencia, {})
+            tiempos = tabla[escenario].get(algoritmo, {})
+            comunes = set(base) & set(tiempos)
+            if not comunes:
+                continue
+            mayor = max(comunes)
+            if tiempos[mayor] > 0:
+                posiciones.append(j + (i - (len(otros) - 1) / 2) * ancho)
+                factores.append(base[mayor] / tiempos[mayor])
+        ax.bar(posiciones, factores, ancho, label=algoritmo, color=colores[algoritmo])
+        for x, factor in zip(posiciones, factores):
+            ax.text(x, factor, f'{factor:.1f}x', ha='center', va='bottom', fontsize=7)
+
+    ax.set_xlabel('Escenario (mayor tamaño medido)', fontweight='bold')
+    ax.set_ylabel('Factor de mejora (veces más rápido)', fontweight='bold')
+    ax.set_title(f'Factor de Mejora vs {referencia}')
+    ax.set_xticks(range(len(escenarios)))
+    ax.set_xticklabels(escenarios)
+    ax.legend(fontsize=8)
+    ax.grid(True, alpha=0.3)
+
+
+def _dibujar_barras(plt, datos, colores):
+    """Figura de barras de un escenario"""
+    figura, ax = plt.subplots(figsize=(8, 6))
+    _panel_barras(ax, datos['escenario'], datos['series'], colores)
+    return figura
+
+
+def _dibujar_escalabilidad(plt, datos, colores):
+    """Figura de escalabilidad de todos los algoritmos y escenarios"""
+    figura, ax = plt.subplots(figsize=(8, 6))
+    _panel_escalabilidad(ax, datos['tabla'], colores)
+    return figura
+
+
+def _dibujar_factor(plt, datos, colores):
+    """Figura del factor de mejora"""
+    figura, ax = plt.subplots(figsize=(8, 6))
+    _panel_factor(ax, datos['tabla'], colores)
+    return figura
+
+
+def _dibujar_resumen(plt, datos, colores):
+    """Figura con un panel por escenario más escalabilidad y factor de mejora"""
+    tabla = datos['tabla']
+    algoritmos = {a for series in tabla.values() for a in series}
+    paneles = len(tabla) + 1 + (len(algoritmos) > 1)
+    columnas = 2
+    filas = (paneles + columnas - 1) // columnas
+
+    figura, ejes = plt.subplots(filas, columnas, figsize=(15, 6 * filas), squeeze=False)
+    figura.suptitle('Evaluación de Rendimiento de Algoritmos de Ordenamiento',
+                    fontsize=16, fontweight='bold')
+    ejes = [ax for fila in ejes for ax in fila]
+
+    for ax, (escenario, series) in zip(ejes, tabla.items()):
+        _panel_barras(ax, escenario, series, colores)
+    _panel_escalabilidad(ejes[len(tabla)], tabla, colores)
+    if len(algoritmos) > 1:
+        _panel_factor(ejes[len(tabla) + 1], tabla, colores)
+    for ax in ejes[paneles:]:
+        ax.set_visible(False)
+
+    figura.tight_layout(rect=(0, 0, 1, 0.97))
+    return figura
+
+
 if __name__ == "__main__":
-    # Buscar el archivo JSON más reciente
-    archivos = glob.glob("../results/resultados_*.json")
-    if archivos:
-        archivo_reciente = max(archivos)
-        print(f"Cargando resultados de: {archivo_reciente}")
-        
-        resultados = cargar_resultados(archivo_reciente)
-        
-        # Crear gráfica
-        crear_grafica_comparativa(resultados, "../results/grafica_comparativa.png")
-        
-        print("\n✓ Gráfica generada exitosamente")
+    # Cargar la ejecución más reciente desde el almacén de resultados
+    resultados = cargar_ultima_ejecucion()
+    if resultados:
+        print(f"Cargando resultados de la ejecución del {resultados[0]['marca_tiempo']}")
+
+        # Crear sólo las gráficas cuyos datos cambiaron
+        generadas = renderizar_reporte(resultados, "../results")
+        nuevas = sum(1 for _, regenerada in generadas if regenerada)
+
+        print(f"\n✓ Gráficas generadas: {nuevas} (sin cambios: {len(generadas) - nuevas})")
     else:
-        print("No se encontraron archivos de resultados")
\ No newline at end of file
+        print("No se encontraron archivos de resultados")
@@ -0,0 +1,9 @@
+"""
+Configuración de pytest: los módulos de src/ se importan por nombre, igual
+que cuando se ejecuta main.py desde esa carpeta
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
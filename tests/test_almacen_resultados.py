@@ -0,0 +1,78 @@
+"""
+Pruebas del almacén histórico de resultados (SQLite)
+"""
+
+import csv
+import json
+
+import pytest
+
+from almacen_resultados import (
+    conectar, registrar_ejecucion, importar_directorio, consultar, tendencia,
+    ultima_ejecucion,
+)
+
+
+def _resultado(algoritmo, promedio_ms, tamano=1000, escenario='aleatoria', **extra):
+    return dict(algoritmo=algoritmo, escenario=escenario, tamano=tamano, repeticiones=3,
+                promedio_segundos=promedio_ms / 1000, desviacion_estandar=0.0,
+                promedio_ms=promedio_ms, semilla=42, **extra)
+
+
+@pytest.fixture
+def almacen():
+    conexion = conectar(':memory:')
+    yield conexion
+    conexion.close()
+
+
+def test_importador_es_idempotente(tmp_path, almacen):
+    resultados = [_resultado('QuickSort', 2.0), _resultado('Bubble Sort', 90.0)]
+    (tmp_path / 'resultados_20260101_120000.json').write_text(json.dumps(resultados))
+    with open(tmp_path / 'resultados_20260102_120000.csv', 'w', newline='') as f:
+        escritor = csv.DictWriter(f, fieldnames=list(resultados[0]))
+        escritor.writeheader()
+        escritor.writerow(_resultado('QuickSort', 1.5))
+    # El CSV con su JSON al lado no se importa dos veces
+    (tmp_path / 'resultados_20260101_120000.csv').write_text('algoritmo\nIgnorado\n')
+
+    assert importar_directorio(almacen, str(tmp_path)) == 2
+    assert importar_directorio(almacen, str(tmp_path)) == 0
+    assert len(consultar(almacen)) == 3
+
+    # Las filas del CSV recuperan sus tipos numéricos y la fecha sale del nombre
+    csv_importado = consultar(almacen, desde='2026-01-02')
+    assert [(r['tamano'], r['promedio_ms'], r['marca_tiempo']) for r in csv_importado] == [
+        (1000, 1.5, '2026-01-02 12:00:00')]
+
+
+def test_registrar_con_origen_repetido(almacen):
+    assert registrar_ejecucion(almacen, [_resultado('QuickSort', 1.0)], origen='a') is not None
+    assert registrar_ejecucion(almacen, [_resultado('QuickSort', 9.0)], origen='a') is None
+    assert [r['promedio_ms'] for r in consultar(almacen)] == [1.0]
+
+
+def test_tendencia_ordenada_por_fecha_y_filtrada(almacen):
+    # Se registran fuera de orden; la tendencia sale ordenada por fecha
+    ejecuciones = [('2026-03-01 10:00:00', 3.0, 'a'), ('2026-01-01 10:00:00', 1.0, 'a'),
+                   ('2026-02-01 10:00:00', 2.0, 'b')]
+    for marca, ms, host in ejecuciones:
+        registrar_ejecucion(almacen, [_resultado('QuickSort', ms),
+                                      _resultado('QuickSort', ms * 10, tamano=10_000),
+                                      dict(algoritmo='IntroSort', escenario='aleatoria',
+                                           tamano=1000, error='falló')],
+                            marca_tiempo=marca, host=host, commit='abc')
+
+    assert tendencia(almacen, 'QuickSort', 'aleatoria', 1000) == [
+        ('2026-01-01 10:00:00', 1.0), ('2026-02-01 10:00:00', 2.0),
+        ('2026-03-01 10:00:00', 3.0)]
+    assert tendencia(almacen, 'QuickSort', 'aleatoria', 1000, host='a',
+                     desde='2026-02-01') == [('2026-03-01 10:00:00', 3.0)]
+    # Los casos con error no cuentan salvo que se pidan
+    assert tendencia(almacen, 'IntroSort', 'aleatoria', 1000) == []
+    assert len(consultar(almacen, algoritmo='IntroSort', incluir_errores=True)) == 3
+
+    ultima = ultima_ejecucion(almacen)
+    assert {r['marca_tiempo'] for r in consultar(almacen, ejecucion=ultima)} == {
+        '2026-03-01 10:00:00'}
+    assert consultar(almacen, ejecucion=ultima_ejecucion(almacen, host='b'))[0]['host'] == 'b'
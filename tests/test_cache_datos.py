@@ -0,0 +1,52 @@
+"""
+Pruebas de la caché de conjuntos en disco
+"""
+
+from array import array
+
+import pytest
+
+from cache_datos import cargar_o_generar, abrir_conjunto, clave_cache, _leer_indice
+from data_generator import generar_conjunto
+
+
+def test_carga_desde_cache_igual_a_generar(tmp_path):
+    directorio = str(tmp_path)
+    esperado = generar_conjunto('aleatoria', 500, semilla=8)
+
+    assert cargar_o_generar('aleatoria', 500, 8, directorio=directorio) == esperado
+    assert clave_cache('aleatoria', 500, 8) in _leer_indice(directorio)
+    assert cargar_o_generar('aleatoria', 500, 8, directorio=directorio) == esperado
+
+
+def test_como_buffer_devuelve_array(tmp_path):
+    directorio = str(tmp_path)
+    esperado = generar_conjunto('invertida', 300, semilla=8)
+
+    generado = cargar_o_generar('invertida', 300, 8, directorio=directorio, como_buffer=True)
+    cargado = cargar_o_generar('invertida', 300, 8, directorio=directorio, como_buffer=True)
+    assert isinstance(generado, array) and isinstance(cargado, array)
+    assert cargado.tolist() == esperado
+
+
+def test_abrir_conjunto_libera_la_vista(tmp_path):
+    ruta = tmp_path / 'conjunto.bin'
+    ruta.write_bytes(bytes(array('q', [3, 1, 2])))
+    with abrir_conjunto(str(ruta)) as vista:
+        assert vista.tolist() == [3, 1, 2]
+    # Fuera del bloque el mapa está cerrado y la vista liberada
+    with pytest.raises(ValueError):
+        vista.tolist()
+
+    vacio = tmp_path / 'vacio.bin'
+    vacio.write_bytes(b'')
+    with abrir_conjunto(str(vacio)) as vista:
+        assert vista.tolist() == []
+
+
+def test_desalojo_por_presupuesto(tmp_path):
+    directorio = str(tmp_path)
+    for semilla in range(4):
+        cargar_o_generar('aleatoria', 20_000, semilla, directorio=directorio, presupuesto_mb=0.2)
+    # Cada conjunto ocupa ~160 KB: sólo cabe el más reciente
+    assert list(_leer_indice(directorio)) == [clave_cache('aleatoria', 20_000, 3)]
@@ -0,0 +1,63 @@
+"""
+Pruebas del ajuste de complejidad empírica
+"""
+
+import math
+
+import pytest
+
+from complejidad import (
+    ajustar_loglog, analizar_complejidad, predecir_tiempo, predecir_desde_resultados,
+    generar_reporte_complejidad,
+)
+
+
+TAMANOS = [100, 200, 400, 800, 1600, 3200]
+
+
+def _resultados(algoritmo, f, ruido=(1.0,)):
+    return [{'algoritmo': algoritmo, 'escenario': 'aleatoria', 'tamano': n,
+             'promedio_segundos': f(n) * ruido[i % len(ruido)]}
+            for i, n in enumerate(TAMANOS)]
+
+
+@pytest.mark.parametrize("exponente", [1.0, 1.5, 2.0, 3.0])
+def test_loglog_recupera_el_exponente(exponente):
+    ajuste = ajustar_loglog(TAMANOS, [2e-9 * n ** exponente for n in TAMANOS])
+    assert ajuste['exponente'] == pytest.approx(exponente)
+    assert ajuste['constante'] == pytest.approx(2e-9)
+    assert ajuste['r2'] == pytest.approx(1.0)
+    assert predecir_tiempo(ajuste, 10_000) == pytest.approx(2e-9 * 10_000 ** exponente)
+
+
+def test_loglog_con_ruido():
+    ruido = [1.08, 0.93, 1.05, 0.97, 1.02, 0.95]
+    ajuste = ajustar_loglog(TAMANOS, [1e-8 * n * n * r for n, r in zip(TAMANOS, ruido)])
+    assert ajuste['exponente'] == pytest.approx(2.0, abs=0.05)
+    assert 0.99 < ajuste['r2'] < 1.0
+
+
+@pytest.mark.parametrize("f, modelo", [
+    (lambda n: 1e-7 * n, 'O(n)'),
+    (lambda n: 1e-7 * n * math.log2(n), 'O(n log n)'),
+    (lambda n: 1e-9 * n * n, 'O(n²)'),
+])
+def test_clase_teorica_mas_cercana(f, modelo):
+    analisis = analizar_complejidad(_resultados('X', f, ruido=(1.02, 0.98)))
+    assert analisis[('X', 'aleatoria')]['mejor']['modelo'] == modelo
+
+
+def test_series_sin_dos_tamanos_no_se_ajustan():
+    resultados = _resultados('Bubble Sort', lambda n: 1e-9 * n * n)
+    resultados += [{'algoritmo': 'QuickSort', 'escenario': 'aleatoria', 'tamano': 100,
+                    'promedio_segundos': 1e-4},
+                   {'algoritmo': 'QuickSort', 'escenario': 'aleatoria', 'tamano': 200,
+                    'error': 'falló'}]
+    assert set(analizar_complejidad(resultados)) == {('Bubble Sort', 'aleatoria')}
+    assert predecir_desde_resultados(resultados, 'QuickSort', 'aleatoria', 10_000) is None
+    assert predecir_desde_resultados(resultados, 'Bubble Sort', 'aleatoria',
+                                     6400) == pytest.approx(1e-9 * 6400 ** 2)
+
+    reporte = generar_reporte_complejidad(resultados, tamanos_prediccion=(6400,))
+    assert "Bubble Sort (aleatoria)" in reporte and "n^2.00" in reporte
+    assert "QuickSort" not in reporte
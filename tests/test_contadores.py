@@ -0,0 +1,88 @@
+"""
+Pruebas de los contadores de operaciones
+"""
+
+import pytest
+
+import sorting_algorithms
+from contadores import contar_operaciones
+from data_generator import generar_conjunto
+from sorting_algorithms import (
+    bubble_sort, quicksort, quicksort_inplace, introsort, merge_sort_natural,
+)
+
+
+def test_bubble_sort_invertida_hace_n_cuadrado_medios_comparaciones():
+    n = 50
+    conteo = contar_operaciones(bubble_sort, list(range(n, 0, -1)))
+    assert conteo['comparaciones'] == n * (n - 1) // 2
+    # Cada intercambio escribe dos posiciones
+    assert conteo['movimientos'] == n * (n - 1)
+
+
+@pytest.mark.parametrize('algoritmo', [quicksort, quicksort_inplace, introsort],
+                         ids=lambda a: a.__name__)
+def test_algoritmos_recursivos_registran_particiones_y_profundidad(algoritmo):
+    conteo = contar_operaciones(algoritmo, generar_conjunto('aleatoria', 500, semilla=2))
+    assert conteo['comparaciones'] > 0
+    assert conteo['particiones'] > 0
+    assert conteo['profundidad_max'] > 0
+
+
+def test_quicksort_inplace_cuenta_las_particiones_del_ciclo_de_cola():
+    # Ambas particiones ocurren en el ciclo de la llamada inicial; las dos
+    # llamadas recursivas son sobre rangos vacíos
+    conteo = contar_operaciones(quicksort_inplace, [3, 1, 2])
+    assert conteo['particiones'] == 2
+    assert conteo['llamadas_recursivas'] == 3
+    assert contar_operaciones(quicksort_inplace, [5] * 100)['particiones'] == 1
+
+
+def test_quicksort_inplace_particiones_aleatoria():
+    conteo = contar_operaciones(quicksort_inplace, generar_conjunto('aleatoria', 2000, semilla=2))
+    # Casi cada llamada recursiva particiona, además de las pasadas del ciclo
+    assert conteo['particiones'] >= conteo['llamadas_recursivas'] // 2
+
+
+def test_quicksort_movimientos_exactos():
+    # Reparto: 3 + 2; concatenaciones: (0 + 1 + 2) + (0 + 1 + 3); caso base [3]: 1
+    conteo = contar_operaciones(quicksort, [3, 1, 2])
+    assert conteo['movimientos'] == 13
+    assert conteo['particiones'] == 2
+
+
+@pytest.mark.parametrize('algoritmo', [quicksort, quicksort_inplace], ids=lambda a: a.__name__)
+def test_copias_contadas_ordenan_igual(algoritmo):
+    from contadores import _ListaContada, _Elemento, _instrumentado
+
+    datos = generar_conjunto('pocos_unicos', 500, semilla=2)
+    with _instrumentado():
+        import contadores
+        contadores._contador = dict.fromkeys(('comparaciones', 'movimientos', 'copias',
+                                              'particiones', 'llamadas_recursivas',
+                                              'profundidad_max', '_profundidad'), 0)
+        try:
+            entrada = _ListaContada(_Elemento(x) for x in datos)
+            resultado = getattr(sorting_algorithms, algoritmo.__name__)(entrada)
+        finally:
+            contadores._contador = None
+    resultado = entrada if resultado is None else resultado
+    assert [x.valor for x in resultado] == sorted(datos)
+
+
+def test_merge_sort_natural_cuenta_escrituras_de_mezcla():
+    datos = generar_conjunto('aleatoria', 256, semilla=2)
+    conteo = contar_operaciones(merge_sort_natural, datos)
+    # Cada pasada de mezcla escribe los n elementos
+    assert conteo['movimientos'] > 0
+    assert conteo['movimientos'] % len(datos) == 0
+
+
+def test_el_modulo_queda_sin_instrumentar():
+    originales = (sorting_algorithms.quicksort, sorting_algorithms._quicksort_inplace,
+                  sorting_algorithms._particionar, sorting_algorithms._mezclar)
+    contar_operaciones(quicksort_inplace, [3, 1, 2])
+    contar_operaciones(quicksort, [3, 1, 2])
+    assert (sorting_algorithms.quicksort, sorting_algorithms._quicksort_inplace,
+            sorting_algorithms._particionar, sorting_algorithms._mezclar) == originales
+    assert not hasattr(sorting_algorithms._mezclar, '__wrapped__')
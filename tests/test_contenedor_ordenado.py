@@ -0,0 +1,87 @@
+"""
+Pruebas de ListaOrdenada contra una lista de referencia ordenada con sorted()
+"""
+
+import random
+from bisect import bisect_left, bisect_right
+
+import pytest
+
+from contenedor_ordenado import ListaOrdenada
+
+
+@pytest.mark.parametrize('semilla', range(5))
+def test_operaciones_aleatorias_contra_referencia(semilla):
+    # Carga pequeña para ejercitar divisiones y sublistas que se vacían
+    rng = random.Random(semilla)
+    lista = ListaOrdenada(carga=4)
+    referencia = []
+
+    for _ in range(600):
+        operacion = rng.random()
+        if operacion < 0.45:
+            valor = rng.randrange(50)
+            lista.agregar(valor)
+            referencia.append(valor)
+        elif operacion < 0.6:
+            lote = [rng.randrange(50) for _ in range(rng.randrange(30))]
+            lista.actualizar(lote)
+            referencia.extend(lote)
+        else:
+            valor = rng.randrange(50)
+            assert lista.descartar(valor) == (valor in referencia)
+            if valor in referencia:
+                referencia.remove(valor)
+        referencia.sort()
+
+        assert len(lista) == len(referencia)
+        valor = rng.randrange(-1, 51)
+        assert (valor in lista) == (valor in referencia)
+        assert lista.posicion(valor) == bisect_left(referencia, valor)
+        if referencia:
+            posicion = rng.randrange(len(referencia))
+            assert lista[posicion] == referencia[posicion]
+            assert lista[-1] == referencia[-1]
+
+    assert list(lista) == referencia
+    assert list(reversed(lista)) == referencia[::-1]
+
+
+def test_consultas_por_rango():
+    rng = random.Random(1)
+    datos = [rng.randrange(100) for _ in range(500)]
+    lista = ListaOrdenada(datos, carga=8)
+    referencia = sorted(datos)
+
+    assert list(lista.rango_valores(20, 40)) == [x for x in referencia if 20 <= x <= 40]
+    assert list(lista.rango_valores(maximo=10)) == [x for x in referencia if x <= 10]
+    assert list(lista.rango_valores(90)) == [x for x in referencia if x >= 90]
+    assert lista.contar_rango(20, 40) == bisect_right(referencia, 40) - bisect_left(referencia, 20)
+    assert lista.contar_rango(40, 20) == 0
+    assert list(lista.rebanada(100, 130)) == referencia[100:130]
+    assert list(lista.rebanada(-5, 3)) == referencia[:3]
+
+
+def test_fusionar_lote_ordenado_grande():
+    lista = ListaOrdenada(range(0, 1000, 2), carga=16)
+    lista.fusionar_ordenado(list(range(1, 1000, 2)))
+    assert list(lista) == list(range(1000))
+    assert lista[500] == 500
+
+
+def test_vacia_y_errores():
+    lista = ListaOrdenada()
+    assert len(lista) == 0
+    assert list(lista) == []
+    assert 3 not in lista
+    assert lista.posicion(3) == 0
+    assert list(lista.rango_valores()) == []
+    with pytest.raises(IndexError):
+        lista[0]
+    with pytest.raises(ValueError):
+        lista.eliminar(3)
+
+    lista.agregar(3)
+    assert lista[0] == 3 and lista[-1] == 3
+    lista.eliminar(3)
+    assert len(lista) == 0
@@ -0,0 +1,54 @@
+"""
+Pruebas de los generadores de escenarios
+"""
+
+import math
+
+import pytest
+
+from contadores import contar_operaciones
+from sorting_algorithms import quicksort
+from data_generator import (
+    GENERADORES, ESCENARIOS_NO_ENTEROS, ESCENARIOS_TEXTO, generar_conjunto,
+    generar_asesino_quicksort, convertir_a_buffer, huella_conjunto,
+)
+
+
+@pytest.mark.parametrize('tamano', [0, 1, 2, 100])
+@pytest.mark.parametrize('escenario', list(GENERADORES))
+def test_tamano_y_tipos(escenario, tamano):
+    datos = generar_conjunto(escenario, tamano, semilla=3)
+    assert len(datos) == tamano
+    if escenario in ESCENARIOS_TEXTO:
+        assert all(isinstance(x, str) for x in datos)
+    elif escenario in ESCENARIOS_NO_ENTEROS:
+        assert all(isinstance(x, float) for x in datos)
+    else:
+        assert all(type(x) is int for x in datos)
+
+
+@pytest.mark.parametrize('escenario', list(GENERADORES))
+def test_reproducible_con_semilla(escenario):
+    primera = generar_conjunto(escenario, 200, semilla=3)
+    segunda = generar_conjunto(escenario, 200, semilla=3)
+    assert huella_conjunto(primera) == huella_conjunto(segunda)
+
+
+@pytest.mark.parametrize('tamano', [1, 2, 10, 101, 300])
+def test_asesino_quicksort_lleva_la_recursion_a_profundidad_n(tamano):
+    datos = generar_asesino_quicksort(tamano)
+    assert sorted(datos) == list(range(1, tamano + 1))
+    assert contar_operaciones(quicksort, datos)['profundidad_max'] == tamano
+
+
+def test_flotantes_especiales_incluye_nan_e_infinitos():
+    datos = generar_conjunto('flotantes_especiales', 2000, semilla=3)
+    assert any(math.isnan(x) for x in datos)
+    assert float('inf') in datos and float('-inf') in datos
+
+
+def test_convertir_a_buffer_rechaza_texto():
+    with pytest.raises(TypeError):
+        convertir_a_buffer(generar_conjunto('cadenas_prefijo', 5, semilla=3))
+    assert convertir_a_buffer([1, 2.5]).typecode == 'd'
+    assert convertir_a_buffer([1, 2]).typecode == 'q'
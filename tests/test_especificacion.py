@@ -0,0 +1,144 @@
+"""
+Pruebas de la especificación de experimentos, los fragmentos y su fusión
+"""
+
+import sys
+import json
+import types
+
+import pytest
+
+from especificacion import (
+    cargar_especificacion, huella_especificacion, expandir, parsear_fragmento,
+    seleccionar_fragmento, fusionar_resultados,
+)
+from performance_tester import ALGORITMOS
+
+
+def _especificacion(**cambios):
+    especificacion = cargar_especificacion()
+    especificacion.update({'tamanos': [10, 20], 'semilla': 1}, **cambios)
+    return especificacion
+
+
+def _fragmentos(especificacion, total):
+    """Resultados simulados de cada fragmento, como los registra main.py"""
+    huella = huella_especificacion(especificacion)
+    casos = expandir(especificacion, ALGORITMOS)
+    listas = []
+    for indice in range(1, total + 1):
+        listas.append([
+            {'algoritmo': a, 'escenario': e, 'tamano': n, 'promedio_segundos': 0.001,
+             'especificacion': huella, 'fragmento': f"{indice}/{total}",
+             'maquina': {'host': f"maquina{indice}"}}
+            for a, e, n in seleccionar_fragmento(casos, indice, total)
+        ])
+    return listas
+
+
+def test_cargar_especificacion_json(tmp_path):
+    ruta = tmp_path / 'spec.json'
+    ruta.write_text(json.dumps({'tamanos': [5, 50], 'repeticiones': 2}))
+    especificacion = cargar_especificacion(str(ruta))
+    assert especificacion['tamanos'] == [5, 50]
+    assert especificacion['repeticiones'] == 2
+    assert especificacion['escenarios'] == ['aleatoria', 'invertida']
+
+
+def test_cargar_especificacion_rechaza_claves_desconocidas(tmp_path):
+    ruta = tmp_path / 'spec.json'
+    ruta.write_text(json.dumps({'tamaños': [5]}))
+    with pytest.raises(ValueError):
+        cargar_especificacion(str(ruta))
+
+
+def test_fragmentos_cubren_la_matriz_sin_repetir():
+    casos = expandir(_especificacion(), ALGORITMOS)
+    fragmentos = [seleccionar_fragmento(casos, i, 3) for i in (1, 2, 3)]
+    assert sorted(c for f in fragmentos for c in f) == sorted(casos)
+    assert parsear_fragmento('2/3') == (2, 3)
+    with pytest.raises(ValueError):
+        parsear_fragmento('4/3')
+
+
+def test_fusionar_con_la_misma_especificacion():
+    especificacion = _especificacion()
+    resultados, maquinas, faltantes = fusionar_resultados(
+        _fragmentos(especificacion, 2), especificacion, ALGORITMOS)
+
+    orden = expandir(especificacion, ALGORITMOS)
+    assert [(r['algoritmo'], r['escenario'], r['tamano']) for r in resultados] == orden
+    assert faltantes == []
+    assert sorted(maquinas) == ['maquina1', 'maquina2']
+    assert sum(m['casos'] for m in maquinas.values()) == len(orden)
+
+
+def test_fusionar_informa_faltantes():
+    especificacion = _especificacion()
+    primero, _ = _fragmentos(especificacion, 2)
+    resultados, _, faltantes = fusionar_resultados([primero], especificacion, ALGORITMOS)
+    assert len(resultados) == len(primero)
+    assert len(faltantes) == len(expandir(especificacion, ALGORITMOS)) - len(primero)
+
+
+def test_fusionar_sin_especificacion_conserva_todo():
+    listas = _fragmentos(_especificacion(), 2)
+    resultados, _, faltantes = fusionar_resultados(listas)
+    assert len(resultados) == sum(len(lista) for lista in listas)
+    assert faltantes == []
+
+
+def test_fusionar_con_otra_especificacion_falla():
+    medida = _especificacion(tamanos=[100, 200])
+    with pytest.raises(ValueError, match='misma --spec'):
+        fusionar_resultados(_fragmentos(medida, 2), _especificacion(), ALGORITMOS)
+
+
+def test_fusionar_fragmentos_de_especificaciones_distintas_falla():
+    primero, _ = _fragmentos(_especificacion(), 2)
+    _, segundo = _fragmentos(_especificacion(tamanos=[30]), 2)
+    with pytest.raises(ValueError, match='distintas'):
+        fusionar_resultados([primero, segundo])
+
+
+def test_fusionar_caso_repetido_falla():
+    primero, _ = _fragmentos(_especificacion(), 2)
+    with pytest.raises(ValueError, match='repetido'):
+        fusionar_resultados([primero, primero])
+
+
+def test_fusionar_resultados_sin_huella_fuera_de_la_matriz():
+    especificacion = _especificacion()
+    ajeno = {'algoritmo': 'QuickSort', 'escenario': 'aleatoria', 'tamano': 999}
+    resultados, _, _ = fusionar_resultados(_fragmentos(especificacion, 1) + [[ajeno]],
+                                           especificacion, ALGORITMOS)
+    assert resultados[-1] is ajeno
+
+
+def test_cargar_especificacion_toml(tmp_path):
+    pytest.importorskip('tomllib' if sys.version_info >= (3, 11) else 'tomli')
+    ruta = tmp_path / 'spec.toml'
+    ruta.write_text('tamanos = [5, 50]\nalgoritmos = ["QuickSort"]\n')
+    especificacion = cargar_especificacion(str(ruta))
+    assert especificacion['tamanos'] == [5, 50]
+    assert especificacion['algoritmos'] == ['QuickSort']
+
+
+def test_cargar_especificacion_toml_con_tomli(tmp_path, monkeypatch):
+    # Python < 3.11: tomllib no existe y se usa tomli
+    tomli = types.ModuleType('tomli')
+    tomli.load = lambda f: {'tamanos': [7]}
+    monkeypatch.setitem(sys.modules, 'tomllib', None)
+    monkeypatch.setitem(sys.modules, 'tomli', tomli)
+    ruta = tmp_path / 'spec.toml'
+    ruta.write_text('tamanos = [7]\n')
+    assert cargar_especificacion(str(ruta))['tamanos'] == [7]
+
+
+def test_cargar_especificacion_toml_sin_lector(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'tomllib', None)
+    monkeypatch.setitem(sys.modules, 'tomli', None)
+    ruta = tmp_path / 'spec.toml'
+    ruta.write_text('tamanos = [7]\n')
+    with pytest.raises(ValueError, match='tomli'):
+        cargar_especificacion(str(ruta))
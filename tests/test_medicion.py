@@ -0,0 +1,116 @@
+"""
+Pruebas de la medición rigurosa y del perfil de memoria por caso
+"""
+
+import time
+import itertools
+import tracemalloc
+from array import array
+
+import pytest
+
+import medicion
+from medicion import perfilar_memoria, medir_tiempo_riguroso, DURACION_MINIMA_MUESTRA_S
+from sorting_algorithms import quicksort, introsort_inplace, bubble_sort
+
+
+CLAVES = {'memoria_pico_bytes', 'asignaciones_netas', 'bytes_netos', 'rss_delta_bytes'}
+
+
+def test_perfilar_memoria_lista():
+    perfil = perfilar_memoria(quicksort, list(range(2000, 0, -1)))
+    assert set(perfil) == CLAVES
+    assert perfil['memoria_pico_bytes'] > 0
+    assert not tracemalloc.is_tracing()
+
+
+def test_perfilar_memoria_sin_reset_peak(monkeypatch):
+    # Python 3.8 no tiene tracemalloc.reset_peak
+    monkeypatch.delattr(tracemalloc, 'reset_peak', raising=False)
+    perfil = perfilar_memoria(quicksort, list(range(2000, 0, -1)))
+    assert perfil['memoria_pico_bytes'] > 0
+    assert not tracemalloc.is_tracing()
+
+
+def test_perfilar_memoria_in_place_no_modifica_la_entrada():
+    datos = array('q', range(500, 0, -1))
+    perfilar_memoria(introsort_inplace, datos, in_place=True)
+    assert datos.tolist() == list(range(500, 0, -1))
+
+
+@pytest.mark.parametrize("con_reset_peak", [True, False])
+def test_bytes_netos_excluyen_las_instantaneas(monkeypatch, con_reset_peak):
+    if not con_reset_peak:
+        monkeypatch.delattr(tracemalloc, 'reset_peak', raising=False)
+    # Sin asignaciones del algoritmo no debe quedar rastro de las instantáneas
+    assert perfilar_memoria(lambda lista: None, list(range(1000)))['bytes_netos'] < 256
+    # Una copia de 1000 elementos ocupa al menos 8 bytes por elemento
+    copia = perfilar_memoria(list, list(range(1000)))
+    assert 8000 <= copia['bytes_netos'] < 8000 + 512
+
+
+def _dormir(segundos):
+    def algoritmo(lista):
+        time.sleep(segundos)
+        return lista
+    return algoritmo
+
+
+def _fallar(lista):
+    raise ValueError("entrada rechazada")
+
+
+def test_calibracion_del_lazo_interno():
+    _, _, tiempos, info = medir_tiempo_riguroso(sorted, list(range(20)), repeticiones_max=5)
+    # Una ejecución dura mucho menos que DURACION_MINIMA_MUESTRA_S
+    assert info['lazo_interno'] > 1
+    # Cada muestra es el tiempo por ejecución, no el del lazo completo
+    assert all(0 < t < DURACION_MINIMA_MUESTRA_S for t in tiempos)
+
+    _, _, _, info = medir_tiempo_riguroso(_dormir(0.02), [1], repeticiones_min=2,
+                                          repeticiones_max=2, calentamiento=0)
+    assert info['lazo_interno'] == 1
+
+
+def test_regla_de_parada_por_intervalo(monkeypatch):
+    # Muestras idénticas: el IC es 0 y se detiene al llegar a repeticiones_min
+    monkeypatch.setattr(medicion, '_cronometrar', lambda algoritmo, entradas: 0.5)
+    _, desviacion, tiempos, info = medir_tiempo_riguroso(sorted, [2, 1], repeticiones_min=4)
+    assert len(tiempos) == 4 and desviacion == 0 and info['ic95_segundos'] == 0
+
+    # Muestras muy dispersas: nunca alcanza el IC y se detiene en repeticiones_max
+    alternadas = itertools.cycle([0.1, 1.0])
+    monkeypatch.setattr(medicion, '_cronometrar',
+                        lambda algoritmo, entradas: next(alternadas))
+    _, _, tiempos, info = medir_tiempo_riguroso(sorted, [2, 1], repeticiones_min=4,
+                                                repeticiones_max=9, ic_relativo=0.01)
+    assert len(tiempos) == 9 and info['tiempo_agotado'] is False
+
+
+def test_presupuesto_agotado_antes_de_la_primera_muestra():
+    inicio = time.monotonic()
+    with pytest.raises(TimeoutError):
+        medir_tiempo_riguroso(_dormir(5), [1], calentamiento=0, presupuesto_s=0.3)
+    # El proceso de medición se termina sin esperar al algoritmo
+    assert time.monotonic() - inicio < 3
+
+
+def test_presupuesto_conserva_las_muestras_tomadas():
+    _, _, tiempos, info = medir_tiempo_riguroso(_dormir(0.05), [1], repeticiones_min=1000,
+                                                repeticiones_max=1000, ic_relativo=0,
+                                                presupuesto_s=0.6)
+    assert info['tiempo_agotado'] is True
+    assert len(tiempos) >= 2
+    assert all(t >= 0.05 for t in tiempos)
+
+
+def test_presupuesto_sin_agotar():
+    _, _, tiempos, info = medir_tiempo_riguroso(bubble_sort, list(range(200, 0, -1)),
+                                                repeticiones_min=3, repeticiones_max=3,
+                                                presupuesto_s=30)
+    assert len(tiempos) == 3 and info['tiempo_agotado'] is False
+
+
+def test_errores_del_proceso_de_medicion_se_propagan():
+    with pytest.raises(RuntimeError, match="entrada rechazada"):
+        medir_tiempo_riguroso(_fallar, [1], presupuesto_s=10)
@@ -0,0 +1,44 @@
+"""
+Pruebas del selector adaptativo sort_auto
+"""
+
+import random
+
+import pytest
+
+from data_generator import GENERADORES, generar_conjunto
+from ordenamiento_adaptativo import analizar_entrada, elegir_algoritmo, sort_auto
+
+
+@pytest.mark.parametrize('tamano', [0, 1, 2, 31, 500])
+@pytest.mark.parametrize('escenario', [e for e in GENERADORES if e != 'flotantes_especiales'])
+def test_sort_auto_igual_a_sorted(escenario, tamano):
+    datos = generar_conjunto(escenario, tamano, semilla=11)
+    assert sort_auto(datos) == sorted(datos)
+
+
+def test_muchos_duplicados_usa_tres_vias():
+    datos = [float(i % 7) for i in range(2000)]
+    random.Random(1).shuffle(datos)
+    resultado, decision = sort_auto(datos, devolver_decision=True)
+    assert decision == 'tres_vias'
+    assert resultado == sorted(datos)
+
+
+def test_pocas_inversiones_usa_merge_natural():
+    # Pares vecinos intercambiados: muchas corridas cortas pero casi ordenada
+    datos = [float(i) for i in range(2000)]
+    for i in range(0, 2000, 4):
+        datos[i], datos[i + 1] = datos[i + 1], datos[i]
+    perfil = analizar_entrada(datos)
+    assert perfil['corridas'] > 2000 / 16
+    assert elegir_algoritmo(perfil) == 'merge_natural'
+    assert sort_auto(datos) == sorted(datos)
+
+
+def test_flotantes_aleatorios_usan_introsort():
+    rng = random.Random(2)
+    datos = [rng.random() for _ in range(2000)]
+    resultado, decision = sort_auto(datos, devolver_decision=True)
+    assert decision == 'introsort'
+    assert resultado == sorted(datos)
@@ -0,0 +1,61 @@
+"""
+Pruebas del ordenamiento externo y de la escritura de conjuntos binarios
+"""
+
+import random
+from array import array
+
+import pytest
+
+from ordenamiento_externo import ordenamiento_externo, leer_archivo_binario
+from data_generator import escribir_conjunto_binario
+
+
+def _ordenar_archivo(tmp_path, datos, tipo='q', elementos_por_bloque=4):
+    entrada = tmp_path / 'entrada.bin'
+    salida = tmp_path / 'salida.bin'
+    entrada.write_bytes(array(tipo, datos).tobytes())
+    info = ordenamiento_externo(str(entrada), str(salida), tipo=tipo,
+                                elementos_por_bloque=elementos_por_bloque,
+                                directorio_temporal=str(tmp_path))
+    return info, leer_archivo_binario(str(salida), tipo).tolist()
+
+
+@pytest.mark.parametrize("n", [0, 1, 3, 4, 5, 8, 9, 37])
+def test_limites_de_corrida(tmp_path, n):
+    datos = [random.Random(n).randint(-50, 50) for _ in range(n)]
+    info, ordenados = _ordenar_archivo(tmp_path, datos)
+    assert ordenados == sorted(datos)
+    assert info['elementos'] == n
+    # Una corrida por bloque de 4 (el archivo vacío también produce una)
+    assert info['corridas'] == max(1, -(-n // 4))
+    # Las corridas temporales se borran al terminar
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['entrada.bin', 'salida.bin']
+
+
+def test_tipo_real(tmp_path):
+    rng = random.Random(4)
+    datos = [rng.uniform(-1e6, 1e6) for _ in range(50)] + [0.0, -0.0, 1e-300]
+    info, ordenados = _ordenar_archivo(tmp_path, datos, tipo='d', elementos_por_bloque=7)
+    assert ordenados == sorted(datos)
+    assert info['bytes'] == len(datos) * 8
+
+
+def test_archivo_truncado(tmp_path):
+    entrada = tmp_path / 'entrada.bin'
+    entrada.write_bytes(b'\x00' * 12)
+    with pytest.raises(ValueError, match="múltiplo de 8"):
+        ordenamiento_externo(str(entrada), str(tmp_path / 'salida.bin'))
+
+
+@pytest.mark.parametrize("escenario", ['aleatoria', 'invertida', 'casi_ordenada'])
+def test_conjunto_binario_reproducible_con_semilla(tmp_path, escenario):
+    rutas = [str(tmp_path / f'{i}.bin') for i in range(3)]
+    for ruta, semilla in zip(rutas, (7, 7, 8)):
+        bytes_escritos = escribir_conjunto_binario(ruta, escenario, 1000,
+                                                   elementos_por_bloque=300, semilla=semilla)
+        assert bytes_escritos == 8000
+    primero, repetido, otro = (leer_archivo_binario(ruta).tolist() for ruta in rutas)
+    assert primero == repetido
+    if escenario != 'invertida':
+        assert primero != otro
@@ -0,0 +1,86 @@
+"""
+Pruebas del perfilado por caso: nombres de archivo y pilas colapsadas
+"""
+
+import re
+from types import SimpleNamespace
+from collections import Counter
+
+import pytest
+
+from perfilado import (
+    nombre_archivo_caso, pilas_desde_pstats, escribir_pilas, perfilar_caso,
+    generar_reporte_perfiles,
+)
+from sorting_algorithms import quicksort
+
+
+# Formato de flamegraph.pl: marcos separados por ';', un espacio y el peso entero
+LINEA_PILA = re.compile(r'^[^;\n]+(;[^;\n]+)* \d+$')
+
+
+@pytest.mark.parametrize("nombre, esperado", [
+    ('Bubble Sort', 'bubble_sort_aleatoria_1000'),
+    ('Sample Sort 4p', 'sample_sort_4p_aleatoria_1000'),
+    ('Reordenar por lote (QuickSort)', 'reordenar_por_lote_quicksort_aleatoria_1000'),
+    ('Top-100', 'top_100_aleatoria_1000'),
+])
+def test_nombre_archivo_caso(nombre, esperado):
+    assert nombre_archivo_caso(nombre, 'aleatoria', 1000) == esperado
+
+
+def _funcion(nombre, linea):
+    return ('/ruta/modulo.py', linea, nombre)
+
+
+def test_pilas_desde_pstats_sigue_al_llamador_mas_costoso():
+    principal, a, b, c = (_funcion(n, i) for i, n in enumerate('pabc', 1))
+    append = ('~', 0, "<method 'append' of 'list' objects>")
+    # (llamadas primitivas, llamadas, tiempo propio, acumulado, llamadores)
+    estadisticas = SimpleNamespace(stats={
+        principal: (1, 1, 0.001, 0.010, {}),
+        a: (1, 3, 0.002, 0.006, {principal: (1, 1, 0.002, 0.006),
+                                 a: (0, 2, 0.001, 0.004)}),
+        c: (1, 1, 0.001, 0.003, {principal: (1, 1, 0.001, 0.003)}),
+        b: (2, 2, 0.004, 0.005, {a: (1, 1, 0.003, 0.004), c: (1, 1, 0.001, 0.001)}),
+        append: (5, 5, 0.000_0004, 0.000_0004, {b: (5, 5, 0.000_0004, 0.000_0004)}),
+    })
+
+    pilas = pilas_desde_pstats(estadisticas)
+    assert pilas == {
+        'p (modulo.py:1)': 1000,
+        # La recursión de a queda como un solo nivel
+        'p (modulo.py:1);a (modulo.py:2)': 2000,
+        'p (modulo.py:1);c (modulo.py:4)': 1000,
+        # b cuelga de a, que le aporta más tiempo acumulado que c
+        'p (modulo.py:1);a (modulo.py:2);b (modulo.py:3)': 4000,
+    }
+    # Las funciones con menos de un microsegundo propio no generan pila
+    assert not any('append' in pila for pila in pilas)
+
+
+def test_perfilar_caso_escribe_pilas_colapsadas(tmp_path):
+    datos = list(range(300, 0, -1))
+    info = perfilar_caso(quicksort, datos, 'QuickSort', 'invertida', 300, str(tmp_path),
+                         muestreo=True, intervalo_s=0.0001)
+    assert info['perfil_pstats'].endswith('quicksort_invertida_300.pstats')
+    assert datos == list(range(300, 0, -1))
+
+    for clave in ('perfil_pilas', 'perfil_muestreo'):
+        with open(info[clave], encoding='utf-8') as f:
+            lineas = f.read().splitlines()
+        assert all(LINEA_PILA.match(linea) for linea in lineas)
+    # Desde el grafo de cProfile, quicksort aparece como raíz de su propia pila
+    with open(info['perfil_pilas'], encoding='utf-8') as f:
+        assert any(linea.startswith('quicksort (sorting_algorithms.py:') for linea in f)
+    assert info['funciones_calientes'][0]['tiempo_propio_s'] > 0
+
+    reporte = generar_reporte_perfiles([dict(info, algoritmo='QuickSort',
+                                             escenario='invertida', tamano=300)])
+    assert 'QuickSort (invertida)' in reporte and info['perfil_pstats'] in reporte
+
+
+def test_escribir_pilas_de_mayor_a_menor_peso(tmp_path):
+    ruta = tmp_path / 'pilas.txt'
+    escribir_pilas(Counter({'a;b': 3, 'a': 10, 'a;b;c': 1}), str(ruta))
+    assert ruta.read_text(encoding='utf-8') == "a 10\na;b 3\na;b;c 1\n"
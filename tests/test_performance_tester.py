@@ -0,0 +1,96 @@
+"""
+Pruebas de la matriz de ejecución: casos soportados por cada algoritmo
+"""
+
+import pytest
+
+from data_generator import ESCENARIOS_ADVERSARIALES, generar_conjunto, huella_conjunto
+from especificacion import cargar_especificacion, expandir
+from performance_tester import (
+    ALGORITMOS, ALGORITMOS_IN_PLACE, ALGORITMOS_SOLO_ENTEROS, caso_soportado,
+    ejecutar_pruebas_completas, ejecutar_pruebas_adaptativas, ejecutar_pruebas_externas,
+    ejecutar_pruebas_paralelas,
+)
+
+
+ESCENARIOS = ['aleatoria'] + list(ESCENARIOS_ADVERSARIALES)
+
+
+def test_caso_soportado():
+    assert caso_soportado('Radix Sort', 'aleatoria')
+    assert not caso_soportado('Radix Sort', 'flotantes_especiales')
+    assert not caso_soportado('Counting Sort', 'cadenas_prefijo')
+    assert caso_soportado('QuickSort', 'cadenas_prefijo')
+    assert not caso_soportado('QuickSort', 'cadenas_prefijo', in_place=True)
+    assert caso_soportado('QuickSort', 'flotantes_especiales', in_place=True)
+
+
+def test_expandir_omite_casos_no_soportados():
+    especificacion = cargar_especificacion()
+    especificacion.update(tamanos=[10, 20], escenarios=ESCENARIOS)
+    casos = expandir(especificacion, ALGORITMOS, caso_soportado)
+    assert ('QuickSort', 'cadenas_prefijo', 10) in casos
+    assert ('Radix Sort', 'aleatoria', 10) in casos
+    assert not any(a in ALGORITMOS_SOLO_ENTEROS and e in ('flotantes_especiales',
+                                                          'cadenas_prefijo')
+                   for a, e, _ in casos)
+
+
+@pytest.mark.parametrize('in_place', [False, True], ids=['listas', 'in_place'])
+def test_escenarios_adversariales_sin_errores(in_place):
+    resultados = ejecutar_pruebas_completas([50, 300], ESCENARIOS, repeticiones=1,
+                                            semilla=1, in_place=in_place)
+    assert resultados
+    assert [r for r in resultados if 'error' in r] == []
+
+    medidos = {(r['algoritmo'], r['escenario']) for r in resultados}
+    algoritmos = ALGORITMOS_IN_PLACE if in_place else ALGORITMOS
+    esperados = {(a, e) for a in algoritmos for e in ESCENARIOS
+                 if caso_soportado(a, e, in_place)}
+    assert medidos == esperados
+    if in_place:
+        assert not any(e == 'cadenas_prefijo' for _, e in medidos)
+
+
+def test_in_place_entrada_no_convertible_es_error_por_caso(monkeypatch):
+    import data_generator
+
+    def conjuntos_mixtos(tamanos, escenarios, **opciones):
+        return {f"aleatoria_{n}": [1, 'a'] * (n // 2) for n in tamanos}
+
+    monkeypatch.setattr(data_generator, 'obtener_conjuntos_prueba', conjuntos_mixtos)
+    resultados = ejecutar_pruebas_completas([10], ['aleatoria'], repeticiones=1,
+                                            in_place=True)
+    assert len(resultados) == len(ALGORITMOS_IN_PLACE)
+    assert all('no convertible' in r['error'] for r in resultados)
+
+
+def test_subpruebas_registran_semilla_y_huella(tmp_path):
+    esperado = huella_conjunto(generar_conjunto('aleatoria', 300, 5))
+
+    for r in ejecutar_pruebas_adaptativas([300], ['aleatoria'], repeticiones=1, semilla=5):
+        assert (r['semilla'], r['huella_datos']) == (5, esperado)
+
+    # El archivo del ordenamiento externo es el mismo con la misma semilla
+    huellas = [{r['huella_datos'] for r in ejecutar_pruebas_externas(
+        [300], ['aleatoria'], repeticiones=1, directorio=str(tmp_path), semilla=5)}
+        for _ in range(2)]
+    assert len(huellas[0]) == 1 and huellas[0] == huellas[1]
+
+
+def test_paralelo_registra_semilla_y_huella():
+    esperado = huella_conjunto(generar_conjunto('invertida', 2000, 9))
+    resultados = ejecutar_pruebas_paralelas([2000], ['invertida'], repeticiones=1,
+                                            procesos=[2], semilla=9)
+    assert [r['algoritmo'] for r in resultados] == ['QuickSort', 'Sample Sort 2p']
+    for r in resultados:
+        assert (r['semilla'], r['huella_datos']) == (9, esperado)
+
+
+def test_adaptativo_registra_el_motor_de_las_ejecuciones_medidas():
+    resultados = ejecutar_pruebas_adaptativas([500], ['invertida', 'pocos_unicos'],
+                                              repeticiones=3, semilla=2)
+    decisiones = {r['escenario']: r['decision'] for r in resultados}
+    assert decisiones == {'invertida': 'invertir', 'pocos_unicos': 'counting'}
+    for r in resultados:
+        assert sum(r['decisiones'].values()) == r['repeticiones'] == 3
@@ -0,0 +1,121 @@
+"""
+Pruebas del punto de control JSONL: escritura, interrupción y reanudación
+"""
+
+import pytest
+
+from performance_tester import ejecutar_pruebas_completas, ALGORITMOS
+from punto_control import agregar_resultado, leer_resultados, clave_caso
+
+
+TAMANOS = [20, 40]
+ESCENARIOS = ['aleatoria', 'invertida']
+SEMILLA = 5
+
+
+def _ejecutar(ruta, **opciones):
+    return ejecutar_pruebas_completas(TAMANOS, ESCENARIOS, repeticiones=1, semilla=SEMILLA,
+                                      al_completar=lambda r: agregar_resultado(ruta, r),
+                                      **opciones)
+
+
+def test_agregar_y_leer_conserva_orden(tmp_path):
+    ruta = str(tmp_path / 'checkpoint.jsonl')
+    for i in range(3):
+        agregar_resultado(ruta, {'algoritmo': 'A', 'escenario': 'e', 'tamano': i})
+    assert [r['tamano'] for r in leer_resultados(ruta)] == [0, 1, 2]
+
+
+def test_linea_incompleta_se_ignora_y_no_se_une_a_la_siguiente(tmp_path):
+    ruta = tmp_path / 'checkpoint.jsonl'
+    agregar_resultado(str(ruta), {'tamano': 1})
+    with open(ruta, 'a', encoding='utf-8') as f:
+        f.write('{"tamano": 2, "alg')
+    assert [r['tamano'] for r in leer_resultados(str(ruta))] == [1]
+
+    agregar_resultado(str(ruta), {'tamano': 3})
+    assert [r['tamano'] for r in leer_resultados(str(ruta))] == [1, 3]
+
+
+def test_interrupcion_y_reanudacion(tmp_path):
+    ruta = str(tmp_path / 'checkpoint.jsonl')
+    total = len(TAMANOS) * len(ESCENARIOS) * len(ALGORITMOS)
+    limite = total // 2
+
+    def interrumpir(resultado):
+        agregar_resultado(ruta, resultado)
+        if sum(1 for _ in leer_resultados(ruta)) == limite:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        ejecutar_pruebas_completas(TAMANOS, ESCENARIOS, repeticiones=1, semilla=SEMILLA,
+                                   al_completar=interrumpir)
+    # El proceso murió mientras escribía la siguiente línea
+    with open(ruta, 'a', encoding='utf-8') as f:
+        f.write('{"algoritmo": "QuickSort", "esc')
+
+    antes = list(leer_resultados(ruta))
+    assert len(antes) == limite
+
+    _ejecutar(ruta, completados=antes)
+
+    resultados = list(leer_resultados(ruta))
+    claves = [clave_caso(r) for r in resultados]
+    assert len(claves) == total
+    assert len(set(claves)) == total
+    assert resultados[:limite] == antes
+    assert all('error' not in r and r['semilla'] == SEMILLA for r in resultados)
+
+
+def test_reanudar_ejecucion_completa_no_repite_casos(tmp_path):
+    ruta = str(tmp_path / 'checkpoint.jsonl')
+    _ejecutar(ruta)
+    completos = list(leer_resultados(ruta))
+
+    _ejecutar(ruta, completados=completos)
+    assert list(leer_resultados(ruta)) == completos
+
+
+def test_resume_con_ruta_reanuda_ese_archivo(tmp_path):
+    from argparse import Namespace
+    from main import resolver_punto_control
+
+    ruta = str(tmp_path / 'checkpoint.jsonl')
+    agregar_resultado(ruta, {'tamano': 1})
+    assert resolver_punto_control(Namespace(resume=ruta, checkpoint=None), 'x') == (ruta, True)
+
+    with pytest.raises(SystemExit):
+        resolver_punto_control(Namespace(resume=ruta + '.no', checkpoint=None), 'x')
+
+
+def test_sin_resume_no_agrega_a_un_punto_de_control_existente(tmp_path):
+    from argparse import Namespace
+    from main import resolver_punto_control
+
+    ruta = str(tmp_path / 'checkpoint.jsonl')
+    assert resolver_punto_control(Namespace(resume=None, checkpoint=ruta), 'x') == (ruta, False)
+
+    agregar_resultado(ruta, {'tamano': 1})
+    with pytest.raises(SystemExit, match="--resume"):
+        resolver_punto_control(Namespace(resume=None, checkpoint=ruta), 'x')
+
+
+@pytest.mark.parametrize("argv", [
+    ['--externo', '--paralelo'],
+    ['--fusionar', 'a.jsonl', '--seleccion'],
+    ['--flujo', '--shard', '1/2'],
+    ['--burbuja', '--resume'],
+    ['--fusionar', 'a.jsonl', '--resume', 'b.jsonl'],
+])
+def test_opciones_incompatibles_se_rechazan(argv):
+    from main import parsear_argumentos
+
+    with pytest.raises(SystemExit):
+        parsear_argumentos(argv)
+
+
+def test_opciones_compatibles():
+    from main import parsear_argumentos
+
+    assert parsear_argumentos(['--shard', '1/2', '--resume']).resume == 'latest'
+    assert parsear_argumentos(['--paralelo', '--procesos', '1,2']).paralelo
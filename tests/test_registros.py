@@ -0,0 +1,92 @@
+"""
+Pruebas de argsort por varias claves y del ordenamiento de registros por columnas
+"""
+
+import random
+from array import array
+
+import pytest
+
+from sorting_algorithms import argsort_multiple, quicksort
+from registros import a_columnas, ordenar_columnas, ordenar_registros
+
+
+def _referencia(columnas, reversos):
+    """Permutación estable con pasadas de sorted, de la clave menos a la más significativa"""
+    orden = list(range(len(columnas[0])))
+    for columna, reverso in reversed(list(zip(columnas, reversos))):
+        # sorted con reverse=True conserva el orden original de los empates
+        orden = sorted(orden, key=columna.__getitem__, reverse=reverso)
+    return orden
+
+
+def _columnas(semilla, n=300):
+    rng = random.Random(semilla)
+    return {
+        'negativos': [rng.randint(-5, 5) for _ in range(n)],
+        'grandes': [rng.randint(-10 ** 15, 10 ** 15) for _ in range(n)],
+        'reales': [rng.choice([-1.5, 0.0, 2.25, rng.uniform(-10, 10)]) for _ in range(n)],
+        'pocos': [rng.randrange(3) for _ in range(n)],
+    }
+
+
+@pytest.mark.parametrize("claves, reversos", [
+    (['negativos'], [False]),
+    (['negativos', 'pocos'], [False, False]),
+    (['negativos', 'grandes'], [True, False]),
+    (['pocos', 'negativos'], [False, True]),
+    (['pocos', 'negativos', 'grandes'], [True, True, True]),
+    (['reales'], [True]),
+    (['reales', 'negativos'], [False, True]),
+    (['pocos', 'reales'], [True, False]),
+])
+@pytest.mark.parametrize("semilla", [1, 2])
+def test_argsort_multiple_contra_sorted(claves, reversos, semilla):
+    columnas = _columnas(semilla)
+    seleccion = [columnas[c] for c in claves]
+    assert argsort_multiple(seleccion, reversos) == _referencia(seleccion, reversos)
+
+
+def test_argsort_multiple_reverse_global_y_motor():
+    columnas = _columnas(3)
+    seleccion = [columnas['pocos'], columnas['negativos']]
+    esperado = _referencia(seleccion, [True, True])
+    assert argsort_multiple(seleccion, reverse=True) == esperado
+    assert argsort_multiple(seleccion, reverse=True, motor=quicksort) == esperado
+
+
+def test_argsort_multiple_casos_triviales():
+    assert argsort_multiple([]) == []
+    assert argsort_multiple([[7]]) == [0]
+    assert argsort_multiple([array('q', [3, -1, 3, 0])], [True]) == [0, 2, 3, 1]
+
+
+@pytest.mark.parametrize("reverso", [False, True, [True, False], [False, True]])
+def test_ordenar_columnas_igual_que_tuplas(reverso):
+    columnas = _columnas(4)
+    campos = list(columnas)
+    registros = list(zip(*columnas.values()))
+    claves = ['pocos', 'reales']
+
+    ordenadas = ordenar_columnas(a_columnas(registros, campos), claves, reverso)
+    esperado = ordenar_registros(registros, campos, claves, reverso)
+    assert list(zip(*ordenadas.values())) == esperado
+    # Cada columna conserva su tipo
+    assert isinstance(ordenadas['negativos'], array)
+    assert ordenadas['negativos'].typecode == 'q'
+
+
+@pytest.mark.parametrize("reverso", [False, True, [True, False], [False, True]])
+def test_ordenar_columnas_numpy_igual_que_listas(reverso):
+    np = pytest.importorskip('numpy')
+    columnas = _columnas(5)
+    claves = ['negativos', 'reales']
+    vectores = {campo: np.asarray(columna) for campo, columna in columnas.items()}
+    vectores['sin_signo'] = np.arange(300, dtype=np.uint32) % 7
+    listas = dict(columnas, sin_signo=[i % 7 for i in range(300)])
+
+    for seleccion in (['negativos'], claves, ['sin_signo', 'negativos']):
+        esperado = ordenar_columnas(listas, seleccion, reverso)
+        obtenido = ordenar_columnas(vectores, seleccion, reverso)
+        for campo in listas:
+            assert obtenido[campo].tolist() == esperado[campo]
@@ -0,0 +1,82 @@
+"""
+Pruebas de la prueba U de Mann-Whitney y de la comparación contra una línea base
+"""
+
+import pytest
+
+import regresion
+from regresion import mann_whitney_u, delta_cliff, comparar_resultados, hay_regresiones
+
+
+# Ejemplo de la documentación de scipy.stats.mannwhitneyu
+HOMBRES = [19, 22, 16, 29, 24]
+MUJERES = [20, 11, 17, 12]
+
+
+def test_valor_p_exacto_conocido():
+    u, valor_p = mann_whitney_u(MUJERES, HOMBRES)
+    assert u == 17
+    assert valor_p == pytest.approx(0.1111111111111111)
+
+
+def test_valor_p_exacto_separacion_completa():
+    # Los 5 nuevos superan a los 5 base: 2 de C(10, 5) = 252 ordenamientos
+    u, valor_p = mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+    assert u == 25
+    assert valor_p == pytest.approx(2 / 252)
+
+
+def test_valor_p_asintotico_conocido(monkeypatch):
+    monkeypatch.setattr(regresion, 'MAX_MUESTRAS_EXACTA', 0)
+    u, valor_p = mann_whitney_u(MUJERES, HOMBRES)
+    assert u == 17
+    assert valor_p == pytest.approx(0.11134688653314041)
+
+
+def test_valor_p_con_empates():
+    # Rangos promedio 1, 3, 3, 5.5 para 'nuevo'; corrección por empates de 36
+    u, valor_p = mann_whitney_u([2, 3, 4, 4], [1, 2, 2, 3])
+    assert u == 2.5
+    assert valor_p == pytest.approx(0.13416918012812581)
+
+
+def test_muestras_identicas():
+    u, valor_p = mann_whitney_u([1.0] * 6, [1.0] * 6)
+    assert u == 18
+    assert valor_p == 1.0
+
+
+def test_delta_cliff():
+    assert delta_cliff([1, 2, 3], [4, 5, 6]) == 1
+    assert delta_cliff([4, 5, 6], [1, 2, 3]) == -1
+    assert delta_cliff([1, 2], [1, 2]) == 0
+
+
+def _resultado(tiempos):
+    return {'algoritmo': 'QuickSort', 'escenario': 'aleatoria', 'tamano': 1000,
+            'tiempos_individuales': tiempos}
+
+
+def test_comparar_resultados_detecta_regresion_y_mejora():
+    base = [_resultado([1.00, 1.01, 0.99, 1.02, 0.98, 1.00, 1.01, 0.99])]
+    lento = [_resultado([1.50, 1.52, 1.49, 1.51, 1.48, 1.50, 1.53, 1.47])]
+    rapido = [_resultado([0.50, 0.52, 0.49, 0.51, 0.48, 0.50, 0.53, 0.47])]
+
+    comparaciones = comparar_resultados(base, lento)
+    assert comparaciones[0]['veredicto'] == 'regresion'
+    assert hay_regresiones(comparaciones)
+
+    mejora = comparar_resultados(base, rapido)
+    assert mejora[0]['veredicto'] == 'mejora'
+    assert not hay_regresiones(mejora)
+
+
+def test_comparar_resultados_cambio_bajo_umbral_no_es_regresion():
+    base = [_resultado([1.00, 1.01, 0.99, 1.02, 0.98, 1.00, 1.01, 0.99])]
+    nuevo = [_resultado([1.05, 1.06, 1.04, 1.07, 1.03, 1.05, 1.06, 1.04])]
+    assert comparar_resultados(base, nuevo)[0]['veredicto'] == 'sin_cambio'
+
+
+def test_comparar_resultados_sin_tiempos():
+    comparaciones = comparar_resultados([_resultado([1.0])], [_resultado([2.0])])
+    assert comparaciones[0]['veredicto'] == 'sin_datos'
@@ -0,0 +1,69 @@
+"""
+Pruebas de la selección con introselect: nth_element, partial_sort, top_k y mediana
+"""
+
+import statistics
+
+import pytest
+
+import sorting_algorithms
+from data_generator import GENERADORES, generar_conjunto
+from sorting_algorithms import nth_element, nth_element_inplace, partial_sort, top_k, mediana
+
+
+ESCENARIOS = [e for e in GENERADORES if e != 'flotantes_especiales']
+
+
+@pytest.mark.parametrize('escenario', ESCENARIOS)
+def test_nth_element_todas_las_posiciones(escenario):
+    datos = generar_conjunto(escenario, 60, semilla=9)
+    ordenados = sorted(datos)
+    for k in range(len(datos)):
+        assert nth_element(datos, k) == ordenados[k]
+    assert nth_element(datos, -1) == ordenados[-1]
+
+
+@pytest.mark.parametrize('escenario', ['aleatoria', 'asesino_quicksort', 'pocos_unicos', 'organo'])
+def test_nth_element_inplace_particiona(escenario):
+    datos = generar_conjunto(escenario, 1000, semilla=9)
+    k = 321
+    arr = list(datos)
+    nth_element_inplace(arr, k)
+    assert arr[k] == sorted(datos)[k]
+    assert max(arr[:k]) <= arr[k] <= min(arr[k + 1:])
+    assert sorted(arr) == sorted(datos)
+
+
+def test_mediana_de_medianas_desde_el_inicio():
+    # Profundidad 0: todas las particiones usan el pivote BFPRT
+    datos = generar_conjunto('asesino_quicksort', 2000, semilla=9)
+    ordenados = sorted(datos)
+    for k in (0, 1, 999, 1998, 1999):
+        arr = list(datos)
+        sorting_algorithms._seleccionar(arr, 0, len(arr), k, 0)
+        assert arr[k] == ordenados[k]
+
+
+@pytest.mark.parametrize('tamano', [0, 1, 2])
+def test_nth_element_fuera_de_rango(tamano):
+    with pytest.raises(IndexError):
+        nth_element(list(range(tamano)), tamano)
+
+
+@pytest.mark.parametrize('k', [0, 1, 5, 100, 600, 999, 1000, 2000])
+def test_partial_sort_y_top_k(k):
+    # k pequeño usa el montículo; k grande, introselect más IntroSort
+    datos = generar_conjunto('pocos_unicos', 1000, semilla=9)
+    assert partial_sort(datos, k) == sorted(datos)[:k]
+    assert top_k(datos, k) == sorted(datos, reverse=True)[:k]
+
+
+@pytest.mark.parametrize('tamano', [1, 2, 3, 10, 11, 501])
+def test_mediana_igual_a_statistics(tamano):
+    datos = generar_conjunto('aleatoria', tamano, semilla=9)
+    assert mediana(datos) == statistics.median(datos)
+
+
+def test_mediana_lista_vacia():
+    with pytest.raises(ValueError):
+        mediana([])
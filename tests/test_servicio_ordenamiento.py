@@ -0,0 +1,148 @@
+"""
+Pruebas del servicio de ordenamiento: protocolo, errores y agrupación en lotes
+"""
+
+import asyncio
+import random
+from array import array
+
+import pytest
+
+from servicio_ordenamiento import (
+    ServicioOrdenamiento, ClienteOrdenamiento, iniciar_servidor, generar_reporte_carga,
+    percentil, CABECERA_SOLICITUD, CABECERA_RESPUESTA, ESTADO_OK, ESTADO_ERROR, MOTORES,
+)
+
+
+def _con_servicio(tmp_path, prueba, **opciones):
+    """Levanta un servicio en un socket Unix temporal y ejecuta prueba(servicio, ruta)"""
+    async def ejecutar():
+        ruta = str(tmp_path / 'ordenar.sock')
+        servicio = ServicioOrdenamiento(**opciones)
+        await servicio.calentar()
+        servidor = await iniciar_servidor(servicio, ruta)
+        try:
+            return await prueba(servicio, ruta)
+        finally:
+            servidor.close()
+            await asyncio.wait_for(asyncio.gather(*servicio.conexiones), timeout=5)
+            await servidor.wait_closed()
+            servicio.cerrar()
+    return asyncio.run(ejecutar())
+
+
+async def _leer_respuesta(reader):
+    cabecera = await reader.readexactly(CABECERA_RESPUESTA.size)
+    id_solicitud, longitud, estado = CABECERA_RESPUESTA.unpack(cabecera)
+    return id_solicitud, estado, await reader.readexactly(longitud)
+
+
+def test_protocolo_binario_varias_solicitudes_por_conexion(tmp_path):
+    rng = random.Random(1)
+    enteros = [rng.randint(-10 ** 12, 10 ** 12) for _ in range(300)]
+    reales = [rng.uniform(-1, 1) for _ in range(200)]
+
+    async def prueba(servicio, ruta):
+        reader, writer = await asyncio.open_unix_connection(ruta)
+        writer.write(CABECERA_SOLICITUD.pack(7, len(enteros), MOTORES.index('introsort'), b'q')
+                     + array('q', enteros).tobytes())
+        writer.write(CABECERA_SOLICITUD.pack(8, len(reales), MOTORES.index('quicksort'), b'd')
+                     + array('d', reales).tobytes())
+        writer.write(CABECERA_SOLICITUD.pack(9, 0, MOTORES.index('radix_sort'), b'q'))
+        await writer.drain()
+        respuestas = {}
+        for _ in range(3):
+            id_solicitud, estado, contenido = await _leer_respuesta(reader)
+            respuestas[id_solicitud] = (estado, contenido)
+        writer.close()
+        return respuestas
+
+    respuestas = _con_servicio(tmp_path, prueba, procesos=2)
+    # Las respuestas pueden llegar en otro orden; se asocian por id
+    assert respuestas[7] == (ESTADO_OK, array('q', sorted(enteros)).tobytes())
+    assert respuestas[8] == (ESTADO_OK, array('d', sorted(reales)).tobytes())
+    assert respuestas[9] == (ESTADO_OK, b'')
+
+
+def test_cabecera_invalida_responde_error_y_cierra(tmp_path):
+    async def prueba(servicio, ruta):
+        reader, writer = await asyncio.open_unix_connection(ruta)
+        writer.write(CABECERA_SOLICITUD.pack(3, 10, len(MOTORES), b'q'))
+        await writer.drain()
+        respuesta = await _leer_respuesta(reader)
+        # El servidor no lee más del flujo y cierra la conexión
+        resto = await reader.read()
+        writer.close()
+        return respuesta, resto
+
+    (id_solicitud, estado, mensaje), resto = _con_servicio(tmp_path, prueba, procesos=1)
+    assert (id_solicitud, estado) == (3, ESTADO_ERROR)
+    assert 'Solicitud inválida' in mensaje.decode('utf-8')
+    assert resto == b''
+
+
+def test_error_del_motor_no_afecta_a_las_demas(tmp_path):
+    async def prueba(servicio, ruta):
+        cliente = await ClienteOrdenamiento.conectar(ruta_unix=ruta)
+        try:
+            fallida = cliente.ordenar([0.5, -1.5], motor='counting_sort', tipo='d')
+            correcta = cliente.ordenar([3, 1, 2], motor='merge_sort_natural')
+            return await asyncio.gather(fallida, correcta, return_exceptions=True)
+        finally:
+            await cliente.cerrar()
+
+    fallida, correcta = _con_servicio(tmp_path, prueba, procesos=1)
+    assert isinstance(fallida, ValueError)
+    assert correcta.tolist() == [1, 2, 3]
+
+
+def test_solicitudes_concurrentes_se_agrupan_en_lotes(tmp_path):
+    rng = random.Random(2)
+    conjuntos = [[rng.randint(0, 1000) for _ in range(50)] for _ in range(40)]
+
+    async def prueba(servicio, ruta):
+        cliente = await ClienteOrdenamiento.conectar(ruta_unix=ruta)
+        try:
+            resultados = await asyncio.gather(*(cliente.ordenar(datos) for datos in conjuntos))
+        finally:
+            await cliente.cerrar()
+        return resultados, dict(servicio.estadisticas)
+
+    resultados, estadisticas = _con_servicio(tmp_path, prueba, procesos=1)
+    assert [r.tolist() for r in resultados] == [sorted(datos) for datos in conjuntos]
+    assert estadisticas['solicitudes'] == len(conjuntos)
+    # Con el único proceso ocupado, las solicitudes siguientes esperan juntas
+    assert estadisticas['lotes'] < len(conjuntos)
+
+
+def test_solicitud_grande_sale_sola(tmp_path):
+    async def prueba(servicio, ruta):
+        cliente = await ClienteOrdenamiento.conectar(ruta_unix=ruta)
+        try:
+            resultado = await cliente.ordenar(list(range(20, 0, -1)))
+        finally:
+            await cliente.cerrar()
+        return resultado, servicio.estadisticas['lotes']
+
+    resultado, lotes = _con_servicio(tmp_path, prueba, procesos=1, max_elementos_lote=10)
+    assert resultado.tolist() == list(range(1, 21))
+    assert lotes == 1
+
+
+def test_reporte_carga_sin_latencias():
+    mediciones = [
+        {'concurrencia': 1, 'solicitudes_por_segundo': 100.0, 'elementos_por_segundo': 1e5,
+         'p50_ms': 1.0, 'p95_ms': 2.0, 'p99_ms': 3.0, 'errores': 0},
+        {'concurrencia': 8, 'solicitudes_por_segundo': 0.0, 'elementos_por_segundo': 0.0,
+         'p50_ms': None, 'p95_ms': None, 'p99_ms': None, 'errores': 500},
+    ]
+    filas = generar_reporte_carga(mediciones, 1000, 'introsort').strip().splitlines()
+    assert filas[-2].split()[3:6] == ['1.000', '2.000', '3.000']
+    assert filas[-1].split()[3:] == ['-', '-', '-', '500']
+
+
+@pytest.mark.parametrize("p, esperado", [(0, 0), (50, 50), (99, 99), (100, 100)])
+def test_percentil_rango_mas_cercano(p, esperado):
+    latencias = list(range(101))
+    random.Random(3).shuffle(latencias)
+    assert percentil(latencias, p) == esperado
@@ -0,0 +1,150 @@
+"""
+Pruebas de los motores de ordenamiento: cada uno debe dar lo mismo que sorted()
+sobre los escenarios del generador, con duplicados y con entradas vacías o de
+un elemento
+"""
+
+import random
+from array import array
+
+import pytest
+
+from data_generator import GENERADORES, ESCENARIOS_NO_ENTEROS, generar_conjunto
+from sorting_algorithms import (
+    bubble_sort, bubble_sort_inplace, quicksort, quicksort_inplace,
+    introsort, introsort_inplace, counting_sort, radix_sort,
+    sample_sort_paralelo, sample_sort_paralelo_inplace,
+    odd_even_sort, odd_even_sort_inplace, odd_even_sort_numpy, odd_even_sort_lote,
+)
+
+
+# Con NaN el orden no está definido: ese escenario no se compara con sorted()
+ESCENARIOS = [e for e in GENERADORES if e != 'flotantes_especiales']
+
+TAMANOS = [0, 1, 2, 17, 300]
+
+MOTORES = [bubble_sort, odd_even_sort, quicksort, introsort]
+
+MOTORES_IN_PLACE = [bubble_sort_inplace, odd_even_sort_inplace, quicksort_inplace,
+                    introsort_inplace]
+
+# Motores que sólo ordenan enteros
+MOTORES_ENTEROS = [counting_sort, radix_sort]
+
+
+@pytest.mark.parametrize('tamano', TAMANOS)
+@pytest.mark.parametrize('escenario', ESCENARIOS)
+@pytest.mark.parametrize('motor', MOTORES, ids=lambda m: m.__name__)
+def test_motor_igual_a_sorted(motor, escenario, tamano):
+    datos = generar_conjunto(escenario, tamano, semilla=7)
+    original = list(datos)
+    assert motor(datos) == sorted(original)
+    # Las versiones que devuelven lista no modifican la entrada
+    assert datos == original
+
+
+@pytest.mark.parametrize('motor', MOTORES, ids=lambda m: m.__name__)
+def test_motor_con_duplicados(motor):
+    datos = [3, 1, 3, 3, 0, 1, 2, 2, 3, 0] * 20
+    assert motor(datos) == sorted(datos)
+
+
+@pytest.mark.parametrize('tamano', TAMANOS)
+@pytest.mark.parametrize('escenario', ['aleatoria', 'invertida', 'asesino_quicksort',
+                                       'pocos_unicos'])
+@pytest.mark.parametrize('motor', MOTORES_IN_PLACE, ids=lambda m: m.__name__)
+def test_motor_in_place_sobre_buffer(motor, escenario, tamano):
+    datos = generar_conjunto(escenario, tamano, semilla=7)
+    buffer = array('q', datos)
+    assert motor(buffer) is buffer
+    assert buffer.tolist() == sorted(datos)
+
+
+@pytest.mark.parametrize('motor', MOTORES_IN_PLACE, ids=lambda m: m.__name__)
+def test_motor_in_place_sobre_memoryview(motor):
+    datos = generar_conjunto('aleatoria', 200, semilla=3)
+    vista = memoryview(array('q', datos))
+    motor(vista)
+    assert vista.tolist() == sorted(datos)
+
+
+@pytest.mark.parametrize('motor', MOTORES_IN_PLACE, ids=lambda m: m.__name__)
+def test_motor_in_place_rechaza_solo_lectura(motor):
+    with pytest.raises(TypeError):
+        motor(memoryview(bytes(16)).cast('q'))
+
+
+def test_introsort_con_clave_y_reverso():
+    datos = [(x % 7, x) for x in range(50)]
+    assert introsort(datos, key=lambda t: t[0]) == sorted(datos, key=lambda t: t[0])
+    assert introsort(datos, key=lambda t: t[0], reverse=True) == sorted(
+        datos, key=lambda t: t[0], reverse=True)
+
+
+@pytest.mark.parametrize('tamano', TAMANOS)
+@pytest.mark.parametrize('escenario', [e for e in ESCENARIOS if e not in ESCENARIOS_NO_ENTEROS])
+@pytest.mark.parametrize('motor', MOTORES_ENTEROS, ids=lambda m: m.__name__)
+def test_motor_enteros_igual_a_sorted(motor, escenario, tamano):
+    datos = generar_conjunto(escenario, tamano, semilla=7)
+    assert motor(datos) == sorted(datos)
+
+
+@pytest.mark.parametrize('datos', [[-5, 3, -5, 0, 12, -9, 7, 7], [4, 4, 4, 4]],
+                         ids=['negativos', 'iguales'])
+@pytest.mark.parametrize('motor', MOTORES_ENTEROS, ids=lambda m: m.__name__)
+def test_motor_enteros_negativos_e_iguales(motor, datos):
+    assert motor(datos) == sorted(datos)
+
+
+def test_radix_sort_claves_anchas():
+    # Más de 8 bytes entre mínimo y máximo: varias pasadas por byte
+    datos = [2**64 + 1, 3, 2**63, 0, -2**40, 2**63]
+    assert radix_sort(datos) == sorted(datos)
+
+
+@pytest.mark.parametrize('tamano', [0, 1, 2, 300, 3000])
+@pytest.mark.parametrize('escenario', ['aleatoria', 'invertida', 'pocos_unicos', 'organo'])
+def test_sample_sort_paralelo_igual_a_sorted(escenario, tamano):
+    # umbral=0 fuerza el camino paralelo aun con pocos elementos
+    datos = generar_conjunto(escenario, tamano, semilla=7)
+    assert sample_sort_paralelo(datos, procesos=2, umbral=0) == sorted(datos)
+
+
+def test_sample_sort_paralelo_flotantes_en_buffer():
+    rng = random.Random(4)
+    datos = [rng.gauss(0.0, 1.0) for _ in range(2000)]
+    buffer = array('d', datos)
+    assert sample_sort_paralelo_inplace(buffer, procesos=3, umbral=0) is buffer
+    assert buffer.tolist() == sorted(datos)
+
+
+@pytest.mark.parametrize('tamano', TAMANOS)
+@pytest.mark.parametrize('escenario', ['aleatoria', 'invertida', 'pocos_unicos', 'organo'])
+def test_odd_even_sort_numpy_igual_a_sorted(escenario, tamano):
+    np = pytest.importorskip('numpy')
+    datos = generar_conjunto(escenario, tamano, semilla=7)
+    arreglo = np.array(datos, dtype=np.int64)
+    assert odd_even_sort_numpy(arreglo).tolist() == sorted(datos)
+
+
+def test_odd_even_sort_numpy_sobre_buffer():
+    pytest.importorskip('numpy')
+    datos = generar_conjunto('aleatoria', 100, semilla=7)
+    buffer = array('q', datos)
+    odd_even_sort_numpy(buffer)
+    assert buffer.tolist() == sorted(datos)
+
+
+def test_odd_even_sort_numpy_con_nan_no_pierde_valores():
+    np = pytest.importorskip('numpy')
+    datos = [3.0, float('nan'), 1.0, 2.0, float('inf'), -1.0]
+    resultado = odd_even_sort_numpy(np.array(datos)).tolist()
+    assert sorted(x for x in resultado if x == x) == sorted(x for x in datos if x == x)
+    assert sum(1 for x in resultado if x != x) == 1
+
+
+def test_odd_even_sort_lote_ordena_cada_fila():
+    pytest.importorskip('numpy')
+    rng = random.Random(5)
+    ventanas = [[rng.randrange(100) for _ in range(16)] for _ in range(40)]
+    assert odd_even_sort_lote(ventanas).tolist() == [sorted(v) for v in ventanas]
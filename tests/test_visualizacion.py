@@ -0,0 +1,119 @@
+"""
+Pruebas de la organización de los datos de las gráficas y del redibujo incremental
+"""
+
+import os
+
+import pytest
+
+import visualizacion
+from visualizacion import pivotar, graficas_disponibles, renderizar_reporte, ARCHIVO_MANIFIESTO
+
+
+def _resultado(algoritmo, escenario, tamano, promedio_ms):
+    return {'algoritmo': algoritmo, 'escenario': escenario, 'tamano': tamano,
+            'promedio_ms': promedio_ms}
+
+
+RESULTADOS = [
+    _resultado('QuickSort', 'aleatoria', 1000, 1.0),
+    _resultado('Bubble Sort', 'aleatoria', 1000, 50.0),
+    _resultado('QuickSort', 'invertida', 100, 0.1),
+    _resultado('QuickSort', 'aleatoria', 100, 0.1),
+    {'algoritmo': 'Radix Sort', 'escenario': 'cadenas_prefijo', 'tamano': 100,
+     'error': 'no soportado'},
+]
+
+
+class _Figura:
+    def savefig(self, ruta, **opciones):
+        with open(ruta, 'wb') as f:
+            f.write(b'png')
+
+
+class _Pyplot:
+    @staticmethod
+    def close(figura):
+        pass
+
+
+@pytest.fixture
+def dibujos(monkeypatch):
+    """Sustituye matplotlib y cuenta qué gráficas se dibujan"""
+    dibujadas = []
+    monkeypatch.setattr(visualizacion, '_pyplot', lambda: _Pyplot)
+    for nombre in ('_dibujar_barras', '_dibujar_escalabilidad', '_dibujar_factor',
+                   '_dibujar_resumen'):
+        monkeypatch.setattr(visualizacion, nombre,
+                            lambda plt, datos, colores, nombre=nombre:
+                            dibujadas.append(nombre) or _Figura())
+    return dibujadas
+
+
+def _regeneradas(generadas):
+    return sorted(os.path.basename(ruta) for ruta, regenerada in generadas if regenerada)
+
+
+def test_pivotar():
+    pivote = pivotar(RESULTADOS)
+    assert pivote['algoritmos'] == ['QuickSort', 'Bubble Sort']
+    assert pivote['escenarios'] == ['aleatoria', 'invertida']
+    assert pivote['tamanos'] == [100, 1000]
+    assert pivote['tabla']['aleatoria']['QuickSort'] == {1000: 1.0, 100: 0.1}
+    assert pivote['tabla']['invertida'] == {'QuickSort': {100: 0.1}}
+
+
+def test_grafica_de_factor_solo_con_varios_algoritmos():
+    archivos = [archivo for archivo, _, _ in graficas_disponibles(pivotar(RESULTADOS))]
+    assert archivos == ['grafica_aleatoria.png', 'grafica_invertida.png',
+                        'grafica_escalabilidad.png', 'grafica_factor.png',
+                        'grafica_comparativa.png']
+    solo_quicksort = [r for r in RESULTADOS if r['algoritmo'] == 'QuickSort']
+    assert 'grafica_factor.png' not in [
+        archivo for archivo, _, _ in graficas_disponibles(pivotar(solo_quicksort))]
+
+
+def test_sin_resultados_validos_no_dibuja(tmp_path, dibujos):
+    assert renderizar_reporte(RESULTADOS[-1:], str(tmp_path)) == []
+    assert dibujos == []
+
+
+def test_omite_las_graficas_sin_cambios(tmp_path, dibujos):
+    directorio = str(tmp_path)
+    primera = renderizar_reporte(RESULTADOS, directorio)
+    assert len(_regeneradas(primera)) == 5
+    assert os.path.exists(os.path.join(directorio, ARCHIVO_MANIFIESTO))
+
+    # Mismos datos: no se dibuja nada
+    dibujos.clear()
+    assert _regeneradas(renderizar_reporte(RESULTADOS, directorio)) == []
+    assert dibujos == []
+
+    # Cambia un tiempo de 'invertida': su gráfica y las que muestran toda la tabla
+    cambiados = list(RESULTADOS)
+    cambiados[2] = _resultado('QuickSort', 'invertida', 100, 0.2)
+    assert _regeneradas(renderizar_reporte(cambiados, directorio)) == [
+        'grafica_comparativa.png', 'grafica_escalabilidad.png', 'grafica_factor.png',
+        'grafica_invertida.png']
+
+    # Una imagen borrada se redibuja aunque su huella coincida
+    os.remove(os.path.join(directorio, 'grafica_aleatoria.png'))
+    assert _regeneradas(renderizar_reporte(cambiados, directorio)) == ['grafica_aleatoria.png']
+
+    # Otro dpi cambia todas las huellas; forzar redibuja todo
+    assert len(_regeneradas(renderizar_reporte(cambiados, directorio, dpi=72))) == 5
+    assert len(_regeneradas(renderizar_reporte(cambiados, directorio, dpi=72,
+                                               forzar=True))) == 5
+
+
+def test_manifiesto_danado_redibuja_todo(tmp_path, dibujos):
+    directorio = str(tmp_path)
+    renderizar_reporte(RESULTADOS, directorio)
+    (tmp_path / ARCHIVO_MANIFIESTO).write_text('{roto')
+    assert len(_regeneradas(renderizar_reporte(RESULTADOS, directorio))) == 5
+
+
+def test_dibuja_con_matplotlib(tmp_path):
+    pytest.importorskip('matplotlib')
+    generadas = renderizar_reporte(RESULTADOS, str(tmp_path), dpi=30)
+    assert all(regenerada and os.path.getsize(ruta) > 0 for ruta, regenerada in generadas)